@@ -1,10 +1,21 @@
 import logging 
+import secrets
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator
 
+from apscheduler.events import EVENT_SCHEDULER_SHUTDOWN
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from redis.exceptions import RedisError
 
+from app.F5_core.redis import client_redis
 from app.F8_database.connection import AsyncSessionLocal
 from app.F3_repositories.refresh_token import RefreshTokenRepository
+from app.F3_repositories.feed_stats import FeedStatsRepository
+from app.F2_services.leaderboard import refresh_leaderboards, LEADERBOARD_REFRESH_INTERVAL_SECONDS
+from app.F2_services.view_counter import flush_view_counts, VIEW_FLUSH_INTERVAL_SECONDS
 from app.F13_recommendations.dependencies import EngineManager
+from app.F13_recommendations.fitting import shutdown_fit_executor
 from app.F14_knowledge_graph.pipeline import run_pipeline
 
 logger = logging.getLogger(__name__)
@@ -12,6 +23,47 @@ logger = logging.getLogger(__name__)
 # 스케줄러 인스턴스를 전역으로 생성
 scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
 
+# 워커(프로세스)마다 같은 스케줄러가 뜨므로, DB 전체를 훑는 작업은 잠금을 얻은 한 워커에서만 실행함
+JOB_LOCK_PREFIX = "scheduler_lock"
+# feed_stats 재계산/백필 잠금 유지 시간 (실행 도중 프로세스가 죽어도 이 시간 뒤에는 다른 워커가 실행할 수 있음)
+FEED_STATS_LOCK_TTL_SECONDS = 30 * 60
+
+# 잠금 값이 자신의 토큰일 때만 삭제 (TTL이 지나 다른 워커가 잡은 잠금을 지우지 않도록)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+@asynccontextmanager
+async def job_lock(job_name: str, ttl_seconds: int) -> AsyncIterator[bool]:
+    """
+    스케줄러 작업을 한 워커에서만 실행하기 위한 Redis 잠금
+    잠금을 얻으면 True, 다른 워커가 실행 중이거나 Redis에 접근할 수 없으면 False를 넘겨줌
+
+    사용 예:
+        async with job_lock("reconcile_feed_stats", FEED_STATS_LOCK_TTL_SECONDS) as acquired:
+            if not acquired:
+                return
+            ...
+    """
+    key = f"{JOB_LOCK_PREFIX}:{job_name}"
+    token = secrets.token_hex(16)
+    try:
+        acquired = bool(await client_redis.set(key, token, nx=True, ex=ttl_seconds))
+    except RedisError as e:
+        logger.warning(f"[Scheduler] Failed to acquire lock '{key}', skipping this run: {e}")
+        acquired = False
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                await client_redis.eval(_RELEASE_LOCK_SCRIPT, 1, key, token)
+            except RedisError as e:
+                logger.warning(f"[Scheduler] Failed to release lock '{key}': {e}")
+
 # ----- refresh_token 관련 -----
 async def cleanup_tokens_task():
     """
@@ -29,12 +81,84 @@ async def cleanup_tokens_task():
     except Exception as e:
         logger.error(f"Error in scheduled task 'delete_expired_tokens_task': {e}", exc_info=True)
 
+# ----- feed_stats 관련 -----
+async def reconcile_feed_stats_task():
+    """
+    feed_stats 집계 값을 원본 테이블(ratings, bookmarks, feeds)과 비교하여 어긋난 행을 바로잡는 스케줄링 작업
+    (feed_stats가 비어 있으면 전체 피드의 통계를 채우는 백필로 동작)
+    """
+    logger.info("Scheduler task 'reconcile_feed_stats_task' started.")
+    try:
+        async with job_lock("feed_stats", FEED_STATS_LOCK_TTL_SECONDS) as acquired:
+            if not acquired:
+                logger.info("[Scheduler] feed_stats is being reconciled by another worker. Skipping.")
+                return
+            async with AsyncSessionLocal() as db:
+                corrected = await FeedStatsRepository(db).reconcile_all()
+            if corrected > 0:
+                logger.info(f"[Scheduler] Reconciled {corrected} feed_stats rows.")
+            else:
+                logger.info("[Scheduler] feed_stats is consistent with source tables.")
+    except Exception as e:
+        logger.error(f"Error in scheduled task 'reconcile_feed_stats_task': {e}", exc_info=True)
+
+async def backfill_feed_stats_task():
+    """
+    서버 시작 시 feed_stats 행이 없는 피드(최초 배포, 통계 행 누락)만 채우는 작업
+    (전체 재계산은 하지 않으므로 여러 워커가 동시에 재시작해도 DB 전체를 훑지 않음)
+    """
+    try:
+        async with job_lock("feed_stats", FEED_STATS_LOCK_TTL_SECONDS) as acquired:
+            if not acquired:
+                logger.info("[Scheduler] feed_stats is being backfilled by another worker. Skipping.")
+                return
+            async with AsyncSessionLocal() as db:
+                created = await FeedStatsRepository(db).backfill_missing()
+            if created > 0:
+                logger.info(f"[Scheduler] Backfilled {created} missing feed_stats rows.")
+    except Exception as e:
+        logger.error(f"Error in scheduled task 'backfill_feed_stats_task': {e}", exc_info=True)
+
+# ----- TOP5 순위 관련 -----
+async def refresh_leaderboards_task():
+    """메인 페이지 TOP5 순위(조회수/별점/북마크)를 다시 계산하여 Redis에 저장하는 스케줄링 작업"""
+    try:
+        await refresh_leaderboards()
+    except Exception as e:
+        logger.error(f"Error in scheduled task 'refresh_leaderboards_task': {e}", exc_info=True)
+
+# ----- 조회수 버퍼 관련 -----
+async def flush_view_counts_task():
+    """Redis에 쌓인 피드 조회수를 DB에 일괄 반영하는 스케줄링 작업"""
+    try:
+        await flush_view_counts()
+    except Exception as e:
+        logger.error(f"Error in scheduled task 'flush_view_counts_task': {e}", exc_info=True)
+
 async def refit_recommendation_engine_task():
     """주기적으로 추천 엔진을 최신 데이터로 재학습시키는 스케줄링 작업"""
     logger.info("Scheduler task 'refit_recommendation_engine_task' started.")
     await EngineManager.refit()
     logger.info("Scheduler task 'refit_recommendation_engine_task' finished.")
 
+async def update_recommendation_engine_task():
+    """신규 피드를 추천 엔진에 증분 반영하는 스케줄링 작업"""
+    logger.info("Scheduler task 'update_recommendation_engine_task' started.")
+    await EngineManager.update_incremental()
+    logger.info("Scheduler task 'update_recommendation_engine_task' finished.")
+
+async def reload_recommendation_model_task():
+    """다른 워커가 저장한 새 추천 모델 artifact가 있으면 불러오는 스케줄링 작업"""
+    await EngineManager.reload_if_changed()
+
+def shutdown_background_workers(event=None):
+    """
+    스케줄러 종료(애플리케이션 lifespan 종료 단계의 scheduler.shutdown()) 시 함께 정리할 자원을 종료함
+    - 추천 모델 학습 프로세스 풀
+    """
+    shutdown_fit_executor()
+    logger.info("Recommendation fitting process pool has been shut down.")
+
 def setup_scheduler():
     """
     스케줄러에 작업을 추가하고 시작 준비
@@ -50,6 +174,48 @@ def setup_scheduler():
     )
     logger.info("Scheduler job 'delete_expired_tokens_task' has been added.")
 
+    # 매일 새벽 2시 30분에 feed_stats 재계산 작업을 실행
+    scheduler.add_job(
+        reconcile_feed_stats_task,
+        'cron',
+        hour=2,
+        minute=30,
+        id="reconcile_feed_stats_job",
+        name="Reconcile denormalized feed_stats with ratings/bookmarks/views daily at 2:30 AM"
+    )
+    logger.info("Scheduler job 'reconcile_feed_stats_job' has been added.")
+
+    # 배포 직후 비어 있는 feed_stats를 채우도록 시작 시 한 번, 통계 행이 없는 피드만 백필
+    scheduler.add_job(
+        backfill_feed_stats_task,
+        'date',
+        run_date=datetime.now(scheduler.timezone),
+        id="backfill_feed_stats_job",
+        name="Backfill feed_stats rows missing for any feed once at startup"
+    )
+    logger.info("Scheduler job 'backfill_feed_stats_job' has been added.")
+
+    # 짧은 주기로 TOP5 순위를 다시 계산 (시작 시 바로 한 번 실행하여 캐시를 채움)
+    scheduler.add_job(
+        refresh_leaderboards_task,
+        'interval',
+        seconds=LEADERBOARD_REFRESH_INTERVAL_SECONDS,
+        next_run_time=datetime.now(scheduler.timezone),
+        id="refresh_leaderboards_job",
+        name="Refresh the main page TOP5 leaderboards in Redis every minute"
+    )
+    logger.info("Scheduler job 'refresh_leaderboards_job' has been added.")
+
+    # 짧은 주기로 Redis 조회수 버퍼를 DB에 반영 (여러 워커 중 잠금을 얻은 한 곳에서만 실행됨)
+    scheduler.add_job(
+        flush_view_counts_task,
+        'interval',
+        seconds=VIEW_FLUSH_INTERVAL_SECONDS,
+        id="flush_view_counts_job",
+        name="Flush buffered feed view counts from Redis to the database every 30 seconds"
+    )
+    logger.info("Scheduler job 'flush_view_counts_job' has been added.")
+
     # 매일 새벽 3시에 추천 엔진 재학습 작업을 실행
     scheduler.add_job(
         refit_recommendation_engine_task,
@@ -61,6 +227,26 @@ def setup_scheduler():
     )
     logger.info("Scheduler job 'refit_recommendation_engine_job' has been added.")
 
+    # 10분마다 신규 피드를 추천 엔진에 증분 반영
+    scheduler.add_job(
+        update_recommendation_engine_task,
+        'interval',
+        minutes=10,
+        id="update_recommendation_engine_job",
+        name="Append newly added feeds to the recommendation engine every 10 minutes"
+    )
+    logger.info("Scheduler job 'update_recommendation_engine_job' has been added.")
+
+    # 1분마다 공유 추천 모델의 manifest 버전을 확인하여 바뀌었으면 다시 불러옴
+    scheduler.add_job(
+        reload_recommendation_model_task,
+        'interval',
+        minutes=1,
+        id="reload_recommendation_model_job",
+        name="Reload the shared recommendation model when its manifest version changes"
+    )
+    logger.info("Scheduler job 'reload_recommendation_model_job' has been added.")
+
     scheduler.add_job(
         run_pipeline,
         'cron',         # cron 형식으로 시간 지정
@@ -71,5 +257,8 @@ def setup_scheduler():
     )
     logger.info("Scheduler job 'run_knowledge_graph_pipeline_job' has been added.")
 
+    # 스케줄러가 종료될 때 학습 프로세스 풀도 함께 종료 (재학습 작업이 자식 프로세스를 남기지 않도록)
+    scheduler.add_listener(shutdown_background_workers, EVENT_SCHEDULER_SHUTDOWN)
+
 
 # ----------------------------------------------
\ No newline at end of file
@@ -0,0 +1,116 @@
+# app/F11_search/ES10_search_cache.py
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.F5_core.config import settings
+from app.F5_core.response_cache import response_cache
+from app.F6_schemas.search import SearchQuery
+
+# Elasticsearch 비동기 클라이언트 인스턴스
+from app.F11_search.ES1_client import es_async
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_PREFIX = "search_cache"
+
+
+def _normalize_list(value: Optional[str]) -> Optional[str]:
+    """쉼표 구분 필터를 공백 제거 + 중복 제거 + 정렬하여 순서만 다른 요청을 같은 값으로 만듦 (terms 필터는 순서와 무관)"""
+    if not value:
+        return None
+    items = sorted({item.strip() for item in value.split(",") if item.strip()})
+    return ",".join(items) or None
+
+
+def normalize_search_query(query_params: SearchQuery) -> SearchQuery:
+    """
+    같은 검색을 뜻하는 요청이 같은 build_search_query 입력이 되도록 정규화함.
+    - 검색어: 앞뒤 공백 제거, 연속 공백을 하나로 (빈 검색어는 None = 전체 검색)
+    - 기관/카테고리/유형 필터: 공백/중복 제거 후 정렬
+    """
+    keyword = " ".join(query_params.q.split()) if query_params.q else None
+    return query_params.model_copy(update={
+        "q": keyword or None,
+        "organizations": _normalize_list(query_params.organizations),
+        "categories": _normalize_list(query_params.categories),
+        "types": _normalize_list(query_params.types),
+    })
+
+
+def build_search_cache_key(query_params: SearchQuery, index_name: str) -> str:
+    """{prefix}:{alias가 가리키는 인덱스}:{정규화된 검색 입력 해시} (재색인 후 alias가 바뀌면 키도 바뀜)"""
+    payload = json.dumps(query_params.model_dump(mode="json"), sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return f"{SEARCH_CACHE_PREFIX}:{index_name}:{digest}"
+
+
+class AliasTargetResolver:
+    """
+    읽기 alias가 현재 가리키는 인덱스 이름을 조회함.
+    검색마다 ES에 묻지 않도록 refresh_seconds 동안 프로세스 메모리에 보관함.
+    (alias 전환 후 최대 refresh_seconds 동안은 이전 인덱스 키로 캐시를 읽을 수 있음)
+    """
+
+    def __init__(self, refresh_seconds: float = settings.SEARCH_ALIAS_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._targets: Dict[str, str] = {}
+        self._expires_at: Dict[str, float] = {}
+
+    async def resolve(self, alias: str) -> Optional[str]:
+        """alias가 가리키는 인덱스 이름 (여러 개면 쉼표로 연결), 조회 실패 시 None"""
+        if self._expires_at.get(alias, 0.0) > time.monotonic():
+            return self._targets[alias]
+        try:
+            response = await es_async.indices.get_alias(name=alias)
+        except Exception as e:
+            logger.warning(f"Failed to resolve search alias '{alias}', bypassing search cache: {e}")
+            return None
+        target = ",".join(sorted(response.keys()))
+        self._targets[alias] = target
+        self._expires_at[alias] = time.monotonic() + self.refresh_seconds
+        return target
+
+
+alias_target_resolver = AliasTargetResolver()
+
+
+def _search_payload(response: Dict[str, Any]) -> Dict[str, Any]:
+    """응답 조립에 쓰는 부분(hits, total, aggregations)만 남겨 캐시에 저장함"""
+    hits = response.get("hits", {})
+    return {
+        "hits": {"hits": hits.get("hits", []), "total": hits.get("total", {})},
+        "aggregations": response.get("aggregations", {}),
+    }
+
+
+async def cached_search(
+    query_params: SearchQuery,
+    es_query: Dict[str, Any],
+    alias: str = settings.ELASTICSEARCH_READ_ALIAS,
+    ttl: int = settings.SEARCH_CACHE_TTL_SECONDS,
+) -> Dict[str, Any]:
+    """
+    정규화된 검색 입력(query_params)과 그로부터 만든 DSL(es_query)로 검색하고, 결과를 Redis에 짧게 캐시함.
+    - 키: alias가 가리키는 인덱스 이름 + 검색 입력 해시 (재색인 후 alias 전환 시 자연히 새 키를 사용)
+    - 같은 키의 캐시 미스가 동시에 몰리면 한 요청만 ES를 호출하고 나머지는 결과를 기다림 (single-flight)
+    - alias 조회 또는 Redis 장애 시 캐시 없이 ES를 호출함
+    """
+    index_name = await alias_target_resolver.resolve(alias)
+
+    async def run_search() -> Dict[str, Any]:
+        response = await es_async.search(
+            index=index_name or alias,
+            body=es_query,
+            request_timeout=10  # 검색 제한 시간 (초)
+        )
+        return _search_payload(response)
+
+    if index_name is None:
+        return await run_search()
+    key = build_search_cache_key(query_params, index_name)
+    # 짧은 TTL로 충분하므로 stale 기간 없이 만료되면 다시 계산함
+    return await response_cache.serve_key(key, run_search, (), ttl, 0)
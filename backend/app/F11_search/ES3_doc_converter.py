@@ -1,19 +1,18 @@
 # app/F11_search/doc_converter.py
 
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional
 
 # Feed 모델 및 관련 모델 import (경로는 실제 프로젝트 구조에 맞게 확인)
 from app.F7_models.feeds import Feed
+from app.F7_models.feed_stats import FeedStats
 
 # --- Helper Function ---
 
-def _calculate_average_rating(ratings: List[Any]) -> float:
-    """ratings 리스트에서 평균 점수를 계산합니다."""
-    if not ratings:
+def _calculate_average_rating(stats: Optional[FeedStats]) -> float:
+    """feed_stats의 별점 합계/개수로 평균 점수를 계산합니다."""
+    if stats is None or not stats.rating_count:
         return 0.0
-    # 'score' 속성이 없는 경우를 대비하여 getattr 사용
-    total_score = sum(getattr(r, 'score', 0) for r in ratings)
-    return round(total_score / len(ratings), 2)
+    return round(stats.rating_sum / stats.rating_count, 2)
 
 # --- Main Converter Function ---
 
@@ -22,7 +21,8 @@ def convert_feed_to_document(feed: Feed) -> Dict[str, Any]:
     Feed SQLAlchemy 모델 객체를 Elasticsearch 인덱스 문서(딕셔너리)로 변환합니다.
 
     [중요] 이 함수를 호출하기 전에 SQLAlchemy 쿼리에서 Eager Loading(예: joinedload, selectinload)을 사용하여
-    'organization', 'category', 'ratings', 'bookmarks' 관계를 미리 로드해야 N+1 쿼리 문제를 방지할 수 있습니다.
+    'organization', 'category', 'stats' 관계를 미리 로드해야 N+1 쿼리 문제를 방지할 수 있습니다.
+    (별점/북마크는 feed_stats 집계 값을 사용하므로 ratings, bookmarks 전체를 로드할 필요가 없습니다.)
     
     Args:
         feed: 변환할 Feed 모델 인스턴스
@@ -33,8 +33,7 @@ def convert_feed_to_document(feed: Feed) -> Dict[str, Any]:
     # 1. 관계(relationship) 데이터 안전하게 추출
     org_data = feed.organization if hasattr(feed, 'organization') and feed.organization else None
     cat_data = feed.category if hasattr(feed, 'category') and feed.category else None
-    ratings_data = getattr(feed, 'ratings', [])
-    bookmarks_data = getattr(feed, 'bookmarks', [])
+    stats_data = getattr(feed, 'stats', None)
 
     # 2. 검색 대상이 될 'content' 필드를 위해 주요 텍스트 필드 통합
     #    filter(None, ...)은 None이나 빈 문자열을 제외하고 합쳐줍니다.
@@ -76,8 +75,8 @@ def convert_feed_to_document(feed: Feed) -> Dict[str, Any]:
         # --- Sorting & Date Filtering Fields ---
         "published_date": feed.published_date.isoformat() if getattr(feed, 'published_date', None) else None,
         "view_count": getattr(feed, 'view_count', 0),
-        "average_rating": _calculate_average_rating(ratings_data),
-        "bookmark_count": len(bookmarks_data),
+        "average_rating": _calculate_average_rating(stats_data),
+        "bookmark_count": stats_data.bookmark_count if stats_data else 0,
 
         # --- Retrieval-only Fields ---
         "url": f"/feed/{feed.id}",  # API 응답에 포함될 상세 페이지 URL
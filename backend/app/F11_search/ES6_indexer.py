@@ -5,7 +5,7 @@ from typing import AsyncGenerator, Dict, Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import joinedload
 
 from elasticsearch.helpers import async_bulk
 
@@ -33,8 +33,8 @@ async def _prepare_bulk_actions(db: AsyncSession, index_name: str) -> AsyncGener
         .options(
             joinedload(Feed.organization),
             joinedload(Feed.category),
-            selectinload(Feed.ratings),
-            selectinload(Feed.bookmarks)
+            # 별점/북마크는 feed_stats 집계 행(피드당 1행)만 함께 로드
+            joinedload(Feed.stats)
         )
     )
 
@@ -15,6 +15,9 @@ from app.F11_search.ES1_client import es_async
 # 검색 쿼리 DSL을 동적으로 생성하는 함수
 from app.F11_search.ES7_query_builder import build_search_query
 
+# 검색 결과 캐시 (정규화된 검색 입력 + alias 대상 인덱스 기준)
+from app.F11_search.ES10_search_cache import cached_search, normalize_search_query
+
 # 검색 API의 요청 및 응답 스키마 및 에러 코드 정의
 from app.F6_schemas.search import (
     SearchQuery,                # 검색 요청 쿼리 파라미터
@@ -105,15 +108,13 @@ async def search_contents(query_params: SearchQuery) -> Union[SearchResponse, Er
             raise RuntimeError("Asynchronous Elasticsearch client is not available.")
 
         # --- [1] 검색 DSL 생성 (← ES7_query_builder.py 사용) ---
+        # 같은 검색이 같은 캐시 키를 쓰도록 검색어/필터를 정규화한 뒤 DSL을 만듦
+        query_params = normalize_search_query(query_params)
         es_query = build_search_query(query_params)
         logger.debug(f"Elasticsearch Query: {es_query}")
 
-        # --- [2] Elasticsearch 검색 실행 ---
-        response = await es_async.search(
-            index=settings.ELASTICSEARCH_READ_ALIAS,
-            body=es_query,
-            request_timeout=10 # 검색 제한 시간 (초)
-        )
+        # --- [2] Elasticsearch 검색 실행 (← ES10_search_cache.py, 짧은 TTL의 Redis 결과 캐시 경유) ---
+        response = await cached_search(query_params, es_query)
 
         # --- [3] 검색 결과 처리 ---
         hits = response.get("hits", {}).get("hits", [])
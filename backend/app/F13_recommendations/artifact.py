@@ -0,0 +1,124 @@
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+from app.F5_core.config import settings
+from app.F13_recommendations.engine import ModelSnapshot
+
+logger = logging.getLogger(__name__)
+
+# 디렉터리 구조
+#   {model_dir}/manifest.json          현재 버전을 가리키는 포인터 {"version", "path", "created_at", "feeds", "vocabulary"}
+#   {model_dir}/v_{version}/*.npy      CSR 구성 배열(data, indices, indptr), IDF, 메타데이터 컬럼
+#   {model_dir}/v_{version}/vocabulary.json, meta.json
+MANIFEST_FILENAME = "manifest.json"
+VERSION_DIR_PREFIX = "v_"
+# 다른 워커가 아직 mmap으로 읽고 있을 수 있으므로 직전 버전까지는 남겨 둠
+ARTIFACT_KEEP_VERSIONS = 2
+
+_ARRAY_FIELDS = (
+    "data", "indices", "indptr", "idf",
+    "feed_ids", "category_ids", "organization_ids", "published_dates", "press_release_mask",
+)
+_META_FIELDS = ("version", "shape", "appended_token_count", "unseen_token_count")
+
+
+def _model_dir(model_dir: Optional[str]) -> str:
+    return model_dir or settings.RECOMMENDATION_MODEL_DIR
+
+
+def save_artifact(snapshot: ModelSnapshot, model_dir: Optional[str] = None) -> str:
+    """
+    스냅샷을 버전별 디렉터리에 저장하고 manifest를 새 버전으로 교체함.
+    - 임시 디렉터리에 모두 기록한 뒤 rename하고, manifest도 임시 파일 후 os.replace로 교체하므로
+      읽는 쪽은 항상 완전히 기록된 버전만 보게 됨.
+    반환: 저장된 버전 디렉터리 경로
+    """
+    model_dir = _model_dir(model_dir)
+    os.makedirs(model_dir, exist_ok=True)
+
+    payload = snapshot.to_payload()
+    version_name = f"{VERSION_DIR_PREFIX}{snapshot.version}"
+    version_dir = os.path.join(model_dir, version_name)
+    tmp_dir = os.path.join(model_dir, f".tmp_{snapshot.version}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    for field in _ARRAY_FIELDS:
+        np.save(os.path.join(tmp_dir, f"{field}.npy"), np.asarray(payload[field]))
+    with open(os.path.join(tmp_dir, "vocabulary.json"), "w", encoding="utf-8") as f:
+        json.dump(payload["vocabulary"], f, ensure_ascii=False)
+    with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({field: payload[field] for field in _META_FIELDS}, f)
+
+    shutil.rmtree(version_dir, ignore_errors=True)
+    os.rename(tmp_dir, version_dir)
+
+    manifest = {
+        "version": snapshot.version,
+        "path": version_name,
+        "created_at": datetime.now().isoformat(),
+        "feeds": len(snapshot),
+        "vocabulary": len(payload["vocabulary"]),
+    }
+    tmp_manifest = os.path.join(model_dir, f".{MANIFEST_FILENAME}.tmp")
+    with open(tmp_manifest, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_manifest, os.path.join(model_dir, MANIFEST_FILENAME))
+
+    _cleanup_old_versions(model_dir, keep=ARTIFACT_KEEP_VERSIONS)
+    logger.info(f"Saved recommendation model artifact {snapshot.version} to {version_dir}")
+    return version_dir
+
+
+def read_manifest(model_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """현재 manifest를 읽음. 저장된 모델이 없으면 None."""
+    path = os.path.join(_model_dir(model_dir), MANIFEST_FILENAME)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read recommendation model manifest {path}: {e}")
+        return None
+
+
+def load_artifact(model_dir: Optional[str] = None, manifest: Optional[Dict[str, Any]] = None) -> Optional[ModelSnapshot]:
+    """
+    manifest가 가리키는 버전의 모델을 불러옴. 저장된 모델이 없으면 None.
+    - 배열은 mmap으로 열어 같은 파일을 읽는 워커들이 OS 페이지 캐시를 공유함. (워커마다 복사본을 만들지 않음)
+    """
+    model_dir = _model_dir(model_dir)
+    manifest = manifest or read_manifest(model_dir)
+    if manifest is None:
+        return None
+
+    version_dir = os.path.join(model_dir, manifest["path"])
+    payload: Dict[str, Any] = {
+        field: np.load(os.path.join(version_dir, f"{field}.npy"), mmap_mode="r")
+        for field in _ARRAY_FIELDS
+    }
+    with open(os.path.join(version_dir, "vocabulary.json"), encoding="utf-8") as f:
+        payload["vocabulary"] = json.load(f)
+    with open(os.path.join(version_dir, "meta.json"), encoding="utf-8") as f:
+        payload.update(json.load(f))
+
+    snapshot = ModelSnapshot.from_payload(payload)
+    logger.info(f"Loaded recommendation model artifact {snapshot.version} ({len(snapshot)} feeds) from {version_dir}")
+    return snapshot
+
+
+def _cleanup_old_versions(model_dir: str, keep: int):
+    """최근 keep개 버전 디렉터리만 남기고 삭제함. (버전 키는 시각 문자열이므로 이름순 정렬이 곧 시간순)"""
+    version_dirs = sorted(
+        name for name in os.listdir(model_dir)
+        if name.startswith(VERSION_DIR_PREFIX) and os.path.isdir(os.path.join(model_dir, name))
+    )
+    for name in version_dirs[:-keep]:
+        shutil.rmtree(os.path.join(model_dir, name), ignore_errors=True)
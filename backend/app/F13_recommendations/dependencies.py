@@ -1,20 +1,37 @@
 import logging
 import asyncio
+import secrets
+import time
+from typing import Optional
+
 from fastapi import Depends
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.F5_core.redis import client_redis
 from app.F8_database.session import get_db, AsyncSessionLocal
-from app.F13_recommendations.engine import RecommendationEngine
+from app.F13_recommendations.engine import RecommendationEngine, ModelSnapshot
+from app.F13_recommendations.artifact import save_artifact, read_manifest, load_artifact
 from app.F13_recommendations.repository import RecommendationRepository
 from app.F13_recommendations.service import RecommendationService
+from app.F13_recommendations.precompute import PrecomputedRecommendationStore, precompute_recommendations
+from app.F13_recommendations.fitting import fit_snapshot_off_loop, record_model_size
 
 logger = logging.getLogger(__name__)
 
 class EngineManager:
     """
     RecommendationEngine의 생명주기를 관리하는 싱글톤 매니저.
+    - 모델 학습/증분 업데이트는 Redis 락을 잡은 한 워커만 수행하고, 결과를 디스크 artifact로 저장함.
+    - 나머지 워커는 DB를 다시 조회하거나 학습하지 않고, manifest 버전이 바뀌면 artifact를 mmap으로 다시 불러옴.
+    - 모델을 게시할 때마다(최초 학습, 증분, 재학습) 그 버전의 피드별 추천 테이블을 Redis에 미리 계산해 둠.
     """
     _engine: RecommendationEngine = None
+    writer_lock_key = "recommendations:model_writer_lock"
+    writer_lock_ttl_seconds = 30 * 60
+    # 다른 워커가 최초 학습 중일 때 artifact가 저장되기를 기다리는 최대 시간과 확인 간격
+    initial_wait_seconds = 10 * 60
+    initial_poll_seconds = 5
 
     @classmethod
     def get_engine(cls) -> RecommendationEngine:
@@ -26,33 +43,209 @@ class EngineManager:
 
     @classmethod
     async def initial_fit(cls):
-        """[비동기] 서버 시작 시 엔진을 최초로 학습시킴."""
+        """
+        [비동기] 서버 시작 시 엔진을 준비함.
+        저장된 artifact가 있으면 그것을 불러오고, 없을 때만 학습함.
+        다른 워커가 학습 중이라 락을 얻지 못했으면, 그 워커가 artifact를 저장할 때까지 기다렸다가 불러옴.
+        """
         engine = cls.get_engine()
-        if engine.feeds:
+        if engine.is_fitted:
             logger.info("EngineManager: Engine is already fitted. Skipping initial fit.")
             return
 
-        logger.info("EngineManager: Starting initial fit of the recommendation engine.")
+        if await cls.reload_if_changed():
+            return
+
+        logger.info("EngineManager: No model artifact found. Starting initial fit of the recommendation engine.")
+        snapshot = await cls._fit_and_publish(mode="initial")
+        if snapshot is not None:
+            await precompute_recommendations(snapshot)
+            return
+
+        if not await cls._wait_for_published_model():
+            logger.warning("EngineManager: Recommendation model is not available yet. It will be loaded by the reload job.")
+
+    @classmethod
+    async def refit(cls):
+        """[비동기] 스케줄러에 의해 호출될 엔진 재학습 메서드."""
+        logger.info("EngineManager: Starting scheduled refit of the recommendation engine.")
+        snapshot = await cls._fit_and_publish(mode="refit")
+        if snapshot is None:
+            return
+
+        # 재학습된 모델로 피드별 추천 테이블을 미리 계산하여 Redis에 기록함
+        await precompute_recommendations(snapshot)
+
+    @classmethod
+    async def update_incremental(cls):
+        """
+        [비동기] 마지막 학습 이후 추가된 피드만 기존 모델에 덧붙임.
+        vocabulary drift가 임계값을 넘으면 전체 재학습으로 전환함.
+        락을 잡은 뒤 최신 manifest를 다시 불러와 그 스냅샷에 덧붙이고,
+        저장 직전 manifest 버전이 그대로일 때만 게시함 (다른 워커의 재학습 결과를 오래된 스냅샷으로 덮어쓰지 않음)
+        """
+        engine = cls.get_engine()
+        if engine.snapshot is None:
+            await cls.initial_fit()
+            return
+
+        lock_token = await cls._acquire_writer_lock()
+        if lock_token is None:
+            return
+
+        needs_refit = False
+        published = None
         try:
+            # 락을 기다리는 사이 다른 워커가 재학습/증분 결과를 게시했을 수 있으므로 최신 스냅샷을 기준으로 함
+            await cls.reload_if_changed()
+            snapshot = engine.snapshot
+            base_version = snapshot.version
+
             async with AsyncSessionLocal() as session:
                 repo = RecommendationRepository(db=session)
-                all_feeds = await repo.get_all_feeds_for_fitting()
-                engine.fit(all_feeds)
+                new_feeds = await repo.get_feeds_for_fitting_after(snapshot.max_feed_id)
+            if not new_feeds:
+                return
+
+            logger.info(f"EngineManager: Appending {len(new_feeds)} new feeds to the recommendation engine.")
+            needs_refit = engine.partial_fit(new_feeds)
+            extended = engine.snapshot
+            if extended is snapshot:
+                return
+
+            manifest = await asyncio.to_thread(read_manifest)
+            if manifest is not None and manifest["version"] != base_version:
+                # 락 TTL 만료 등으로 그 사이 다른 버전이 게시됨. 덧붙인 결과는 버리고 게시된 버전을 따름
+                logger.info(
+                    f"EngineManager: Model {manifest['version']} was published during incremental update "
+                    f"based on {base_version}. Discarding incremental result."
+                )
+                await cls.reload_if_changed()
+                return
+
+            record_model_size(extended)
+            if not needs_refit:
+                await asyncio.to_thread(save_artifact, extended)
+                published = extended
         except Exception as e:
-            logger.error(f"EngineManager: Failed during initial fit. Engine might be empty. Error: {e}", exc_info=True)
+            logger.error(f"EngineManager: Failed during incremental update. Error: {e}", exc_info=True)
+            return
+        finally:
+            await cls._release_writer_lock(lock_token)
+
+        if needs_refit:
+            logger.info("EngineManager: Vocabulary drift exceeded threshold. Starting full refit.")
+            await cls.refit()
+        elif published is not None:
+            # 기존 피드의 추천 목록에도 새 피드가 들어갈 수 있으므로 전체 테이블을 새 버전으로 다시 계산함
+            await precompute_recommendations(published)
 
     @classmethod
-    async def refit(cls):
-        """[비동기] 스케줄러에 의해 호출될 엔진 재학습 메서드."""
+    async def reload_if_changed(cls) -> bool:
+        """
+        [비동기] artifact manifest의 버전이 현재 엔진의 버전과 다르면 다시 불러와 교체함.
+        반환: 새 스냅샷으로 교체했으면 True
+        """
+        engine = cls.get_engine()
+        try:
+            manifest = await asyncio.to_thread(read_manifest)
+            if manifest is None:
+                return False
+            current = engine.snapshot
+            if current is not None and current.version == manifest["version"]:
+                return False
+            snapshot = await asyncio.to_thread(load_artifact, None, manifest)
+        except Exception as e:
+            logger.error(f"EngineManager: Failed to load recommendation model artifact. Error: {e}", exc_info=True)
+            return False
+
+        if snapshot is None:
+            return False
+        engine.swap_snapshot(snapshot)
+        record_model_size(snapshot)
+        return True
+
+    @classmethod
+    async def _wait_for_published_model(cls) -> bool:
+        """
+        [비동기] 다른 워커가 학습을 끝내고 artifact를 저장할 때까지 manifest를 주기적으로 확인함.
+        학습 중인 워커가 없는데(락 없음) artifact도 없으면(학습 실패, 피드 없음) 더 기다리지 않음.
+        반환: 엔진이 준비되었으면 True
+        """
+        engine = cls.get_engine()
+        deadline = time.monotonic() + cls.initial_wait_seconds
+        while time.monotonic() < deadline:
+            if await cls.reload_if_changed():
+                return True
+            if not await cls._writer_lock_held():
+                # 확인하는 사이 학습이 끝나 락이 풀렸을 수 있으므로 한 번 더 불러옴
+                return await cls.reload_if_changed() or engine.is_fitted
+            await asyncio.sleep(cls.initial_poll_seconds)
+        return engine.is_fitted
+
+    @classmethod
+    async def _fit_and_publish(cls, mode: str) -> Optional[ModelSnapshot]:
+        """
+        [비동기] 전체 피드로 학습하여 엔진에 적용하고 artifact로 저장함.
+        다른 워커가 이미 학습 중이면(락 획득 실패) 건너뛰고, 그 결과는 reload_if_changed로 받아옴.
+        반환: 새로 학습한 스냅샷 (건너뛰거나 실패하면 None)
+        """
+        lock_token = await cls._acquire_writer_lock()
+        if lock_token is None:
+            logger.info("EngineManager: Another worker is fitting the recommendation model. Skipping.")
+            return None
+
         engine = cls.get_engine()
-        logger.info("EngineManager: Starting scheduled refit of the recommendation engine.")
         try:
             async with AsyncSessionLocal() as session:
                 repo = RecommendationRepository(db=session)
                 all_feeds = await repo.get_all_feeds_for_fitting()
-                engine.refit(all_feeds)
+            if not all_feeds:
+                logger.warning("EngineManager: No feeds provided to fit the engine. Engine state remains unchanged.")
+                return None
+            # TF-IDF 학습은 CPU 연산이므로 별도 프로세스에서 수행함 (DB 세션은 학습 전에 반납)
+            snapshot = await fit_snapshot_off_loop(all_feeds, mode=mode)
+            engine.swap_snapshot(snapshot)
+            await asyncio.to_thread(save_artifact, snapshot)
+            return snapshot
         except Exception as e:
-            logger.error(f"EngineManager: Failed during scheduled refit. Error: {e}", exc_info=True)
+            logger.error(f"EngineManager: Failed during {mode} fit. Error: {e}", exc_info=True)
+            return None
+        finally:
+            await cls._release_writer_lock(lock_token)
+
+    @classmethod
+    async def _acquire_writer_lock(cls) -> Optional[str]:
+        """
+        [비동기] 모델 작성 권한(Redis 락)을 획득함. 다른 워커가 보유 중이면 None.
+        Redis를 사용할 수 없으면 단일 워커 환경으로 보고 그대로 진행함.
+        """
+        token = secrets.token_hex(8)
+        try:
+            acquired = await client_redis.set(cls.writer_lock_key, token, nx=True, ex=cls.writer_lock_ttl_seconds)
+        except RedisError as e:
+            logger.warning(f"EngineManager: Redis unavailable for writer lock, proceeding without it. Error: {e}")
+            return token
+        return token if acquired else None
+
+    @classmethod
+    async def _writer_lock_held(cls) -> bool:
+        """[비동기] 다른 워커가 모델 작성 락을 보유 중인지 확인함. Redis를 사용할 수 없으면 False."""
+        try:
+            return bool(await client_redis.exists(cls.writer_lock_key))
+        except RedisError as e:
+            logger.warning(f"EngineManager: Failed to check writer lock. Error: {e}")
+            return False
+
+    @classmethod
+    async def _release_writer_lock(cls, token: str):
+        """[비동기] 자신이 획득한 락일 때만 해제함."""
+        try:
+            current = await client_redis.get(cls.writer_lock_key)
+            if current is not None and current.decode("utf-8") == token:
+                await client_redis.delete(cls.writer_lock_key)
+        except RedisError as e:
+            logger.warning(f"EngineManager: Failed to release writer lock. Error: {e}")
 
 
 # --- 의존성 주입 함수들 ---
@@ -67,4 +260,9 @@ def get_recommendation_service(
     repo: RecommendationRepository = Depends(get_recommendation_repository),
     engine: RecommendationEngine = Depends(get_recommendation_engine)
 ) -> RecommendationService:
-    return RecommendationService(repo=repo, engine=engine)
\ No newline at end of file
+    return RecommendationService(
+        repo=repo,
+        engine=engine,
+        precomputed_store=PrecomputedRecommendationStore(),
+        reload_model=EngineManager.reload_if_changed,
+    )
\ No newline at end of file
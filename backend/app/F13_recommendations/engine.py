@@ -1,31 +1,287 @@
 import logging
-from typing import List, Dict, Tuple
-import threading # 👈 [추가] 스레드 동기화를 위한 Lock
+from datetime import datetime
+from typing import List, Dict, Tuple, Optional, Iterable, Mapping, Any
 
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
-
-from app.F7_models.feeds import Feed
-from app.F7_models.categories import Category
+import scipy.sparse as sp
 
 logger = logging.getLogger(__name__)
 PRESS_RELEASE_CATEGORY_NAME = "보도자료"
 
+# 증분 업데이트로 추가된 제목의 단어(unigram) 중 기존 vocabulary에 없는 비율이 이 값을 넘으면 전체 재학습이 필요하다고 판단함
+# (bigram은 기존 단어의 새 조합만으로도 대부분 처음 보는 항목이 되므로 drift 계산에 넣지 않음.
+#  조사가 붙은 어절 단위 토큰이라 같은 주제의 새 제목도 unigram 몇 개는 처음 보는 값이 되므로 여유를 둠)
+DRIFT_REFIT_THRESHOLD = 0.2
+# 표본이 너무 적을 때 비율이 튀는 것을 막기 위한 최소 unigram 토큰 수 (제목 한 건당 6~8개, 약 30건)
+DRIFT_MIN_TOKENS = 200
+# 제목 TF-IDF vectorizer 설정
+VECTORIZER_NGRAM_RANGE = (1, 2)
+
+
+def create_vectorizer(vocabulary: Optional[Dict[str, int]] = None) -> TfidfVectorizer:
+    """추천 엔진에서 사용하는 TF-IDF vectorizer를 생성함. vocabulary를 주면 해당 어휘로 고정됨."""
+    return TfidfVectorizer(min_df=1, ngram_range=VECTORIZER_NGRAM_RANGE, vocabulary=vocabulary)
+
+# 학습 입력 한 행: RecommendationRepository.get_all_feeds_for_fitting()이 반환하는 컬럼 투영 결과
+# (id, title, category_id, category_name, organization_id, published_date)
+FeedRow = Mapping[str, Any]
+
+
+class ModelSnapshot:
+    """
+    한 번의 학습 결과(vectorizer, TF-IDF 행렬, 피드 메타데이터)를 묶은 불변 스냅샷.
+    생성 이후에는 어떤 필드도 수정하지 않으므로, 여러 요청이 Lock 없이 동시에 읽어도 안전함.
+    - ORM 객체는 보관하지 않고, 필요한 메타데이터만 행 순서와 같은 numpy 컬럼으로 보관함.
+    - feed_map(피드 ID → 행 번호)으로 피드 조회는 O(1)임.
+    """
+    __slots__ = (
+        "version", "vectorizer", "tfidf_matrix", "feed_map",
+        "feed_ids", "category_ids", "organization_ids", "published_dates",
+        "press_release_mask", "category_indices",
+        "appended_token_count", "unseen_token_count",
+    )
+
+    def __init__(
+        self,
+        vectorizer: TfidfVectorizer,
+        tfidf_matrix,
+        feed_ids: np.ndarray,
+        category_ids: np.ndarray,
+        organization_ids: np.ndarray,
+        published_dates: np.ndarray,
+        press_release_mask: np.ndarray,
+        version: Optional[str] = None,
+        appended_token_count: int = 0,
+        unseen_token_count: int = 0,
+    ):
+        # 모델 버전: 사전 계산된 추천 테이블 등 파생 데이터를 이 스냅샷과 짝지을 때 사용함
+        self.version = version or datetime.now().strftime("%Y%m%d%H%M%S%f")
+        self.vectorizer = vectorizer
+        self.tfidf_matrix = tfidf_matrix
+
+        # 행 순서와 일치하는 메타데이터 컬럼
+        self.feed_ids = feed_ids
+        self.category_ids = category_ids
+        self.organization_ids = organization_ids
+        self.published_dates = published_dates
+        self.press_release_mask = press_release_mask
+
+        self.feed_map: Dict[int, int] = {int(feed_id): i for i, feed_id in enumerate(feed_ids.tolist())}
+        # 카테고리 ID별 행 인덱스
+        self.category_indices = {
+            int(category_id): np.flatnonzero(self.category_ids == category_id)
+            for category_id in np.unique(self.category_ids)
+        }
+
+        # 마지막 전체 학습 이후 증분 추가된 토큰 수 / 그중 vocabulary에 없던 토큰 수 (drift 판단용)
+        self.appended_token_count = appended_token_count
+        self.unseen_token_count = unseen_token_count
+
+    def build_mask(
+        self,
+        press_release: Optional[bool] = None,
+        category_ids: Optional[Iterable[int]] = None,
+        organization_id: Optional[int] = None,
+        published_from: Optional[datetime] = None,
+        published_to: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """
+        주어진 조건을 모두 만족하는 행의 불리언 마스크를 반환함. (None인 조건은 적용하지 않음)
+        - press_release: True면 보도자료만, False면 보도자료 이외만
+        - category_ids: 지정한 카테고리 ID 중 하나에 속하는 행만
+        - organization_id: 해당 기관의 행만
+        - published_from / published_to: 발행일 구간 (발행일이 없는 행은 제외됨)
+        """
+        if press_release is None:
+            mask = np.ones(len(self.feed_ids), dtype=bool)
+        elif press_release:
+            mask = self.press_release_mask.copy()
+        else:
+            mask = ~self.press_release_mask
+
+        if category_ids is not None:
+            category_mask = np.zeros(len(self.feed_ids), dtype=bool)
+            for category_id in category_ids:
+                indices = self.category_indices.get(int(category_id))
+                if indices is not None:
+                    category_mask[indices] = True
+            mask &= category_mask
+        if organization_id is not None:
+            mask &= self.organization_ids == organization_id
+        if published_from is not None:
+            mask &= self.published_dates >= np.datetime64(published_from, "s")
+        if published_to is not None:
+            mask &= self.published_dates <= np.datetime64(published_to, "s")
+        return mask
+
+    def similarities(self, row_index: int) -> np.ndarray:
+        """
+        주어진 행과 모든 행 사이의 코사인 유사도 벡터를 반환함.
+        - TfidfVectorizer의 행은 L2 정규화되어 있으므로 내적이 곧 코사인 유사도임.
+        """
+        source_vector = self.tfidf_matrix[row_index]
+        return np.asarray((self.tfidf_matrix @ source_vector.T).todense()).ravel()
+
+    def __len__(self) -> int:
+        return len(self.feed_ids)
+
+    def row_of(self, feed_id: int) -> Optional[int]:
+        """피드 ID에 해당하는 행 번호를 반환함. 학습 데이터에 없으면 None."""
+        return self.feed_map.get(feed_id)
+
+    @property
+    def max_feed_id(self) -> int:
+        """학습 데이터에 포함된 가장 큰 피드 ID. 증분 업데이트 시 이후 피드만 조회하는 기준으로 사용함."""
+        return int(self.feed_ids.max()) if len(self.feed_ids) else 0
+
+    @property
+    def drift_ratio(self) -> float:
+        """증분 추가된 토큰 중 vocabulary에 없던 토큰의 비율."""
+        if self.appended_token_count == 0:
+            return 0.0
+        return self.unseen_token_count / self.appended_token_count
+
+    def needs_refit(self) -> bool:
+        """vocabulary drift가 임계값을 넘어 전체 재학습이 필요한지 여부."""
+        return self.appended_token_count >= DRIFT_MIN_TOKENS and self.drift_ratio > DRIFT_REFIT_THRESHOLD
+
+    def is_press_release(self, feed_id: int) -> Optional[bool]:
+        """피드가 보도자료인지 여부를 반환함. 학습 데이터에 없으면 None."""
+        row_index = self.feed_map.get(feed_id)
+        if row_index is None:
+            return None
+        return bool(self.press_release_mask[row_index])
+
+    @classmethod
+    def build(cls, rows: List[FeedRow]) -> "ModelSnapshot":
+        """주어진 피드 행 목록으로 새 vectorizer를 학습시켜 스냅샷을 생성함."""
+        vectorizer = create_vectorizer()
+        tfidf_matrix = vectorizer.fit_transform([row["title"] for row in rows])
+        return cls(vectorizer, tfidf_matrix, **_metadata_columns(rows))
+
+    def to_payload(self) -> Dict[str, Any]:
+        """
+        스냅샷을 프로세스 간 전달/저장이 가능한 평범한 배열과 값으로 직렬화함.
+        - TF-IDF 행렬은 CSR 구성 배열(data, indices, indptr, shape)로, vectorizer는 어휘 목록과 IDF 배열로 표현함.
+        """
+        matrix = self.tfidf_matrix.tocsr()
+        vocabulary = self.vectorizer.vocabulary_
+        terms = [None] * len(vocabulary)
+        for term, index in vocabulary.items():
+            terms[index] = term
+        return {
+            "version": self.version,
+            "data": matrix.data,
+            "indices": matrix.indices,
+            "indptr": matrix.indptr,
+            "shape": matrix.shape,
+            "vocabulary": terms,
+            "idf": self.vectorizer.idf_,
+            "feed_ids": self.feed_ids,
+            "category_ids": self.category_ids,
+            "organization_ids": self.organization_ids,
+            "published_dates": self.published_dates,
+            "press_release_mask": self.press_release_mask,
+            "appended_token_count": self.appended_token_count,
+            "unseen_token_count": self.unseen_token_count,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> "ModelSnapshot":
+        """to_payload()로 직렬화된 값에서 스냅샷을 복원함. (재학습 없이 vocabulary와 IDF를 그대로 복원)"""
+        vectorizer = create_vectorizer(vocabulary={term: i for i, term in enumerate(payload["vocabulary"])})
+        vectorizer.idf_ = payload["idf"]
+        tfidf_matrix = sp.csr_matrix(
+            (payload["data"], payload["indices"], payload["indptr"]), shape=tuple(payload["shape"])
+        )
+        return cls(
+            vectorizer,
+            tfidf_matrix,
+            feed_ids=payload["feed_ids"],
+            category_ids=payload["category_ids"],
+            organization_ids=payload["organization_ids"],
+            published_dates=payload["published_dates"],
+            press_release_mask=payload["press_release_mask"],
+            version=payload["version"],
+            appended_token_count=int(payload["appended_token_count"]),
+            unseen_token_count=int(payload["unseen_token_count"]),
+        )
+
+    def extend(self, rows: List[FeedRow]) -> "ModelSnapshot":
+        """
+        기존 vocabulary/IDF로 새 피드의 제목을 변환하여 행을 덧붙인 새 스냅샷을 반환함. (증분 업데이트)
+        - 이미 학습 데이터에 있는 피드는 건너뜀. 추가할 피드가 없으면 자기 자신을 그대로 반환함.
+        - 스냅샷은 불변이므로 기존 스냅샷은 수정하지 않고, 행렬/컬럼을 이어 붙인 새 스냅샷을 만듦.
+        - vocabulary에 없는 토큰은 벡터에 반영되지 않으므로, 그 비율을 누적하여 drift로 기록함.
+          (drift는 unigram 기준. analyzer는 bigram까지 만들어 새 조합을 모두 미등록 어휘로 세므로 쓰지 않음)
+        """
+        rows = [row for row in rows if row["id"] not in self.feed_map]
+        if not rows:
+            return self
+
+        titles = [row["title"] for row in rows]
+        new_matrix = self.vectorizer.transform(titles)
+
+        preprocess = self.vectorizer.build_preprocessor()
+        tokenize = self.vectorizer.build_tokenizer()
+        vocabulary = self.vectorizer.vocabulary_
+        appended = unseen = 0
+        for title in titles:
+            terms = tokenize(preprocess(title))
+            appended += len(terms)
+            unseen += sum(1 for term in terms if term not in vocabulary)
+
+        columns = _metadata_columns(rows)
+        return ModelSnapshot(
+            self.vectorizer,
+            sp.vstack([self.tfidf_matrix, new_matrix], format="csr"),
+            feed_ids=np.concatenate([self.feed_ids, columns["feed_ids"]]),
+            category_ids=np.concatenate([self.category_ids, columns["category_ids"]]),
+            organization_ids=np.concatenate([self.organization_ids, columns["organization_ids"]]),
+            published_dates=np.concatenate([self.published_dates, columns["published_dates"]]),
+            press_release_mask=np.concatenate([self.press_release_mask, columns["press_release_mask"]]),
+            appended_token_count=self.appended_token_count + appended,
+            unseen_token_count=self.unseen_token_count + unseen,
+        )
+
+
+def _metadata_columns(rows: List[FeedRow]) -> Dict[str, np.ndarray]:
+    """피드 행 목록을 스냅샷의 메타데이터 컬럼(numpy 배열)으로 변환함."""
+    return {
+        "feed_ids": np.array([row["id"] for row in rows], dtype=np.int64),
+        "category_ids": np.array([row["category_id"] for row in rows], dtype=np.int64),
+        "organization_ids": np.array([row["organization_id"] for row in rows], dtype=np.int64),
+        "published_dates": np.array(
+            [row["published_date"] or np.datetime64("NaT") for row in rows], dtype="datetime64[s]"
+        ),
+        "press_release_mask": np.array(
+            [row["category_name"] == PRESS_RELEASE_CATEGORY_NAME for row in rows], dtype=bool
+        ),
+    }
+
+
 class RecommendationEngine:
     """
     TF-IDF와 코사인 유사도를 기반으로 콘텐츠 기반 추천을 수행하는 엔진.
-    이 객체는 싱글톤으로 관리되며, 상태 변경은 스레드에 안전해야 함.
+    이 객체는 싱글톤으로 관리됨.
+    - 학습 결과는 불변 스냅샷(ModelSnapshot)으로 보관하고, 읽기 요청은 현재 스냅샷 참조만 가져가서 Lock 없이 계산함.
+    - 재학습은 새 스냅샷을 별도로 만든 뒤 참조 하나만 교체함 (참조 대입은 원자적이므로 읽는 쪽은 항상 완전한 스냅샷을 봄).
     """
     def __init__(self):
-        self.vectorizer = TfidfVectorizer(min_df=1, ngram_range=(1, 2))
-        self.tfidf_matrix = None
-        self.feed_map: Dict[int, int] = {}
-        self.feeds: List[Feed] = []
-        # 👈 [추가] 데이터 업데이트 시 동시성 문제를 방지하기 위한 Lock 객체
-        self._lock = threading.Lock()
+        self._snapshot: Optional[ModelSnapshot] = None
 
-    def fit(self, feeds: List[Feed]):
+    @property
+    def snapshot(self) -> Optional[ModelSnapshot]:
+        """현재 서비스 중인 스냅샷. 아직 학습되지 않았으면 None."""
+        return self._snapshot
+
+    @property
+    def is_fitted(self) -> bool:
+        snapshot = self._snapshot
+        return snapshot is not None and len(snapshot) > 0
+
+    def fit(self, feeds: List[FeedRow]):
         """
         추천 엔진을 주어진 피드 데이터로 '학습'시킴.
         이 메서드는 객체 초기화 시에만 호출되어야 함.
@@ -34,77 +290,146 @@ class RecommendationEngine:
         if not feeds:
             logger.warning("No feeds provided to fit the engine.")
             return
-        
-        # 💥 스레드 안전성을 위해 with 문으로 Lock을 획득함
-        with self._lock:
-            self.feeds = feeds
-            titles = [feed.title for feed in feeds]
-            self.tfidf_matrix = self.vectorizer.fit_transform(titles)
-            self.feed_map = {feed.id: i for i, feed in enumerate(feeds)}
-            logger.info(f"Fitting complete. TF-IDF matrix shape: {self.tfidf_matrix.shape}")
-
-    def refit(self, feeds: List[Feed]):
-        """
-        [신규] 새로운 피드 데이터로 엔진을 '재학습'시킴.
+
+        snapshot = ModelSnapshot.build(feeds)
+        self._snapshot = snapshot
+        logger.info(f"Fitting complete. TF-IDF matrix shape: {snapshot.tfidf_matrix.shape}")
+
+    def refit(self, feeds: List[FeedRow]):
+        """
+        새로운 피드 데이터로 엔진을 '재학습'시킴.
         주기적 스케줄러에 의해 호출될 메서드임.
+        - 학습하는 동안에도 기존 스냅샷으로 추천 요청을 계속 처리함.
         """
         logger.info(f"Refitting RecommendationEngine with {len(feeds)} new feeds...")
         if not feeds:
             logger.warning("No feeds provided for refitting. Engine state remains unchanged.")
             return
 
-        # 새로운 데이터로 TF-IDF 모델과 행렬을 다시 생성함
-        new_vectorizer = TfidfVectorizer(min_df=1, ngram_range=(1, 2))
-        titles = [feed.title for feed in feeds]
-        new_tfidf_matrix = new_vectorizer.fit_transform(titles)
-        new_feed_map = {feed.id: i for i, feed in enumerate(feeds)}
-        
-        # 💥 Lock을 획득하고, 학습된 모든 데이터를 원자적으로(atomically) 교체함
-        with self._lock:
-            self.vectorizer = new_vectorizer
-            self.tfidf_matrix = new_tfidf_matrix
-            self.feeds = feeds
-            self.feed_map = new_feed_map
-        
-        logger.info(f"Refitting complete. New TF-IDF matrix shape: {self.tfidf_matrix.shape}")
-
-    def get_recommendations(self, source_feed_id: int, target_content_type: str, top_n: int = 5) -> List[Tuple[int, float]]:
-        """
-        특정 피드와 유사한 다른 피드를 추천함. (이 메서드는 변경 없음)
-        """
-        # 💥 읽기 작업 중에도 데이터가 변경될 수 있으므로, Lock을 사용하여 일관성을 보장함
-        with self._lock:
-            if self.tfidf_matrix is None or not self.feeds:
-                logger.error("Engine is not fitted yet.")
-                return []
-            
-            if source_feed_id not in self.feed_map:
-                logger.warning(f"Source feed with ID {source_feed_id} not found.")
-                return []
-
-            source_index = self.feed_map[source_feed_id]
-            source_vector = self.tfidf_matrix[source_index]
-            
-            cosine_sims = cosine_similarity(source_vector, self.tfidf_matrix).flatten()
-            
-            is_press_release = lambda feed: feed.category.name == PRESS_RELEASE_CATEGORY_NAME
-            
-            target_indices = []
-            for i, feed in enumerate(self.feeds):
-                if feed.id == source_feed_id: continue
-
-                current_feed_is_press = is_press_release(feed)
-
-                if target_content_type == PRESS_RELEASE_CATEGORY_NAME and current_feed_is_press:
-                    target_indices.append(i)
-                elif target_content_type != PRESS_RELEASE_CATEGORY_NAME and not current_feed_is_press:
-                    target_indices.append(i)
-
-            if not target_indices: return []
-                
-            sim_scores = [(i, cosine_sims[i]) for i in target_indices]
-            sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-            top_scores = sim_scores[:top_n]
-            
-            recommendations = [(self.feeds[i].id, score) for i, score in top_scores]
-            return recommendations
\ No newline at end of file
+        # 새로운 데이터로 스냅샷을 따로 만든 뒤, 참조 하나만 교체함
+        new_snapshot = ModelSnapshot.build(feeds)
+        self._snapshot = new_snapshot
+
+        logger.info(f"Refitting complete. New TF-IDF matrix shape: {new_snapshot.tfidf_matrix.shape}")
+
+    def swap_snapshot(self, snapshot: ModelSnapshot):
+        """
+        외부(별도 프로세스 등)에서 학습한 스냅샷으로 교체함.
+        참조 하나만 바꾸므로 진행 중인 추천 요청은 기존 스냅샷으로 끝까지 계산됨.
+        """
+        self._snapshot = snapshot
+        logger.info(f"Swapped in model snapshot {snapshot.version}. TF-IDF matrix shape: {snapshot.tfidf_matrix.shape}")
+
+    def partial_fit(self, feeds: List[FeedRow]) -> bool:
+        """
+        새로 추가된 피드만 기존 모델에 덧붙임. (전체 재학습 없이 신규 피드를 바로 추천 대상에 포함시킴)
+        반환: vocabulary drift가 임계값을 넘어 전체 재학습이 필요하면 True.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            logger.warning("Engine is not fitted yet. Full fit is required.")
+            return True
+
+        new_snapshot = snapshot.extend(feeds)
+        if new_snapshot is snapshot:
+            return False
+
+        # 계산하는 사이 전체 재학습으로 스냅샷이 교체되었다면, 오래된 스냅샷 기준의 결과로 덮어쓰지 않음
+        if self._snapshot is not snapshot:
+            logger.info("Snapshot was replaced during partial fit. Discarding incremental result.")
+            return False
+
+        self._snapshot = new_snapshot
+        logger.info(
+            f"Partial fit complete. Appended {len(new_snapshot) - len(snapshot)} feeds "
+            f"(TF-IDF matrix shape: {new_snapshot.tfidf_matrix.shape}, drift ratio: {new_snapshot.drift_ratio:.3f})"
+        )
+        return new_snapshot.needs_refit()
+
+    def get_recommendations(
+        self,
+        source_feed_id: int,
+        target_content_type: str,
+        top_n: int = 5,
+        category_ids: Optional[Iterable[int]] = None,
+        organization_id: Optional[int] = None,
+        published_from: Optional[datetime] = None,
+        published_to: Optional[datetime] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        특정 피드와 유사한 다른 피드를 추천함.
+        - target_content_type이 '보도자료'면 보도자료 중에서, 그 외에는 보도자료가 아닌 피드 중에서 추천함.
+        - 카테고리/기관/발행일 필터는 학습 시 미리 계산한 배열로 벡터화하여 적용함.
+        """
+        slices = self.get_recommendation_slices(
+            source_feed_id,
+            [target_content_type],
+            top_n=top_n,
+            category_ids=category_ids,
+            organization_id=organization_id,
+            published_from=published_from,
+            published_to=published_to,
+        )
+        return slices[target_content_type] if slices else []
+
+    def get_recommendation_slices(
+        self,
+        source_feed_id: int,
+        target_content_types: Iterable[str],
+        top_n: int = 5,
+        category_ids: Optional[Iterable[int]] = None,
+        organization_id: Optional[int] = None,
+        published_from: Optional[datetime] = None,
+        published_to: Optional[datetime] = None,
+    ) -> Optional[Dict[str, List[Tuple[int, float]]]]:
+        """
+        유사도 벡터를 한 번만 계산하고, 대상 타입별로 필터링한 top-k 목록을 함께 반환함.
+        - 예: ["보도자료", "정책자료"] -> {"보도자료": [...], "정책자료": [...]}
+        - 공통 필터(카테고리/기관/발행일)는 모든 타입에 동일하게 적용됨.
+        반환: 타입별 (feed_id, score) 목록. 엔진이 학습되지 않았거나 기준 피드가 없으면 None.
+        """
+        # 계산 도중 재학습이 끝나더라도 일관된 결과를 내도록, 시작 시점의 스냅샷 하나만 사용함
+        snapshot = self._snapshot
+        if snapshot is None:
+            logger.error("Engine is not fitted yet.")
+            return None
+
+        source_index = snapshot.row_of(source_feed_id)
+        if source_index is None:
+            logger.warning(f"Source feed with ID {source_feed_id} not found.")
+            return None
+
+        base_mask = snapshot.build_mask(
+            category_ids=category_ids,
+            organization_id=organization_id,
+            published_from=published_from,
+            published_to=published_to,
+        )
+        base_mask[source_index] = False
+
+        cosine_sims = snapshot.similarities(source_index)
+
+        results: Dict[str, List[Tuple[int, float]]] = {}
+        for content_type in target_content_types:
+            if content_type == PRESS_RELEASE_CATEGORY_NAME:
+                mask = base_mask & snapshot.press_release_mask
+            else:
+                mask = base_mask & ~snapshot.press_release_mask
+            results[content_type] = select_top_k(snapshot.feed_ids, cosine_sims, mask, top_n)
+        return results
+
+
+def select_top_k(feed_ids: np.ndarray, scores: np.ndarray, mask: np.ndarray, top_n: int) -> List[Tuple[int, float]]:
+    """
+    마스크가 True인 행 중에서 점수 상위 top_n개의 (feed_id, score)를 점수 내림차순으로 반환함.
+    - 전체 정렬 대신 argpartition으로 상위 k개만 고른 뒤, 그 k개만 정렬함.
+    """
+    candidates = np.flatnonzero(mask)
+    if top_n <= 0 or len(candidates) == 0:
+        return []
+
+    candidate_scores = scores[candidates]
+    k = min(top_n, len(candidates))
+    top = np.argpartition(-candidate_scores, k - 1)[:k]
+    top = top[np.argsort(-candidate_scores[top], kind="stable")]
+    return [(int(feed_ids[candidates[i]]), float(candidate_scores[i])) for i in top]
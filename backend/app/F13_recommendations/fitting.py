@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Optional
+
+from prometheus_client import Gauge, Histogram
+
+from app.F13_recommendations.engine import ModelSnapshot, FeedRow
+
+logger = logging.getLogger(__name__)
+
+# 학습 전용 프로세스 수. 학습은 하루 몇 번뿐이므로 하나면 충분함
+FIT_MAX_WORKERS = 1
+
+# 메트릭 정의
+FIT_DURATION = Histogram(
+    "recommendation_fit_duration_seconds",
+    "Recommendation engine TF-IDF fitting duration in seconds",
+    ["mode"],
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+
+CORPUS_SIZE = Gauge(
+    "recommendation_corpus_size",
+    "Number of feeds in the currently served recommendation model",
+)
+
+VOCABULARY_SIZE = Gauge(
+    "recommendation_vocabulary_size",
+    "Vocabulary size of the currently served recommendation model",
+)
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_fit_executor() -> ProcessPoolExecutor:
+    """
+    학습 전용 프로세스 풀을 반환함. (최초 호출 시 생성)
+    - 이벤트 루프와 스레드가 떠 있는 프로세스를 fork하지 않도록 spawn 방식으로 자식 프로세스를 띄움.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=FIT_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown_fit_executor():
+    """학습 프로세스 풀을 종료함. (스케줄러 종료 이벤트에서 호출, F10_tasks/scheduler.py 참고)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def record_model_size(snapshot: ModelSnapshot):
+    """현재 서비스 중인 스냅샷의 코퍼스/어휘 크기를 게이지에 기록함. (학습, 증분 반영, artifact 재로딩 시 호출)"""
+    CORPUS_SIZE.set(len(snapshot))
+    VOCABULARY_SIZE.set(len(snapshot.vectorizer.vocabulary_))
+
+
+def _fit_in_subprocess(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """[자식 프로세스] 스냅샷을 학습하고, 부모에게 보낼 수 있도록 직렬화하여 반환함."""
+    return ModelSnapshot.build(rows).to_payload()
+
+
+async def fit_snapshot_off_loop(rows: List[FeedRow], mode: str = "refit") -> ModelSnapshot:
+    """
+    [비동기] TF-IDF 학습을 별도 프로세스에서 수행하고, 결과 스냅샷을 복원하여 반환함.
+    - 학습 중에도 이벤트 루프는 막히지 않으므로 기존 스냅샷으로 요청을 계속 처리함.
+    - 학습 시간과 코퍼스 크기를 Prometheus 메트릭으로 기록함.
+    입력:
+        rows - 학습용 피드 행 목록 (get_all_feeds_for_fitting() 반환값)
+        mode - 메트릭 라벨 ("initial" / "refit")
+    """
+    global _executor
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+
+    # RowMapping 등은 프로세스 간 전달이 안 되므로 평범한 dict로 변환함
+    plain_rows = [dict(row) for row in rows]
+    try:
+        payload = await loop.run_in_executor(get_fit_executor(), _fit_in_subprocess, plain_rows)
+    except BrokenProcessPool:
+        # 자식 프로세스가 비정상 종료되면 풀을 버리고 다음 학습 때 새로 만듦
+        logger.error("Recommendation fitting process died unexpectedly. Resetting the process pool.")
+        _executor = None
+        raise
+
+    # 복원(ID 인덱스 구성 등)도 피드 수에 비례하므로 워커 스레드에서 수행함
+    snapshot = await asyncio.to_thread(ModelSnapshot.from_payload, payload)
+
+    elapsed = time.perf_counter() - started
+    FIT_DURATION.labels(mode=mode).observe(elapsed)
+    record_model_size(snapshot)
+    logger.info(
+        f"Fitted recommendation model off-loop in {elapsed:.2f}s "
+        f"(feeds: {len(snapshot)}, vocabulary: {len(snapshot.vectorizer.vocabulary_)})"
+    )
+    return snapshot
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import logging
+from typing import List, Dict, Tuple, Optional, Iterator
+
+import numpy as np
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.F5_core.redis import client_redis
+from app.F13_recommendations.engine import ModelSnapshot
+
+logger = logging.getLogger(__name__)
+
+# 피드별로 미리 계산해 둘 메인/서브 추천 개수 (RecommendationService의 기본값과 동일)
+PRECOMPUTE_TOP_N = 5
+# 한 번에 계산할 기준 피드 행 수. 블록마다 (BLOCK_SIZE x 전체 피드 수) 크기의 dense 유사도 행렬이 만들어짐
+PRECOMPUTE_BLOCK_SIZE = 128
+# 사전 계산 결과 보존 기간. 재학습 주기(1일)보다 길게 두어 재학습 실패 시에도 직전 버전을 계속 사용함
+PRECOMPUTE_TTL_SECONDS = 2 * 24 * 3600
+# Redis 파이프라인 한 번에 기록할 키 수
+REDIS_WRITE_BATCH_SIZE = 1000
+
+RecommendationTable = Dict[str, List[Tuple[int, float]]]
+
+
+def _block_top_k(scores: np.ndarray, top_n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (블록 행 수 x 전체 피드 수) 점수 행렬에서 행마다 상위 top_n개의 열 인덱스와 점수를 내림차순으로 반환함.
+    - 제외할 항목은 -inf로 표시되어 있어야 함.
+    """
+    k = min(top_n, scores.shape[1])
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+
+def _to_pairs(feed_ids: np.ndarray, indices: np.ndarray, scores: np.ndarray) -> List[Tuple[int, float]]:
+    """한 행의 top-k 결과를 (feed_id, score) 목록으로 변환함. 후보가 부족해 -inf로 채워진 항목은 제외함."""
+    valid = np.isfinite(scores)
+    return [(int(feed_ids[i]), round(float(score), 6)) for i, score in zip(indices[valid], scores[valid])]
+
+
+def iter_recommendation_blocks(
+    snapshot: ModelSnapshot,
+    top_n: int = PRECOMPUTE_TOP_N,
+    block_size: int = PRECOMPUTE_BLOCK_SIZE,
+) -> Iterator[List[Tuple[int, RecommendationTable]]]:
+    """
+    스냅샷의 모든 피드에 대해 메인/서브 추천 목록을 블록 단위로 계산함.
+    - 기준 피드 block_size개와 전체 행렬의 희소 행렬 곱으로 유사도를 한 번에 구함.
+    - 메인: 기준 피드와 같은 그룹(보도자료/정책자료), 서브: 다른 그룹. (RecommendationService와 동일한 규칙)
+    반환: 블록마다 [(feed_id, {"main": [...], "sub": [...]}), ...]
+    """
+    # 행은 L2 정규화되어 있으므로 내적이 곧 코사인 유사도임. float32로 dense 블록 메모리를 절반으로 줄임
+    matrix = snapshot.tfidf_matrix.astype(np.float32).tocsr()
+    matrix_t = matrix.T.tocsr()
+    press_mask = snapshot.press_release_mask
+    feed_ids = snapshot.feed_ids
+    total = matrix.shape[0]
+
+    for start in range(0, total, block_size):
+        stop = min(start + block_size, total)
+        block_rows = np.arange(stop - start)
+
+        policy_scores = (matrix[start:stop] @ matrix_t).toarray()
+        # 자기 자신은 추천에서 제외
+        policy_scores[block_rows, block_rows + start] = -np.inf
+
+        press_scores = policy_scores.copy()
+        press_scores[:, ~press_mask] = -np.inf
+        policy_scores[:, press_mask] = -np.inf
+
+        press_top, press_top_scores = _block_top_k(press_scores, top_n)
+        policy_top, policy_top_scores = _block_top_k(policy_scores, top_n)
+
+        block = []
+        for offset in block_rows:
+            row = start + offset
+            press_pairs = _to_pairs(feed_ids, press_top[offset], press_top_scores[offset])
+            policy_pairs = _to_pairs(feed_ids, policy_top[offset], policy_top_scores[offset])
+            if press_mask[row]:
+                table = {"main": press_pairs, "sub": policy_pairs}
+            else:
+                table = {"main": policy_pairs, "sub": press_pairs}
+            block.append((int(feed_ids[row]), table))
+        yield block
+
+
+class PrecomputedRecommendationStore:
+    """
+    피드별로 미리 계산한 추천 목록을 Redis에 저장하고 조회하는 저장소.
+    - 키: recommendations:{모델 버전}:{feed_id} -> {"main": [[id, score], ...], "sub": [...]}
+    - 조회하는 쪽은 자신이 서비스 중인 스냅샷의 버전으로 읽음. 키마다 한 피드의 완전한 결과이므로,
+      아직 기록 중이거나 다른 버전(재학습/증분 직후 다른 워커)이면 키가 없어 실시간 계산으로 넘어감.
+    """
+    key_prefix = "recommendations"
+
+    def __init__(self, redis: Redis = client_redis, ttl_seconds: int = PRECOMPUTE_TTL_SECONDS):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    def feed_key(self, version: str, feed_id: int) -> str:
+        return f"{self.key_prefix}:{version}:{feed_id}"
+
+    async def save_block(self, version: str, block: List[Tuple[int, RecommendationTable]]) -> None:
+        """계산된 블록을 파이프라인으로 일괄 기록함."""
+        for start in range(0, len(block), REDIS_WRITE_BATCH_SIZE):
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for feed_id, table in block[start:start + REDIS_WRITE_BATCH_SIZE]:
+                    pipe.set(self.feed_key(version, feed_id), json.dumps(table), ex=self.ttl_seconds)
+                await pipe.execute()
+
+    async def get(self, feed_id: int, version: str) -> Optional[RecommendationTable]:
+        """
+        주어진 모델 버전의 추천 목록을 조회함.
+        반환: {"main": [(id, score), ...], "sub": [...]}. 해당 버전의 사전 계산 결과가 없으면 None.
+        """
+        raw = await self.redis.get(self.feed_key(version, feed_id))
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return {name: [(int(reco_id), float(score)) for reco_id, score in pairs] for name, pairs in data.items()}
+
+
+async def precompute_recommendations(
+    snapshot: ModelSnapshot,
+    store: Optional[PrecomputedRecommendationStore] = None,
+    top_n: int = PRECOMPUTE_TOP_N,
+    block_size: int = PRECOMPUTE_BLOCK_SIZE,
+) -> int:
+    """
+    [비동기] 스냅샷의 전체 피드에 대한 추천 테이블을 계산하여 스냅샷 버전의 키로 Redis에 기록함.
+    - 모델을 게시(최초 학습, 증분 업데이트, 재학습)할 때마다 호출됨.
+    - CPU 연산(블록 행렬 곱, top-k)은 블록 단위로 워커 스레드에서 수행하여 이벤트 루프를 막지 않음.
+    반환: 기록한 피드 수 (실패 시 0)
+    """
+    store = store or PrecomputedRecommendationStore()
+    blocks = iter_recommendation_blocks(snapshot, top_n=top_n, block_size=block_size)
+    written = 0
+    try:
+        while True:
+            block = await asyncio.to_thread(next, blocks, None)
+            if block is None:
+                break
+            await store.save_block(snapshot.version, block)
+            written += len(block)
+
+        logger.info(f"Precomputed recommendations for {written} feeds (model version {snapshot.version}).")
+        return written
+
+    except RedisError as e:
+        logger.error(f"Failed to store precomputed recommendations: {e}", exc_info=True)
+        return 0
@@ -1,10 +1,11 @@
 import logging
-from typing import List
+from typing import List, Dict, Any
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, raiseload, noload
+from sqlalchemy.orm import selectinload
 
 from app.F7_models.feeds import Feed
+from app.F7_models.categories import Category
 
 logger = logging.getLogger(__name__)
 
@@ -15,34 +16,50 @@ class RecommendationRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_all_feeds_for_fitting(self) -> List[Feed]:
+    async def get_all_feeds_for_fitting(self) -> List[Dict[str, Any]]:
         """
         추천 엔진 학습에 필요한 모든 피드의 최소 정보를 조회함.
-        성능을 위해 category 정보만 Eager Loading하고 나머지는 로드하지 않음.
+        - Feed ORM 객체 대신 학습에 필요한 컬럼만 투영하여 summary/original_text 등 큰 컬럼을 읽지 않음.
+        반환: [{"id", "title", "category_id", "category_name", "organization_id", "published_date"}, ...]
         """
         try:
-            stmt = (
-                # 💥 Feed 객체 전체를 선택하도록 수정
-                select(Feed)
-                .options(
-                    # category 관계는 반드시 필요하므로 Eager Loading
-                    selectinload(Feed.category),
-                    # 다른 불필요한 관계(organization, bookmarks 등)는 로드하지 않도록 하여 성능 최적화
-                    noload(Feed.organization),
-                    noload(Feed.bookmarks),
-                    noload(Feed.ratings)
-                )
-                .where(Feed.is_active == True)
-            )
-            result = await self.db.execute(stmt)
-            # 💥 이제 scalars()와 unique()를 사용하여 Feed 객체 리스트를 올바르게 가져올 수 있음
-            feeds = result.scalars().unique().all()
-            return feeds
-        
+            result = await self.db.execute(self._fitting_columns_stmt())
+            return [dict(row) for row in result.mappings().all()]
+
         except Exception as e:
             logger.error(f"Error getting all feeds for fitting: {e}", exc_info=True)
             return []
 
+    async def get_feeds_for_fitting_after(self, last_feed_id: int) -> List[Dict[str, Any]]:
+        """
+        주어진 피드 ID 이후에 추가된 피드의 학습용 정보를 조회함. (증분 업데이트용)
+        반환 형식은 get_all_feeds_for_fitting과 동일함.
+        """
+        try:
+            stmt = self._fitting_columns_stmt().where(Feed.id > last_feed_id)
+            result = await self.db.execute(stmt)
+            return [dict(row) for row in result.mappings().all()]
+
+        except Exception as e:
+            logger.error(f"Error getting new feeds for fitting after id {last_feed_id}: {e}", exc_info=True)
+            return []
+
+    def _fitting_columns_stmt(self):
+        """학습에 필요한 컬럼만 투영하는 기본 조회문 (활성 피드, ID 오름차순)."""
+        return (
+            select(
+                Feed.id,
+                Feed.title,
+                Feed.category_id,
+                Category.name.label("category_name"),
+                Feed.organization_id,
+                Feed.published_date,
+            )
+            .join(Category, Feed.category_id == Category.id)
+            .where(Feed.is_active == True)
+            .order_by(Feed.id)
+        )
+
     async def get_feeds_by_ids(self, feed_ids: List[int]) -> List[Feed]:
         """
         주어진 ID 목록에 해당하는 피드들의 상세 정보를 조회합니다.
@@ -1,7 +1,10 @@
 import logging
-from typing import Union, List, Dict, Tuple
+from typing import Awaitable, Callable, Union, List, Dict, Tuple, Optional
+
+from redis.exceptions import RedisError
 
 from app.F13_recommendations.engine import RecommendationEngine, PRESS_RELEASE_CATEGORY_NAME
+from app.F13_recommendations.precompute import PrecomputedRecommendationStore, RecommendationTable
 from app.F13_recommendations.repository import RecommendationRepository
 from app.F6_schemas.recommendation import (
     RecommendationResponse,
@@ -18,49 +21,63 @@ class RecommendationService:
     추천 관련 비즈니스 로직을 처리하는 서비스.
     리포지토리와 추천 엔진을 사용하여 최종 추천 결과를 생성함.
     """
-    def __init__(self, repo: RecommendationRepository, engine: RecommendationEngine):
+    def __init__(
+        self,
+        repo: RecommendationRepository,
+        engine: RecommendationEngine,
+        precomputed_store: Optional[PrecomputedRecommendationStore] = None,
+        reload_model: Optional[Callable[[], Awaitable[bool]]] = None,
+    ):
         self.repo = repo
         self.engine = engine
+        self.precomputed_store = precomputed_store
+        # 엔진이 준비되지 않았을 때 공유 artifact를 불러오는 함수 (EngineManager.reload_if_changed)
+        self.reload_model = reload_model
 
     async def get_recommendations_for_feed(self, feed_id: int) -> Union[RecommendationResponse, ErrorResponse]:
         """
         특정 피드에 대한 콘텐츠 기반 추천 목록을 반환함.
-        엔진이 학습되지 않은 경우, 실시간으로 학습하여 추천을 제공함 (프로토타입 단계).
+        엔진이 아직 준비되지 않은 경우 저장된 artifact를 불러오고, 그래도 없으면 빈 결과를 반환함 (요청 처리 중에 학습하지 않음).
         """
         try:
-            # 1. 추천 엔진이 학습되었는지 확인. 안 되었다면 실시간으로 학습시킴.
-            # FIXME: 운영 환경에서는 이 로직이 서버 시작 시점에만 실행되어야 함. (dependencies.py에서 처리 예정)
-            if not self.engine.feeds:
-                logger.info("Recommendation engine is not fitted. Fitting in real-time...")
-                all_feeds = await self.repo.get_all_feeds_for_fitting()
-                if not all_feeds:
-                    # 추천할 데이터가 없으므로 빈 결과를 반환함
-                    return self._create_empty_recommendation_response()
-                self.engine.fit(all_feeds)
+            # 1. 추천 엔진이 준비되었는지 확인. 안 되었다면(다른 워커가 최초 학습 중 등) 저장된 artifact를 불러옴.
+            #    학습은 이벤트 루프를 막으므로 요청 처리 중에는 하지 않고, 모델이 없으면 빈 결과를 반환함
+            if not self.engine.is_fitted and self.reload_model is not None:
+                await self.reload_model()
+            snapshot = self.engine.snapshot
+            if snapshot is None:
+                logger.warning("Recommendation engine is not fitted yet. Returning empty recommendations.")
+                return self._create_empty_recommendation_response()
 
-            # 2. 기준 피드 정보 조회
-            # engine.feeds는 최소 정보만 가지므로, category.name을 위해 순회하여 찾음.
-            source_feed = next((feed for feed in self.engine.feeds if feed.id == feed_id), None)
-            
-            if not source_feed:
-                return ErrorResponse(error=ErrorDetail(code=ErrorCode.NOT_FOUND, message=Message.FEED_NOT_FOUND))
+            # 2. 현재 스냅샷 버전으로 사전 계산된 추천 테이블(Redis)을 먼저 조회함.
+            #    없으면(신규 피드, 아직 계산 중인 버전, Redis 장애 등) 실시간으로 계산함.
+            precomputed = await self._get_precomputed_recommendations(feed_id, snapshot.version)
+            if precomputed is not None:
+                main_reco_tuples, sub_reco_tuples = precomputed["main"], precomputed["sub"]
+            else:
+                # 3. 기준 피드 조회 및 타입(정책자료/보도자료) 판별
+                # 엔진 스냅샷의 ID 인덱스로 O(1) 조회함. 학습 데이터에 없으면 None.
+                is_source_press_release = snapshot.is_press_release(feed_id)
 
-            # 3. 기준 피드의 타입(정책자료/보도자료)을 판별함.
-            is_source_press_release = source_feed.category.name == PRESS_RELEASE_CATEGORY_NAME
+                if is_source_press_release is None:
+                    return ErrorResponse(error=ErrorDetail(code=ErrorCode.NOT_FOUND, message=Message.FEED_NOT_FOUND))
             
-            # 4. 추천 타입에 따라 메인/서브 추천을 실행함.
-            if is_source_press_release:
-                main_reco_type = PRESS_RELEASE_CATEGORY_NAME
-                sub_reco_type = "정책자료" # 보도자료가 아닌 모든 피드
-            else:
-                main_reco_type = "정책자료"
-                sub_reco_type = PRESS_RELEASE_CATEGORY_NAME
+                # 4. 추천 타입에 따라 메인/서브 추천을 실행함.
+                if is_source_press_release:
+                    main_reco_type = PRESS_RELEASE_CATEGORY_NAME
+                    sub_reco_type = "정책자료" # 보도자료가 아닌 모든 피드
+                else:
+                    main_reco_type = "정책자료"
+                    sub_reco_type = PRESS_RELEASE_CATEGORY_NAME
 
-            logger.info(f"[DEBUG] Main reco type: '{main_reco_type}', Sub reco type: '{sub_reco_type}'")
-            main_reco_tuples = self.engine.get_recommendations(feed_id, main_reco_type)
-            sub_reco_tuples = self.engine.get_recommendations(feed_id, sub_reco_type)
+                logger.info(f"[DEBUG] Main reco type: '{main_reco_type}', Sub reco type: '{sub_reco_type}'")
+                # 유사도는 한 번만 계산하고 메인/서브 목록을 함께 받아옴
+                reco_slices = self.engine.get_recommendation_slices(feed_id, [main_reco_type, sub_reco_type])
+                if reco_slices is None:
+                    return ErrorResponse(error=ErrorDetail(code=ErrorCode.NOT_FOUND, message=Message.FEED_NOT_FOUND))
+                main_reco_tuples = reco_slices[main_reco_type]
+                sub_reco_tuples = reco_slices[sub_reco_type]
 
-            
             # 5. 추천된 피드 ID 목록을 통합하여 DB에서 한 번에 조회함.
             all_reco_ids = list(set([feed_id for feed_id, score in main_reco_tuples] + [feed_id for feed_id, score in sub_reco_tuples]))
             recommended_feeds_map = {feed.id: feed for feed in await self.repo.get_feeds_by_ids(all_reco_ids)}
@@ -81,6 +98,16 @@ class RecommendationService:
             logger.error(f"Error getting recommendations for feed_id {feed_id}: {e}", exc_info=True)
             return ErrorResponse(error=ErrorDetail(code=ErrorCode.INTERNAL_ERROR, message=Message.INTERNAL_ERROR))
 
+    async def _get_precomputed_recommendations(self, feed_id: int, version: str) -> Optional[RecommendationTable]:
+        """주어진 모델 버전의 사전 계산된 추천 목록을 조회함. 저장소가 없거나 조회에 실패하면 None을 반환하여 실시간 계산으로 넘어감."""
+        if self.precomputed_store is None:
+            return None
+        try:
+            return await self.precomputed_store.get(feed_id, version)
+        except RedisError as e:
+            logger.warning(f"Failed to read precomputed recommendations for feed_id {feed_id}: {e}")
+            return None
+
     def _format_recommendations(self, reco_tuples: List[Tuple[int, float]], feeds_map: Dict[int, Feed]) -> List[RecommendedFeedItem]:
         """추천 결과 (ID, 점수)와 실제 Feed 객체를 조합하여 응답 스키마 형태로 변환함."""
         results = []
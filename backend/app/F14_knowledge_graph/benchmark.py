@@ -0,0 +1,398 @@
+"""
+지식 그래프 ETL 파이프라인(pipeline.py) 오프라인 벤치마크 하니스.
+
+운영 DB 덤프, Neo4j, Elasticsearch 없이도 파이프라인을 프로파일링할 수 있도록
+- 합성 코퍼스(한국어 형태의 제목/본문, 기관, 카테고리, 사용자, 북마크, 평점, 검색 로그)를 생성하고,
+- MySQL / ES / Neo4j I/O를 메모리 내 대역(stand-in)으로 대체하여,
+- Transform -> Load -> 그래프 추출 -> Node2Vec 학습까지 단계별 소요 시간과 메모리를 측정함.
+
+사용법 (backend 디렉토리에서 실행):
+    PYTHONPATH=. python app/F14_knowledge_graph/benchmark.py --feeds 1000
+    PYTHONPATH=. python app/F14_knowledge_graph/benchmark.py --feeds 10000 --mode streaming --skip-node2vec
+"""
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Tuple, Iterator
+from unittest.mock import patch
+
+from app.F7_models.feeds import ContentTypeEnum
+from app.F14_knowledge_graph import pipeline
+from app.F14_knowledge_graph.graph_ml import fetch_graph_data_from_neo4j, train_and_save_node2vec_model
+from app.F14_knowledge_graph.pipeline import MysqlData, PdfTextData, SearchLogData
+
+logger = logging.getLogger(__name__)
+
+# 벤치마크 결과 한 줄: (단계 이름, 소요 시간(초), 단계 중 최대 추가 메모리(MB))
+StageResult = Tuple[str, float, float]
+
+# 미리 정의된 규모 (피드 수 기준)
+SCALE_PRESETS = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+MB = 1024 * 1024
+
+
+# =================================== 합성 코퍼스 ===================================
+# Kiwi가 일반/고유 명사(NNG/NNP)로 인식할 수 있는 실제 정책 분야 명사들.
+# 빈도는 지프(Zipf) 분포를 따르도록 뽑아서 실제 코퍼스처럼 소수의 키워드가 자주 등장하게 함.
+_NOUNS = [
+    "정책", "정부", "국민", "지원", "사업", "예산", "경제", "일자리", "청년", "주택",
+    "부동산", "교육", "학교", "학생", "교사", "보건", "의료", "병원", "복지", "연금",
+    "노인", "아동", "보육", "출산", "인구", "지역", "도시", "농촌", "농업", "어업",
+    "환경", "기후", "탄소", "에너지", "전력", "원전", "수소", "교통", "철도", "도로",
+    "항공", "해양", "항만", "물류", "산업", "기업", "중소기업", "창업", "투자", "수출",
+    "무역", "관세", "세금", "재정", "금융", "은행", "대출", "금리", "물가", "소비",
+    "고용", "노동", "임금", "근로자", "안전", "재난", "소방", "경찰", "치안", "국방",
+    "외교", "통일", "문화", "예술", "관광", "체육", "과학", "기술", "연구", "인공지능",
+    "데이터", "디지털", "플랫폼", "통신", "보안", "개인정보", "행정", "공무원", "법률", "제도",
+    "개정", "시행", "발표", "계획", "전략", "방안", "대책", "협력", "협약", "간담회",
+]
+_SUBJECT_PARTICLES = ["은", "는", "이", "가"]
+_OBJECT_PARTICLES = ["을", "를"]
+_PREDICATES = [
+    "추진한다", "발표했다", "강화한다", "확대한다", "개선한다", "지원한다",
+    "점검했다", "논의했다", "마련했다", "시행한다", "검토하고 있다", "개최했다",
+]
+_TITLE_SUFFIXES = ["추진", "발표", "시행", "확대", "강화", "개선 방안", "종합 대책", "지원 계획"]
+_ORG_SUFFIXES = ["부", "청", "처", "위원회", "공단"]
+_CATEGORY_NAMES = ["보도자료", "정책뉴스", "정책자료", "연구보고서", "통계", "공지"]
+
+
+def _zipf_weights(size: int, exponent: float = 1.1) -> List[float]:
+    """(Sub-Helper) 순위 r에 1/r^exponent 비례 가중치를 부여한 리스트를 반환함."""
+    return [1.0 / ((rank + 1) ** exponent) for rank in range(size)]
+
+
+def _make_sentence(rng: random.Random, weights: List[float]) -> str:
+    """(Sub-Helper) '명사 명사은 명사를 서술어.' 형태의 한국어 문장을 하나 생성함."""
+    subject, modifier, obj = rng.choices(_NOUNS, weights=weights, k=3)
+    return (
+        f"{modifier} {subject}{rng.choice(_SUBJECT_PARTICLES)} "
+        f"{obj}{rng.choice(_OBJECT_PARTICLES)} {rng.choice(_PREDICATES)}."
+    )
+
+
+def generate_synthetic_corpus(
+    num_feeds: int,
+    seed: int = 42,
+    body_sentences: int = 20,
+    pdf_ratio: float = 0.3,
+) -> Tuple[MysqlData, PdfTextData, SearchLogData]:
+    """
+    _extract_from_mysql / _extract_text_from_pdfs / _extract_search_logs_from_es 의
+    반환 형태와 동일한 합성 데이터를 생성함.
+    - 기관, 사용자, 북마크, 평점, 검색 로그 수는 피드 수에 비례하여 정해짐.
+    - 같은 seed로 호출하면 항상 같은 코퍼스가 생성됨.
+    """
+    rng = random.Random(seed)
+    weights = _zipf_weights(len(_NOUNS))
+
+    num_orgs = max(5, num_feeds // 200)
+    num_users = max(10, num_feeds // 5)
+
+    organizations = [
+        {"id": org_id, "name": f"{_NOUNS[(org_id - 1) % len(_NOUNS)]}{_ORG_SUFFIXES[org_id % len(_ORG_SUFFIXES)]}{org_id}"}
+        for org_id in range(1, num_orgs + 1)
+    ]
+
+    categories = []
+    categories_by_org: Dict[int, List[int]] = {}
+    for org in organizations:
+        for name in _CATEGORY_NAMES:
+            category_id = len(categories) + 1
+            categories.append({"id": category_id, "name": name, "organization_id": org["id"]})
+            categories_by_org.setdefault(org["id"], []).append(category_id)
+
+    users = [
+        {"id": user_pk, "user_id": f"user{user_pk:06d}", "nickname": f"사용자{user_pk}"}
+        for user_pk in range(1, num_users + 1)
+    ]
+
+    feeds = []
+    pdf_texts: PdfTextData = {}
+    base_date = datetime(2025, 1, 1)
+    for feed_id in range(1, num_feeds + 1):
+        org_id = rng.randint(1, num_orgs)
+        head, tail = rng.choices(_NOUNS, weights=weights, k=2)
+        body = " ".join(_make_sentence(rng, weights) for _ in range(body_sentences))
+        is_pdf = rng.random() < pdf_ratio
+
+        feeds.append({
+            "id": feed_id,
+            "title": f"{head} {tail} {rng.choice(_TITLE_SUFFIXES)}",
+            "summary": " ".join(_make_sentence(rng, weights) for _ in range(2)),
+            "content_type": ContentTypeEnum.PDF if is_pdf else ContentTypeEnum.TEXT,
+            "pdf_file_path": f"synthetic/{feed_id}.pdf" if is_pdf else None,
+            "original_text": None if is_pdf else body,
+            "organization_id": org_id,
+            "category_id": rng.choice(categories_by_org[org_id]),
+            "published_date": base_date + timedelta(minutes=feed_id * 7),
+        })
+        if is_pdf:
+            pdf_texts[feed_id] = body
+
+    # (user_id, feed_id) 쌍은 실제 테이블처럼 중복되지 않도록 함
+    def _unique_pairs(count: int) -> List[Tuple[int, int]]:
+        pairs = set()
+        while len(pairs) < min(count, num_users * num_feeds):
+            pairs.add((rng.randint(1, num_users), rng.randint(1, num_feeds)))
+        return sorted(pairs)
+
+    bookmarks = [{"user_id": u, "feed_id": f} for u, f in _unique_pairs(num_feeds * 2)]
+    ratings = [{"user_id": u, "feed_id": f, "score": rng.randint(1, 5)} for u, f in _unique_pairs(num_feeds * 2)]
+
+    # 운영 쿼리와 동일하게 검색 로그는 최대 10,000건
+    search_logs: SearchLogData = [
+        (
+            "anonymous" if rng.random() < 0.4 else str(rng.randint(1, num_users)),
+            rng.choices(_NOUNS, weights=weights, k=1)[0],
+        )
+        for _ in range(min(10_000, num_feeds * 2))
+    ]
+
+    mysql_data: MysqlData = {
+        "users": users,
+        "organizations": organizations,
+        "categories": categories,
+        "feeds": feeds,
+        "bookmarks": bookmarks,
+        "ratings": ratings,
+    }
+    return mysql_data, pdf_texts, search_logs
+
+
+# =================================== I/O 대역(stand-in) ===================================
+class _InMemoryStreamResult:
+    """AsyncSession.stream()이 반환하는 AsyncResult의 최소 대역. 요청된 컬럼만 청크 단위로 반환함."""
+    def __init__(self, rows: List[Dict[str, Any]], keys: List[str]):
+        self._rows = rows
+        self._keys = keys
+
+    def mappings(self) -> "_InMemoryStreamResult":
+        return self
+
+    async def partitions(self, size: int):
+        for start in range(0, len(self._rows), size):
+            yield [{key: row[key] for key in self._keys} for row in self._rows[start:start + size]]
+
+    async def close(self):
+        pass
+
+
+class InMemorySession:
+    """
+    스트리밍 Extract에서 사용하는 AsyncSession.stream()만 흉내내는 메모리 내 MySQL 대역.
+    - SELECT 문의 첫 번째 컬럼이 속한 테이블 이름으로 합성 데이터를 찾음.
+    """
+    def __init__(self, mysql_data: MysqlData):
+        self._tables = mysql_data
+
+    async def stream(self, stmt) -> _InMemoryStreamResult:
+        columns = list(stmt.selected_columns)
+        table_name = columns[0].table.name
+        return _InMemoryStreamResult(self._tables[table_name], [column.key for column in columns])
+
+
+class _InMemoryRecord:
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def data(self) -> Dict[str, Any]:
+        return self._data
+
+
+class _InMemoryNeo4jResult:
+    def __init__(self, records: List[Dict[str, Any]]):
+        self._records = records
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for record in self._records:
+            yield _InMemoryRecord(record)
+
+
+class _InMemoryNeo4jSession:
+    def __init__(self, driver: "InMemoryNeo4jDriver"):
+        self._driver = driver
+
+    async def __aenter__(self) -> "_InMemoryNeo4jSession":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def run(self, query: str, **params) -> _InMemoryNeo4jResult:
+        # fetch_graph_data_from_neo4j가 사용하는 '모든 관계 조회' 쿼리만 지원함
+        return _InMemoryNeo4jResult(self._driver.relationship_records())
+
+
+class InMemoryNeo4jDriver:
+    """
+    phase_load와 fetch_graph_data_from_neo4j가 사용하는 AsyncDriver API만 흉내내는 Neo4j 대역.
+    - 노드/관계 적재 쿼리의 파라미터를 저장해 두었다가, 그래프 추출 시 관계 레코드로 돌려줌.
+    - 실제 Cypher처럼 양 끝 노드가 존재하는 관계만 생성된 것으로 간주함.
+    """
+    def __init__(self):
+        self.node_keys: set = set()
+        self.relationships: List[Dict[str, Any]] = []
+
+    async def execute_query(self, query: str, database_: str | None = None, **params):
+        for node in params.get("nodes", []):
+            self.node_keys.add((node["label"], node["id"]))
+        for rel in params.get("relationships", []):
+            if (rel["start_node_label"], rel["start_node_id"]) in self.node_keys \
+                    and (rel["end_node_label"], rel["end_node_id"]) in self.node_keys:
+                self.relationships.append(rel)
+
+    def session(self) -> _InMemoryNeo4jSession:
+        return _InMemoryNeo4jSession(self)
+
+    def relationship_records(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "source_id": rel["start_node_id"], "source_label": rel["start_node_label"],
+                "target_id": rel["end_node_id"], "target_label": rel["end_node_label"],
+                "relationship_type": rel["type"],
+            }
+            for rel in self.relationships
+        ]
+
+
+@contextmanager
+def _patched_external_io(pdf_texts: PdfTextData, search_logs: SearchLogData) -> Iterator[None]:
+    """파이프라인 내부의 PDF 파일 읽기와 Elasticsearch 검색 로그 조회를 합성 데이터로 대체함."""
+    def _read_synthetic_pdf(pdf_path: str) -> str | None:
+        feed_id = int(os.path.splitext(os.path.basename(pdf_path))[0])
+        return pdf_texts.get(feed_id)
+
+    with patch.object(pipeline, "_read_pdf_text", _read_synthetic_pdf), \
+            patch.object(pipeline, "_extract_search_logs_from_es", lambda: list(search_logs)):
+        yield
+
+
+# =================================== 측정 ===================================
+@contextmanager
+def _measure(stage: str, results: List[StageResult]) -> Iterator[None]:
+    """블록 실행 시간과, 블록 시작 시점 대비 최대 추가 메모리 사용량(tracemalloc 기준)을 기록함."""
+    gc.collect()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        results.append((stage, elapsed, (peak - baseline) / MB))
+        logger.info(f"[benchmark] {stage}: {elapsed:.2f}s, peak +{(peak - baseline) / MB:.1f}MB")
+
+
+async def run_benchmark(
+    num_feeds: int,
+    mode: str = "streaming",
+    chunk_size: int = pipeline.STREAM_CHUNK_SIZE,
+    seed: int = 42,
+    body_sentences: int = 20,
+    skip_node2vec: bool = False,
+    num_walks: int = 10,
+    walk_length: int = 20,
+) -> List[StageResult]:
+    """
+    합성 코퍼스로 파이프라인 전체 단계를 실행하고 단계별 측정 결과를 반환함.
+    - mode: 'batch'(phase_transform -> phase_load) 또는 'streaming'(phase_extract_transform_load_streaming)
+    """
+    results: List[StageResult] = []
+    tracemalloc.start()
+    try:
+        with _measure("generate_corpus", results):
+            mysql_data, pdf_texts, search_logs = generate_synthetic_corpus(
+                num_feeds, seed=seed, body_sentences=body_sentences
+            )
+
+        driver = InMemoryNeo4jDriver()
+        if mode == "batch":
+            with _measure("transform_batch", results):
+                nodes, relationships = pipeline.phase_transform(mysql_data, pdf_texts, search_logs)
+            with _measure("load", results):
+                await pipeline.phase_load(driver, (nodes, relationships))
+            del nodes, relationships
+        else:
+            # 스트리밍 모드는 청크마다 바로 적재하므로 Transform과 Load를 한 단계로 측정함
+            with _measure("extract_transform_load_streaming", results), _patched_external_io(pdf_texts, search_logs):
+                await pipeline.phase_extract_transform_load_streaming(
+                    InMemorySession(mysql_data), driver, chunk_size=chunk_size
+                )
+
+        with _measure("fetch_graph", results):
+            graph = await fetch_graph_data_from_neo4j(driver)
+
+        if not skip_node2vec:
+            with tempfile.TemporaryDirectory() as tmp_dir, _measure("node2vec", results):
+                train_and_save_node2vec_model(
+                    graph,
+                    save_path=os.path.join(tmp_dir, "node_embeddings.pkl"),
+                    num_walks=num_walks,
+                    walk_length=walk_length,
+                )
+    finally:
+        tracemalloc.stop()
+
+    return results
+
+
+def _format_report(num_feeds: int, mode: str, results: List[StageResult]) -> str:
+    lines = [
+        f"=== Knowledge Graph ETL benchmark (feeds={num_feeds}, mode={mode}) ===",
+        f"{'stage':<30}{'seconds':>10}{'peak MB':>12}",
+    ]
+    for stage, elapsed, peak_mb in results:
+        lines.append(f"{stage:<30}{elapsed:>10.2f}{peak_mb:>12.1f}")
+    lines.append(f"{'total':<30}{sum(r[1] for r in results):>10.2f}")
+    return "\n".join(lines)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="지식 그래프 ETL 파이프라인 오프라인 벤치마크")
+    parser.add_argument("--feeds", default="1k", help="피드 수 (1k / 10k / 100k 또는 정수)")
+    parser.add_argument("--mode", choices=["batch", "streaming", "both"], default="both")
+    parser.add_argument("--chunk-size", type=int, default=pipeline.STREAM_CHUNK_SIZE)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--body-sentences", type=int, default=20, help="피드 본문 문장 수")
+    parser.add_argument("--skip-node2vec", action="store_true")
+    parser.add_argument("--num-walks", type=int, default=10)
+    parser.add_argument("--walk-length", type=int, default=20)
+    return parser.parse_args()
+
+
+async def main():
+    args = _parse_args()
+    num_feeds = SCALE_PRESETS.get(args.feeds) or int(args.feeds)
+    modes = ["batch", "streaming"] if args.mode == "both" else [args.mode]
+
+    for mode in modes:
+        results = await run_benchmark(
+            num_feeds,
+            mode=mode,
+            chunk_size=args.chunk_size,
+            seed=args.seed,
+            body_sentences=args.body_sentences,
+            skip_node2vec=args.skip_node2vec,
+            num_walks=args.num_walks,
+            walk_length=args.walk_length,
+        )
+        print(_format_report(num_feeds, mode, results))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
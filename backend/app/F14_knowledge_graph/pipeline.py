@@ -4,8 +4,10 @@ import os
 import fitz
 import re
 import enum
+from collections import defaultdict
+from datetime import datetime
 from elasticsearch import Elasticsearch
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, AsyncIterator, Awaitable, Callable, Iterable, Iterator
 
 # --- 데이터 융합을 위한 작업 ---
 import numpy as np
@@ -23,12 +25,14 @@ from sqlalchemy.orm import sessionmaker
 # --- 프로젝트 모델 임포트 ---
 # (settings와 모델 경로는 실제 프로젝트 구조에 맞게 조정 필요)
 from app.F5_core.config import settings
+from app.F5_core.response_cache import invalidate_cache_tags, CACHE_TAG_WORDCLOUD
 from app.F7_models.users import User
 from app.F7_models.organizations import Organization
 from app.F7_models.categories import Category
 from app.F7_models.feeds import Feed, ContentTypeEnum
 from app.F7_models.bookmarks import Bookmark
 from app.F7_models.ratings import Rating
+from app.F3_repositories.keyword import KeywordRepository
 
 # --- neo4j ---
 from neo4j import AsyncGraphDatabase, AsyncDriver
@@ -45,6 +49,21 @@ MysqlData = Dict[str, List[Dict[str, Any]]]
 PdfTextData = Dict[int, str]
 SearchLogData = List[Tuple[str, str]]
 TransformedData = Tuple[List[Dict[str, Any]], List[Dict[str, Any]]] # (nodes, relationships)
+RowChunk = List[Dict[str, Any]]
+KeywordWeightData = Tuple[Dict[int, Dict[str, List[float]]], Dict[str, List[float]]] # (기관별, 전역) {keyword: [점수, 빈도]}
+
+# --- 스트리밍 Extract 설정 ---
+# 서버 사이드 커서(yield_per)로 한 번에 가져올 행 수.
+# 스트리밍 모드의 피크 메모리는 전체 코퍼스 크기가 아니라 이 값에 비례함.
+STREAM_CHUNK_SIZE = 500
+
+# --- 키워드 인기도/워드클라우드 적재 설정 ---
+# 기관별·전역 워드클라우드에 저장할 상위 키워드 수 (/graph/wordcloud 의 limit 최대값과 동일)
+WORD_CLOUD_TOP_N = 50
+# 검색 1회당 가산점 (GraphRepository.get_keywords_by_popularity의 Cypher 점수식과 동일)
+SEARCH_WEIGHT = 1.5
+# MySQL에 보존할 최근 집계 기간 수
+KEYWORD_PERIODS_TO_KEEP = 7
 
 # --- 형태소 분석기(일단 한국어 전용이라는데 기타 설정 등은 안한 상태) ---
 def kiwi_tokenizer(text: str) -> List[str]:
@@ -172,33 +191,40 @@ def _extract_text_from_pdfs(feeds: List[Dict[str, Any]]) -> PdfTextData:
         if not feed_id or not relative_path:
             continue
 
-        pdf_path = os.path.join(base_path, relative_path)
-        print(f"Checking path: {pdf_path} | Exists: {os.path.exists(pdf_path)}")
-
-
-        try:
-            # 파일 존재 여부 확인
-            if not os.path.exists(pdf_path):
-                logger.warning(f"PDF 파일 없음 (건너뜀): {pdf_path}")
-                continue
-            
-            # PDF 파일을 열고 모든 페이지의 텍스트를 추출하여 결합함
-            doc = fitz.open(pdf_path)
-            full_text = ""
-            for page in doc:
-                full_text += page.get_text()
-            
+        full_text = _read_pdf_text(os.path.join(base_path, relative_path))
+        if full_text is not None:
             extracted_texts[feed_id] = full_text
-            doc.close()
-
-        except Exception as e:
-            # PyMuPDF 처리 중 발생할 수 있는 모든 예외를 처리함
-            logger.error(f"PDF 처리 오류 (건너뜀): {pdf_path} | 오류: {e}")
-            continue
             
     return extracted_texts
 
 
+def _read_pdf_text(pdf_path: str) -> str | None:
+    """
+    (Sub-Helper) PDF 파일 하나의 모든 페이지 텍스트를 결합하여 반환함.
+    - 파일이 없거나 처리 중 오류가 발생하면 None을 반환함.
+    """
+    print(f"Checking path: {pdf_path} | Exists: {os.path.exists(pdf_path)}")
+
+    try:
+        # 파일 존재 여부 확인
+        if not os.path.exists(pdf_path):
+            logger.warning(f"PDF 파일 없음 (건너뜀): {pdf_path}")
+            return None
+        
+        # PDF 파일을 열고 모든 페이지의 텍스트를 추출하여 결합함
+        doc = fitz.open(pdf_path)
+        full_text = ""
+        for page in doc:
+            full_text += page.get_text()
+        doc.close()
+        return full_text
+
+    except Exception as e:
+        # PyMuPDF 처리 중 발생할 수 있는 모든 예외를 처리함
+        logger.error(f"PDF 처리 오류 (건너뜀): {pdf_path} | 오류: {e}")
+        return None
+
+
 def _extract_search_logs_from_es() -> SearchLogData:
     """
     (Helper) Elasticsearch에서 최근 1주일간의 사용자 검색 로그를 추출함.
@@ -332,34 +358,43 @@ def _unify_text_sources(mysql_data: MysqlData, pdf_texts: PdfTextData) -> Tuple[
     all_feed_texts = {}
 
     for feed_id, feed in feed_map.items():
-        # 1. 기본 텍스트: 제목(title)과 요약문(summary)은 항상 포함
-        #    - None 값일 경우를 대비해 빈 문자열('')로 처리
-        title = feed.get('title', '') or ''
-        summary = feed.get('summary', '') or ''
-        
-        # 각 텍스트 요소를 줄바꿈 문자로 명확하게 분리하여 결합
-        full_text_parts = [title, summary]
-
-        # 2. 콘텐츠 타입에 따라 원문(본문) 추가
-        content_type = feed.get('content_type')
-        
-        if content_type == 'text':
-            # content_type이 'text'인 경우, original_text 컬럼의 값을 추가
-            original_text = feed.get('original_text', '') or ''
-            full_text_parts.append(original_text)
-            
-        elif content_type == 'pdf':
-            # content_type이 'pdf'인 경우, Extract 단계에서 추출한 PDF 텍스트를 추가
-            # pdf_texts 딕셔너리에서 해당 feed_id의 텍스트를 찾아옴
-            pdf_content = pdf_texts.get(feed_id, '') or ''
-            full_text_parts.append(pdf_content)
-        
-        # 3. 모든 텍스트 조각을 하나의 긴 문자열로 결합
-        all_feed_texts[feed_id] = "\n".join(filter(None, full_text_parts))
+        all_feed_texts[feed_id] = _build_feed_text(feed, pdf_texts.get(feed_id))
 
     return all_feed_texts, feed_map
 
 
+def _build_feed_text(feed: Dict[str, Any], pdf_text: str | None) -> str:
+    """
+    (Sub-Helper) 피드 하나의 텍스트 소스(title, summary, original_text, pdf_text)를 하나의 문서로 결합함.
+    - 일괄(batch) 모드와 스트리밍 모드가 동일한 문서를 만들도록 공용으로 사용함.
+    """
+    # 1. 기본 텍스트: 제목(title)과 요약문(summary)은 항상 포함
+    #    - None 값일 경우를 대비해 빈 문자열('')로 처리
+    title = feed.get('title', '') or ''
+    summary = feed.get('summary', '') or ''
+    
+    # 각 텍스트 요소를 줄바꿈 문자로 명확하게 분리하여 결합
+    full_text_parts = [title, summary]
+
+    # 2. 콘텐츠 타입에 따라 원문(본문) 추가
+    #    - DB에서는 ContentTypeEnum으로 조회되므로 문자열 값으로 맞춰서 비교함
+    content_type = feed.get('content_type')
+    if isinstance(content_type, enum.Enum):
+        content_type = content_type.value
+    
+    if content_type == 'text':
+        # content_type이 'text'인 경우, original_text 컬럼의 값을 추가
+        original_text = feed.get('original_text', '') or ''
+        full_text_parts.append(original_text)
+        
+    elif content_type == 'pdf':
+        # content_type이 'pdf'인 경우, Extract 단계에서 추출한 PDF 텍스트를 추가
+        full_text_parts.append(pdf_text or '')
+    
+    # 3. 모든 텍스트 조각을 하나의 긴 문자열로 결합
+    return "\n".join(filter(None, full_text_parts))
+
+
 def _vectorize_texts(texts: List[str]) -> Tuple[Any, TfidfVectorizer]:
     """
     (Helper) 통합된 텍스트 모음을 TF-IDF 행렬로 변환함.
@@ -368,9 +403,25 @@ def _vectorize_texts(texts: List[str]) -> Tuple[Any, TfidfVectorizer]:
     """
     logger.info("  - TF-IDF Vectorizer 생성 및 학습 시작...")
 
+    vectorizer = _create_tfidf_vectorizer()
+
+    # .fit_transform(): 텍스트 데이터에 벡터라이저를 학습(fit)시키고,
+    #                  그 결과로 텍스트를 TF-IDF 행렬로 변환(transform)함.
+    # 이 과정이 가장 많은 연산량을 요구하는 부분임.
+    tfidf_matrix = vectorizer.fit_transform(texts)
+    
+    logger.info(f"  - TF-IDF 행렬 생성 완료. (크기: {tfidf_matrix.shape})")
+
+    # 다음 단계(유사도 계산, 키워드 추출)에서 사용하기 위해
+    # 변환된 행렬과 학습이 완료된 벡터라이저 객체를 모두 반환함.
+    return tfidf_matrix, vectorizer
+
+
+def _create_tfidf_vectorizer() -> TfidfVectorizer:
+    """(Sub-Helper) 파이프라인 전체에서 공통으로 사용하는 TfidfVectorizer 설정을 생성함."""
     # TfidfVectorizer 객체 생성.
     # 이 객체가 NLP의 핵심적인 연산을 수행함.
-    vectorizer = TfidfVectorizer(
+    return TfidfVectorizer(
         # tokenizer: 텍스트를 어떤 단위(토큰)로 쪼갤지 결정하는 함수.
         #           우리가 만든 kiwi_tokenizer를 지정하여 한국어 명사 기반으로 작동하게 함.
         tokenizer=kiwi_tokenizer,
@@ -394,17 +445,6 @@ def _vectorize_texts(texts: List[str]) -> Tuple[Any, TfidfVectorizer]:
         ngram_range=(1, 2)
     )
 
-    # .fit_transform(): 텍스트 데이터에 벡터라이저를 학습(fit)시키고,
-    #                  그 결과로 텍스트를 TF-IDF 행렬로 변환(transform)함.
-    # 이 과정이 가장 많은 연산량을 요구하는 부분임.
-    tfidf_matrix = vectorizer.fit_transform(texts)
-    
-    logger.info(f"  - TF-IDF 행렬 생성 완료. (크기: {tfidf_matrix.shape})")
-
-    # 다음 단계(유사도 계산, 키워드 추출)에서 사용하기 위해
-    # 변환된 행렬과 학습이 완료된 벡터라이저 객체를 모두 반환함.
-    return tfidf_matrix, vectorizer
-
 
 def _get_top_keywords(tfidf_vector, vectorizer, top_n=10) -> List[Tuple[str, float]]:
     """(Sub-Helper) 특정 문서의 TF-IDF 벡터에서 상위 N개의 키워드와 점수를 추출함."""
@@ -449,17 +489,7 @@ def _structure_graph_data(
     ])
 
     # RATED 관계 (점수별로 세분화)
-    for rating in mysql_data['ratings']:
-        score = rating['score']
-        if score >= 4: rel_type = 'RATED_POSITIVELY'
-        elif score == 3: rel_type = 'RATED_NORMALLY'
-        else: rel_type = 'RATED_NEGATIVELY'
-        relationships.append({
-            'start_node': ('User', rating['user_id']),
-            'end_node': ('Feed', rating['feed_id']),
-            'type': rel_type,
-            'properties': {'score': score}
-        })
+    relationships.extend([_rating_to_relationship(rating) for rating in mysql_data['ratings']])
     # 기타 MySQL 기반 관계
     relationships.extend([
         {'start_node': ('User', bm['user_id']), 'end_node': ('Feed', bm['feed_id']), 'type': 'BOOKMARKED'}
@@ -527,6 +557,272 @@ def _structure_graph_data(
     return nodes, relationships
 
 
+def _rating_to_relationship(rating: Dict[str, Any]) -> Dict[str, Any]:
+    """(Sub-Helper) 평점 한 건을 점수별로 세분화된 RATED_* 관계로 변환함."""
+    score = rating['score']
+    if score >= 4: rel_type = 'RATED_POSITIVELY'
+    elif score == 3: rel_type = 'RATED_NORMALLY'
+    else: rel_type = 'RATED_NEGATIVELY'
+    return {
+        'start_node': ('User', rating['user_id']),
+        'end_node': ('Feed', rating['feed_id']),
+        'type': rel_type,
+        'properties': {'score': score}
+    }
+
+
+# ============================ STREAMING (EXTRACT + TRANSFORM + LOAD) ============================
+# 일괄 모드(phase_extract -> phase_transform -> phase_load)는 모든 테이블과 피드 본문(original_text, PDF 텍스트),
+# N x N 크기의 유사도 행렬, 그리고 전체 노드/관계 목록을 한꺼번에 메모리에 올림.
+# 스트리밍 모드는 서버 사이드 커서로 필요한 컬럼만 청크 단위로 읽으면서 바로 노드/관계로 변환하여 Neo4j에 적재하고 버림.
+# 피드 본문은 제너레이터로 TF-IDF에 흘려보낸 뒤 버리고, 유사도도 청크 단위 블록으로 계산함.
+
+async def _stream_rows(db: AsyncSession, stmt, chunk_size: int) -> AsyncIterator[RowChunk]:
+    """
+    (Helper) 주어진 SELECT 문을 서버 사이드 커서(yield_per)로 실행하여 청크 단위로 반환함.
+    - 한 번에 chunk_size개의 행만 메모리에 올라옴.
+    """
+    result = await db.stream(stmt.execution_options(yield_per=chunk_size))
+    try:
+        async for partition in result.mappings().partitions(chunk_size):
+            yield [dict(row) for row in partition]
+    finally:
+        # 소비가 중간에 멈춰도 서버 사이드 커서를 반드시 닫음
+        await result.close()
+
+
+async def _stream_feed_documents(
+    db: AsyncSession,
+    chunk_size: int,
+    on_chunk: Callable[[List[Dict[str, Any]], List[Dict[str, Any]]], Awaitable[None]],
+) -> AsyncIterator[List[Tuple[int, str]]]:
+    """
+    (Helper) 피드를 청크 단위로 읽어 (feed_id, 통합 텍스트) 목록을 반환함.
+    - 각 청크의 Feed 노드와 PUBLISHED/BELONGS_TO 관계를 구조화하여 on_chunk(nodes, relationships)로 넘김 (바로 적재됨).
+    - 본문(original_text, PDF 텍스트)은 문서를 만든 뒤 바로 버리므로 노드 속성에는 포함하지 않음.
+    """
+    stmt = select(
+        Feed.id, Feed.title, Feed.summary,
+        Feed.content_type, Feed.pdf_file_path, Feed.original_text,
+        Feed.organization_id, Feed.category_id, Feed.published_date
+    ).order_by(Feed.id)
+
+    async for chunk in _stream_rows(db, stmt, chunk_size):
+        documents = []
+        nodes: List[Dict[str, Any]] = []
+        relationships: List[Dict[str, Any]] = []
+        for feed in chunk:
+            pdf_text = None
+            if feed.get('content_type') == ContentTypeEnum.PDF and feed.get('pdf_file_path'):
+                pdf_text = _read_pdf_text(os.path.join(PDF_BASE_PATH, feed['pdf_file_path']))
+            documents.append((feed['id'], _build_feed_text(feed, pdf_text)))
+
+            feed.pop('original_text', None)
+            nodes.append({'label': 'Feed', **{k: (v.value if isinstance(v, enum.Enum) else v) for k, v in feed.items()}})
+            relationships.append({'start_node': ('Organization', feed['organization_id']), 'end_node': ('Feed', feed['id']), 'type': 'PUBLISHED'})
+            relationships.append({'start_node': ('Feed', feed['id']), 'end_node': ('Category', feed['category_id']), 'type': 'BELONGS_TO'})
+        await on_chunk(nodes, relationships)
+        yield documents
+
+
+def _iter_documents_blocking(
+    chunks: AsyncIterator[List[Tuple[int, str]]],
+    loop: asyncio.AbstractEventLoop,
+    feed_ids: List[int],
+) -> Iterator[str]:
+    """
+    (Helper) 비동기 청크 스트림을 워커 스레드에서 소비할 수 있는 동기 제너레이터로 변환함.
+    - TfidfVectorizer.fit_transform()은 동기 이터러블만 받기 때문에,
+      다음 청크가 필요할 때마다 이벤트 루프에 요청하여 가져옴 (한 번에 한 청크만 메모리에 존재).
+    - 행렬의 행 순서와 일치하도록 feed_id를 feed_ids 리스트에 차례대로 기록함.
+    """
+    while True:
+        try:
+            chunk = asyncio.run_coroutine_threadsafe(chunks.__anext__(), loop).result()
+        except StopAsyncIteration:
+            return
+        for feed_id, text in chunk:
+            feed_ids.append(feed_id)
+            yield text
+
+
+def _get_top_keywords_from_row(tfidf_matrix, row_index: int, feature_names, top_n: int = 10) -> List[Tuple[str, float]]:
+    """
+    (Sub-Helper) CSR 행렬의 한 행에서 상위 N개의 키워드와 점수를 추출함.
+    - _get_top_keywords와 결과는 같지만, 행을 밀집 벡터로 풀지 않고 0이 아닌 값만 사용함.
+    """
+    start, end = tfidf_matrix.indptr[row_index], tfidf_matrix.indptr[row_index + 1]
+    scores = tfidf_matrix.data[start:end]
+    columns = tfidf_matrix.indices[start:end]
+    if len(scores) > top_n:
+        candidates = np.argpartition(scores, -top_n)[-top_n:]
+    else:
+        candidates = np.arange(len(scores))
+    ordered = candidates[np.argsort(scores[candidates])[::-1]]
+    return [
+        (feature_names[columns[k]], round(float(scores[k]), 4))
+        for k in ordered if scores[k] > 0
+    ]
+
+
+def _iter_similar_feed_pairs(tfidf_matrix, threshold: float, block_size: int) -> Iterator[Tuple[int, int, float]]:
+    """
+    (Helper) 피드 간 코사인 유사도를 행 블록 단위로 계산하여 임계값 이상인 (i, j, score) 쌍을 반환함.
+    - TF-IDF 행은 L2 정규화되어 있으므로 내적이 곧 코사인 유사도임.
+    - N x N 밀집 행렬 대신 block_size x N 희소 블록만 메모리에 올라옴.
+    - 중복을 피하기 위해 상단 삼각형(j > i)만 반환함.
+    """
+    n_rows = tfidf_matrix.shape[0]
+    matrix_t = tfidf_matrix.T.tocsc()
+    for start in range(0, n_rows, block_size):
+        block = (tfidf_matrix[start:start + block_size] @ matrix_t).tocoo()
+        rows = block.row + start
+        mask = (block.col > rows) & (block.data >= threshold)
+        for i, j, score in zip(rows[mask], block.col[mask], block.data[mask]):
+            yield int(i), int(j), float(score)
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """(Helper) 이터러블을 size개씩 묶어 리스트로 반환함."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def phase_extract_transform_load_streaming(
+    db: AsyncSession,
+    driver: AsyncDriver,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    similarity_threshold: float = 0.45,
+) -> KeywordWeightData:
+    """
+    ETL 파이프라인 1~3단계 (스트리밍 모드): Extract + Transform + Load
+    - phase_extract / phase_transform / phase_load와 같은 그래프를 만들지만,
+      원본 데이터를 청크 단위로 읽으면서 바로 노드/관계로 변환하여 Neo4j에 적재하고 버림.
+    - 관계는 양 끝 노드가 적재된 뒤에 적재되도록 순서를 맞춤 (노드 -> 피드 -> 키워드 -> 평점/북마크 -> 유사도 -> 검색).
+    - 키워드 인기도(Materialize 입력)는 관계를 적재하면서 KeywordWeightAccumulator에 누적함.
+    - 코퍼스 크기에 비례해 남는 것: 희소 TF-IDF 행렬과 vocabulary, 행 순서의 feed_id 목록,
+      피드 -> 기관 매핑, 기관별 키워드 가중치. 노드/관계 목록과 피드 본문은 chunk_size만큼만 메모리에 올라옴.
+    반환: 기관별·전역 키워드 가중치 (phase_materialize_keywords 입력)
+    """
+    logger.info(f"--- Phase 1~3: Streaming Extract/Transform/Load 시작 (chunk_size={chunk_size}) ---")
+    keyword_weights = KeywordWeightAccumulator()
+    node_count = 0
+    relationship_count = 0
+
+    async def load_nodes(nodes: List[Dict[str, Any]]):
+        nonlocal node_count
+        node_count += len(nodes)
+        await _load_nodes(driver, nodes)
+
+    async def load_relationships(relationships: List[Dict[str, Any]]):
+        nonlocal relationship_count
+        relationship_count += len(relationships)
+        for rel in relationships:
+            keyword_weights.add(rel)
+        await _load_relationships(driver, relationships)
+
+    async def load_feed_chunk(nodes: List[Dict[str, Any]], relationships: List[Dict[str, Any]]):
+        await load_nodes(nodes)
+        await load_relationships(relationships)
+
+    # 0. Neo4j 초기화 및 제약조건 생성
+    await _prepare_graph(driver)
+
+    # 1. 피드 이외의 노드: 청크 단위로 읽어 바로 적재
+    logger.info("1/6: 사용자/기관/카테고리 노드 스트리밍 적재 중...")
+    async for chunk in _stream_rows(db, select(User.id, User.user_id, User.nickname), chunk_size):
+        await load_nodes([{'label': 'User', **user} for user in chunk])
+    async for chunk in _stream_rows(db, select(Organization.id, Organization.name), chunk_size):
+        await load_nodes([{'label': 'Organization', **org} for org in chunk])
+    async for chunk in _stream_rows(db, select(Category.id, Category.name, Category.organization_id), chunk_size):
+        await load_nodes([{'label': 'Category', **cat} for cat in chunk])
+
+    # 2. 피드 본문: 제너레이터로 TF-IDF에 흘려보냄 (CPU 작업이므로 워커 스레드에서 수행)
+    #    청크를 읽을 때마다 Feed 노드와 PUBLISHED/BELONGS_TO 관계를 적재함
+    logger.info("2/6: 피드 스트리밍 적재 및 TF-IDF 벡터화 진행 중...")
+    feed_ids: List[int] = []
+    documents = _stream_feed_documents(db, chunk_size, load_feed_chunk)
+    vectorizer = _create_tfidf_vectorizer()
+    try:
+        tfidf_matrix = await asyncio.to_thread(
+            vectorizer.fit_transform,
+            _iter_documents_blocking(documents, asyncio.get_running_loop(), feed_ids),
+        )
+    finally:
+        await documents.aclose()
+    tfidf_matrix = tfidf_matrix.tocsr()
+    logger.info(f"  - TF-IDF 행렬 생성 완료. (크기: {tfidf_matrix.shape})")
+
+    # 3. 키워드 노드 및 CONTAINS_KEYWORD 관계
+    logger.info("3/6: NLP 기반 키워드 노드/관계 적재 중...")
+    feature_names = vectorizer.get_feature_names_out()
+    for batch in _batched(feature_names, chunk_size):
+        await load_nodes([{'label': 'Keyword', 'id': keyword, 'name': keyword} for keyword in batch])
+    for batch in _batched(enumerate(feed_ids), chunk_size):
+        await load_relationships([
+            {
+                'start_node': ('Feed', feed_id),
+                'end_node': ('Keyword', keyword),
+                'type': 'CONTAINS_KEYWORD',
+                'properties': {'score': score}
+            }
+            for i, feed_id in batch
+            for keyword, score in _get_top_keywords_from_row(tfidf_matrix, i, feature_names, top_n=10)
+        ])
+
+    # 4. 평점/북마크 관계 (사용자와 피드 노드가 모두 적재된 뒤)
+    logger.info("4/6: 평점/북마크 관계 스트리밍 적재 중...")
+    async for chunk in _stream_rows(db, select(Rating.user_id, Rating.feed_id, Rating.score), chunk_size):
+        await load_relationships([_rating_to_relationship(rating) for rating in chunk])
+    async for chunk in _stream_rows(db, select(Bookmark.user_id, Bookmark.feed_id), chunk_size):
+        await load_relationships([
+            {'start_node': ('User', bm['user_id']), 'end_node': ('Feed', bm['feed_id']), 'type': 'BOOKMARKED'}
+            for bm in chunk
+        ])
+
+    # 5. IS_SIMILAR_TO 관계 (행 블록 단위 유사도 계산)
+    logger.info("5/6: 피드 간 코사인 유사도를 블록 단위로 계산하여 적재 중...")
+    for batch in _batched(_iter_similar_feed_pairs(tfidf_matrix, similarity_threshold, chunk_size), chunk_size):
+        await load_relationships([
+            {
+                'start_node': ('Feed', feed_ids[i]),
+                'end_node': ('Feed', feed_ids[j]),
+                'type': 'IS_SIMILAR_TO',
+                'properties': {'score': round(score, 4)}
+            }
+            for i, j, score in batch
+        ])
+
+    # 6. Elasticsearch 검색 로그 기반 관계
+    logger.info("6/6: 검색 로그 기반 관계 적재 중...")
+    search_logs = _extract_search_logs_from_es()
+    keyword_set = set(feature_names)
+    searched = [(user_id, keyword) for user_id, keyword in search_logs if keyword in keyword_set]
+    del search_logs
+    if any(user_id == 'anonymous' for user_id, _ in searched):
+        await load_nodes([{'label': 'AnonymousUser', 'id': 'anonymous', 'name': 'Anonymous User'}])
+    for batch in _batched(searched, chunk_size):
+        await load_relationships([
+            {
+                'start_node': ('User' if user_id != 'anonymous' else 'AnonymousUser', user_id),
+                'end_node': ('Keyword', keyword),
+                'type': 'SEARCHED'
+            }
+            for user_id, keyword in batch
+        ])
+
+    logger.info(f"적재 완료: {node_count}개의 노드, {relationship_count}개의 관계 생성됨.")
+    logger.info("--- Phase 1~3: Streaming Extract/Transform/Load 종료 ---")
+
+    return keyword_weights.result()
+
+
 # =================================== LOAD ===================================
 async def _execute_neo4j_query(driver: AsyncDriver, query: str, **kwargs):
     """(Helper) Neo4j 드라이버를 사용하여 쿼리를 안전하게 실행함."""
@@ -549,6 +845,22 @@ async def phase_load(driver: AsyncDriver, transformed_data: TransformedData):
     
     nodes, relationships = transformed_data
     
+    # 1~2. 데이터베이스 초기화 및 제약조건 생성
+    await _prepare_graph(driver)
+
+    # 3. 노드 생성
+    logger.info(f"  - 3/4: {len(nodes)}개의 노드 생성 중...")
+    await _load_nodes(driver, nodes)
+
+    # 4. 관계 생성
+    logger.info(f"  - 4/4: {len(relationships)}개의 관계 생성 중...")
+    await _load_relationships(driver, relationships)
+
+    logger.info("--- Phase 3: Load 종료 ---")
+
+
+async def _prepare_graph(driver: AsyncDriver):
+    """(Helper) 적재 전에 Neo4j의 기존 데이터를 모두 삭제하고, 노드 제약조건을 생성함."""
     # 1. 데이터베이스 초기화
     logger.info("  - 1/4: Neo4j 데이터베이스 초기화 중...")
     await _execute_neo4j_query(driver, "MATCH (n) DETACH DELETE n")
@@ -566,8 +878,11 @@ async def phase_load(driver: AsyncDriver, transformed_data: TransformedData):
     for constraint_query in constraints:
         await _execute_neo4j_query(driver, constraint_query)
 
-    # 3. 노드 생성
-    logger.info(f"  - 3/4: {len(nodes)}개의 노드 생성 중...")
+
+async def _load_nodes(driver: AsyncDriver, nodes: List[Dict[str, Any]]):
+    """(Helper) 노드 목록을 한 번의 UNWIND 쿼리로 생성함. (스트리밍 모드에서는 청크마다 호출됨)"""
+    if not nodes:
+        return
     # [핵심] APOC 라이브러리를 사용한 동적 라벨링 쿼리
     # 하나의 쿼리로 모든 종류의 노드(User, Feed 등)를 효율적으로 생성함.
     node_query = """
@@ -598,8 +913,11 @@ async def phase_load(driver: AsyncDriver, transformed_data: TransformedData):
     ]
     await _execute_neo4j_query(driver, node_query, nodes=node_params)
 
-    # 4. 관계 생성
-    logger.info(f"  - 4/4: {len(relationships)}개의 관계 생성 중...")
+
+async def _load_relationships(driver: AsyncDriver, relationships: List[Dict[str, Any]]):
+    """(Helper) 관계 목록을 한 번의 UNWIND 쿼리로 생성함. 양 끝 노드가 먼저 적재되어 있어야 함."""
+    if not relationships:
+        return
     # [핵심] APOC 라이브러리를 사용한 동적 관계 생성 쿼리
     # 하나의 쿼리로 모든 종류의 관계(BOOKMARKED, CONTAINS_KEYWORD 등)를 생성함.
     relationship_query = """
@@ -631,7 +949,110 @@ async def phase_load(driver: AsyncDriver, transformed_data: TransformedData):
     ]
     await _execute_neo4j_query(driver, relationship_query, relationships=relationship_params)
 
-    logger.info("--- Phase 3: Load 종료 ---")
+
+# =================================== MATERIALIZE ===================================
+class KeywordWeightAccumulator:
+    """
+    Transform 결과 관계를 하나씩 받아 기관별·전역 키워드 가중치를 누적함.
+    - 점수 = 피드별 TF-IDF 상위 키워드 점수(CONTAINS_KEYWORD)의 합 + 로그인 사용자 검색 횟수 x SEARCH_WEIGHT
+    - CONTAINS_KEYWORD는 피드의 기관(PUBLISHED)을 알아야 하므로, 해당 피드의 PUBLISHED 관계보다 나중에 넣어야 함.
+    - 관계 목록 전체를 들고 있지 않으므로, 스트리밍 모드에서는 관계를 적재하면서 바로 넣고 버림.
+    """
+    def __init__(self):
+        self.feed_to_org: Dict[int, int] = {}
+        self.search_counts: Dict[str, int] = defaultdict(int)
+        self.org_weights: Dict[int, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(lambda: [0.0, 0]))
+        self.global_weights: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])
+
+    def add(self, rel: Dict[str, Any]):
+        if rel['type'] == 'PUBLISHED':
+            self.feed_to_org[rel['end_node'][1]] = rel['start_node'][1]
+        elif rel['type'] == 'SEARCHED' and rel['start_node'][0] == 'User':
+            self.search_counts[rel['end_node'][1]] += 1
+        elif rel['type'] == 'CONTAINS_KEYWORD':
+            org_id = self.feed_to_org.get(rel['start_node'][1])
+            keyword = rel['end_node'][1]
+            score = rel['properties']['score']
+            scopes = [self.global_weights] if org_id is None else [self.global_weights, self.org_weights[org_id]]
+            for weights in scopes:
+                weights[keyword][0] += score
+                weights[keyword][1] += 1
+
+    def result(self) -> KeywordWeightData:
+        """누적한 가중치에 검색 가산점을 더해 ( {org_id: {keyword: [점수, 빈도]}}, {keyword: [점수, 빈도]} )를 반환함."""
+        # 검색 가산점은 해당 키워드가 등장한 범위(기관/전역)에만 더함
+        for weights in [*self.org_weights.values(), self.global_weights]:
+            for keyword, entry in weights.items():
+                entry[0] += self.search_counts.get(keyword, 0) * SEARCH_WEIGHT
+        return self.org_weights, self.global_weights
+
+
+def _compute_keyword_weights(relationships: List[Dict[str, Any]]) -> KeywordWeightData:
+    """
+    (Helper) 일괄 모드의 Transform 결과(관계 목록)로부터 기관별·전역 키워드 가중치를 계산함.
+    - 반환값: ( {org_id: {keyword: [점수, 빈도]}}, {keyword: [점수, 빈도]} )
+    """
+    accumulator = KeywordWeightAccumulator()
+    # 피드의 기관(PUBLISHED)과 검색 횟수를 먼저 모은 뒤 키워드 점수를 누적함
+    for rel in relationships:
+        if rel['type'] != 'CONTAINS_KEYWORD':
+            accumulator.add(rel)
+    for rel in relationships:
+        if rel['type'] == 'CONTAINS_KEYWORD':
+            accumulator.add(rel)
+    return accumulator.result()
+
+
+def _top_weighted(weights: Dict[str, List[float]], top_n: int) -> List[Tuple[str, float]]:
+    """(Sub-Helper) {keyword: [점수, 빈도]}에서 점수 상위 N개의 (keyword, 점수)를 반환함."""
+    ranked = sorted(weights.items(), key=lambda item: item[1][0], reverse=True)[:top_n]
+    return [(keyword, round(entry[0], 4)) for keyword, entry in ranked]
+
+
+async def phase_materialize_keywords(db: AsyncSession, keyword_weights: KeywordWeightData, period: str | None = None):
+    """
+    ETL 파이프라인 3-1단계: Materialize
+    - Transform 단계에서 계산한 기관별·전역 키워드 인기도를 MySQL에 적재함.
+      (일괄 모드는 _compute_keyword_weights, 스트리밍 모드는 KeywordWeightAccumulator의 결과)
+      · Keyword: 기관별 전체 키워드 가중치 (기간 키 기준 upsert)
+      · WordCloud: 기관별/전역 상위 WORD_CLOUD_TOP_N개 (전역은 organization_id = NULL)
+    - 워드클라우드 API들은 요청마다 그래프를 집계하지 않고 이 테이블을 조회함.
+    """
+    logger.info("--- Phase 3-1: Keyword Materialize 시작 ---")
+    period = period or datetime.now().strftime("%Y-%m-%d")
+    org_weights, global_weights = keyword_weights
+
+    keyword_column_length = 100  # Keyword.keyword_text / WordCloud.keyword 컬럼 길이
+    keyword_rows = [
+        {'organization_id': org_id, 'keyword_text': keyword, 'total_score': round(entry[0], 4), 'frequency': entry[1]}
+        for org_id, weights in org_weights.items()
+        for keyword, entry in weights.items()
+        if len(keyword) <= keyword_column_length
+    ]
+    word_cloud_rows = [
+        {'organization_id': None, 'keyword': keyword, 'score': score}
+        for keyword, score in _top_weighted(global_weights, WORD_CLOUD_TOP_N)
+        if len(keyword) <= keyword_column_length
+    ]
+    for org_id, weights in org_weights.items():
+        word_cloud_rows.extend(
+            {'organization_id': org_id, 'keyword': keyword, 'score': score}
+            for keyword, score in _top_weighted(weights, WORD_CLOUD_TOP_N)
+            if len(keyword) <= keyword_column_length
+        )
+
+    repo = KeywordRepository(db)
+    try:
+        await repo.upsert_keyword_weights(period, keyword_rows)
+        await repo.replace_word_cloud(period, word_cloud_rows)
+        await repo.delete_old_periods(KEYWORD_PERIODS_TO_KEEP)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    logger.info(f"기간 '{period}': 키워드 {len(keyword_rows)}개, 워드클라우드 {len(word_cloud_rows)}개 적재 완료.")
+    logger.info("--- Phase 3-1: Keyword Materialize 종료 ---")
 
 
 # --- 메인 실행 함수 (개발/테스트용) ---
@@ -693,16 +1114,18 @@ async def phase_load(driver: AsyncDriver, transformed_data: TransformedData):
 
 #     logger.info("======= Knowledge Graph ETL Pipeline (DEV) 종료 =======")
 
-async def run_pipeline():
+async def run_pipeline(streaming: bool = True, chunk_size: int = STREAM_CHUNK_SIZE):
     """
     운영 환경에서 APScheduler에 의해 실행될 메인 파이프라인 함수.
     - DB 세션과 Neo4j 드라이버를 외부에서 주입받아 사용함.
+    - streaming=True(기본값)이면 청크 단위 스트리밍 Extract/Transform/Load를 사용하여 메모리 사용량을 제한함.
+      streaming=False이면 기존 일괄 모드(phase_extract -> phase_transform -> phase_load)로 동작함.
     """
     logger.info("======= Knowledge Graph ETL Pipeline 시작 =======")
     
     # 🔧 [핵심 수정] DB 연결을 직접 생성하지 않고, FastAPI의 의존성 주입 시스템을 활용할 준비.
     #    실제 세션과 드라이버는 스케줄러 설정 파일에서 주입해 줄 것임.
-    from app.F8_database.session import AsyncSessionLocal # SQLAlchemy 세션
+    from app.F8_database.session import AsyncSessionLocal, read_session_scope # SQLAlchemy 세션 (적재용 / 추출용)
     from app.F8_database.graph_db import Neo4jDriver   # Neo4j 드라이버
     
     neo4j_driver = Neo4jDriver.get_driver()
@@ -710,14 +1133,29 @@ async def run_pipeline():
 
     async with AsyncSessionLocal() as db:
         try:
-            # 1. Extract
-            mysql_data, pdf_texts, search_logs = await phase_extract(db)
-            
-            # 2. Transform
-            nodes, relationships = phase_transform(mysql_data, pdf_texts, search_logs)
-            
-            # 3. Load
-            await phase_load(neo4j_driver, (nodes, relationships))
+            # 추출은 읽기 전용이므로 복제본 세션을 사용함 (복제본이 없거나 장애 시 주 DB)
+            if streaming:
+                # 1~3. Extract + Transform + Load (청크 단위로 읽고 변환하여 바로 Neo4j에 적재)
+                async with read_session_scope() as read_db:
+                    keyword_weights = await phase_extract_transform_load_streaming(
+                        read_db, neo4j_driver, chunk_size=chunk_size
+                    )
+            else:
+                async with read_session_scope() as read_db:
+                    # 1. Extract
+                    mysql_data, pdf_texts, search_logs = await phase_extract(read_db)
+                    
+                # 2. Transform
+                nodes, relationships = phase_transform(mysql_data, pdf_texts, search_logs)
+                keyword_weights = _compute_keyword_weights(relationships)
+
+                # 3. Load
+                await phase_load(neo4j_driver, (nodes, relationships))
+
+            # 3-1. 키워드 인기도/워드클라우드 MySQL 적재
+            await phase_materialize_keywords(db, keyword_weights)
+            # 새 집계 기간이 적재되었으므로 워드클라우드 응답 캐시를 비우고 콘텐츠 버전(ETag)을 올림
+            await invalidate_cache_tags(CACHE_TAG_WORDCLOUD)
 
             # 4. ML용 그래프 데이터 추출
             logger.info("--- Phase 4: ML 모델용 그래프 데이터 추출 시작 ---")
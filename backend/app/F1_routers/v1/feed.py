@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, Query
 from fastapi.responses import JSONResponse
 from typing import Optional
 import logging
 from app.F2_services.feed import FeedService
-from app.F5_core.dependencies import get_feed_service, verify_active_user, verify_active_user_optional
+from app.F5_core.dependencies import get_feed_service, get_feed_read_service, verify_active_user, verify_active_user_optional
 from app.F5_core.logging_decorator import log_event_detailed
+from app.F5_core.conditional_request import conditional_response, PRIVATE_CACHE_CONTROL
+from app.F5_core.response_cache import cache_response, CACHE_TAG_FEEDS
 from app.F6_schemas.feed import (
     MainFeedListResponse, 
     FeedListQuery, 
@@ -39,6 +41,17 @@ logger = logging.getLogger(__name__)
 # 피드 관련 API 라우터 생성
 router = APIRouter()
 
+# 조건부 요청(ETag / Last-Modified) 검증자 계산 함수
+# 엔드포인트 인자를 그대로 받아 서비스의 버전 조회만 실행함 (응답 본문은 만들지 않음)
+async def _feed_list_validator(feed_service: FeedService, **_):
+    return await feed_service.get_feed_list_validator()
+
+async def _organization_feed_list_validator(name: str, feed_service: FeedService, **_):
+    return await feed_service.get_feed_list_validator(name)
+
+async def _top5_validator(feed_service: FeedService, **_):
+    return await feed_service.get_top5_validator()
+
 # 메인 페이지 피드 목록 조회 엔드포인트
 # HTTP 메서드: GET
 # 경로: /api/feeds/
@@ -48,18 +61,22 @@ router = APIRouter()
 # 쿼리 파라미터:
 #   - page: 페이지 번호 (기본값: 1, 최소값: 1)
 #   - limit: 페이지당 항목 수 (기본값: 20, 최소값: 1, 최대값: 100)
+#   - cursor: 키셋 커서 (선택, 이전 응답의 next_cursor. 주어지면 page 대신 사용)
 # 응답: 피드 목록과 페이지네이션 정보를 포함한 JSON 응답 또는 에러 응답
 @router.get("/", response_model=MainFeedListResponse)
 @log_event_detailed(action="LIST", category=["PUBLIC", "FEED"])
+@conditional_response(_feed_list_validator)
 async def get_feeds(
     query: PaginationQuery = Depends(),
-    feed_service: FeedService = Depends(get_feed_service)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    feed_service: FeedService = Depends(get_feed_read_service)
 ) -> MainFeedListResponse:
     """
     메인 페이지 피드 목록 조회
     
     - **page**: 페이지 번호 (1부터 시작)
     - **limit**: 페이지당 항목 수 (최대 100)
+    - **cursor**: 무한 스크롤용 커서 (선택사항, 주어지면 page는 무시됨)
     
     반환되는 데이터:
     - 피드 기본 정보 (제목, 요약, 발행일, 조회수)
@@ -75,7 +92,8 @@ async def get_feeds(
     # Service 레이어에서 요구하는 스키마 형태로 변환하여 전달
     feed_query = FeedListQuery(
         page=query.page,
-        limit=query.limit
+        limit=query.limit,
+        cursor=cursor
     )
     
     # 피드 서비스를 통해 메인 페이지 피드 목록 조회
@@ -96,9 +114,10 @@ async def get_feeds(
 
 @router.get("/top5", response_model=Top5FeedResponse)
 @log_event_detailed(action="LIST", category=["PUBLIC", "FEED", "TOP5"])
+@conditional_response(_top5_validator)
 async def get_feeds_top5(
     query: Top5FeedQuery = Depends(),
-    feed_service: FeedService = Depends(get_feed_service)
+    feed_service: FeedService = Depends(get_feed_read_service)
 ) -> Top5FeedResponse:
     """
     메인 페이지 TOP5 피드 조회
@@ -121,9 +140,11 @@ async def get_feeds_top5(
 
 @router.get("/latest", response_model=LatestFeedResponse)
 @log_event_detailed(action="LIST", category=["PUBLIC", "FEED", "LATEST"])
+@conditional_response(_feed_list_validator)
+@cache_response(CACHE_TAG_FEEDS, ttl=60)
 async def get_latest_feeds(
     query: LatestFeedQuery = Depends(),
-    feed_service: FeedService = Depends(get_feed_service)
+    feed_service: FeedService = Depends(get_feed_read_service)
 ) -> LatestFeedResponse:
     """
     메인 페이지 최신 피드 슬라이드 조회
@@ -150,6 +171,8 @@ async def get_latest_feeds(
 @log_event_detailed(action="READ", category=["PUBLIC", "FEED", "DETAIL"])
 async def get_feed_by_id(
     request:Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
     id: int,
     feed_service: FeedService = Depends(get_feed_service),
     current_user: Optional[User] = Depends(verify_active_user_optional) #선택적 인증 메서드
@@ -160,9 +183,17 @@ async def get_feed_by_id(
     특정 피드의 상세 정보를 조회
     - 비로그인 사용자: 기본 정보만 제공
     - 로그인 사용자: 북마크 여부, 내가 매긴 별점 정보 추가 제공
+    - If-None-Match / If-Modified-Since가 현재 버전과 같으면 본문 없이 304 반환 (조회수는 기록함)
     """
     user_pk = current_user.id if current_user else None # 인증된 사용자면 사용, 아니면 말고
-    result = await feed_service.get_feed_detail_for_page(id, user_pk)
+    client_ip = request.client.host if request.client else None # 비로그인 사용자의 중복 조회 판단용
+
+    # 상세 조회와 ETag용 수정 시각을 한 번의 쿼리로 읽음 (조회수 기록은 304 응답이어도 서비스에서 수행함)
+    result, validator = await feed_service.get_feed_detail_for_page(id, user_pk, client_ip, background_tasks)
+
+    # 조건부 요청: 사용자별 내용(북마크/별점)이 포함되므로 private 캐시로 두고 Authorization별로 구분함
+    if validator is not None and validator.matches(request):
+        return validator.not_modified(PRIVATE_CACHE_CONTROL, vary="Authorization")
     
     if isinstance(result, ErrorResponse):
         if result.error.code == ErrorCode.NOT_FOUND:
@@ -171,6 +202,9 @@ async def get_feed_by_id(
             status_code = 500
         return JSONResponse(status_code=status_code, content=result.model_dump())
     
+    if validator is not None:
+        validator.apply(response, PRIVATE_CACHE_CONTROL)
+        response.headers["Vary"] = "Authorization"
     return result
 
 # 별점 주기
@@ -243,13 +277,15 @@ async def get_feed_recommendations(
 #   - page: 페이지 번호 (기본값: 1, 최소값: 1)
 #   - limit: 페이지당 항목 수 (기본값: 20, 최소값: 1, 최대값: 100)
 #   - category_id: 카테고리 ID (선택사항, 미입력시 전체 피드)
+#   - cursor: 키셋 커서 (선택, 이전 응답의 next_cursor. 주어지면 page 대신 사용)
 # 응답: 기관 정보, 피드 목록, 페이지네이션 정보, 필터 정보를 포함한 JSON 응답 또는 에러 응답
 @router.get("/{name}", response_model=OrganizationFeedListResponse)
 @log_event_detailed(action="LIST", category=["PUBLIC", "FEED", "BY_ORGANIZATION"])
+@conditional_response(_organization_feed_list_validator)
 async def get_organization_feeds(
     name: str,
     query: OrganizationFeedQuery = Depends(),
-    feed_service: FeedService = Depends(get_feed_service)
+    feed_service: FeedService = Depends(get_feed_read_service)
 ) -> OrganizationFeedListResponse:
     """
     기관별 피드 목록 조회
@@ -258,6 +294,7 @@ async def get_organization_feeds(
     - **page**: 페이지 번호 (1부터 시작)
     - **limit**: 페이지당 항목 수 (최대 100)
     - **category_id**: 카테고리 ID (선택사항, 특정 카테고리 필터링)
+    - **cursor**: 무한 스크롤용 커서 (선택사항, 주어지면 page는 무시됨)
     
     반환되는 데이터:
     - 기관 정보 (ID, 이름)
@@ -281,8 +318,13 @@ async def get_organization_feeds(
     # Service에서 에러 응답이 반환된 경우 처리
     if isinstance(result, ErrorResponse):
         # 에러 코드에 따라 HTTP 상태 코드 설정
-        # ORGANIZATION_NOT_FOUND: 404, INTERNAL_SERVER_ERROR: 500
-        status_code = 404 if result.error.code == ErrorCode.NOT_FOUND else 500
+        # ORGANIZATION_NOT_FOUND: 404, INVALID_PARAMETER(잘못된 커서): 400, INTERNAL_SERVER_ERROR: 500
+        if result.error.code == ErrorCode.NOT_FOUND:
+            status_code = 404
+        elif result.error.code == ErrorCode.INVALID_PARAMETER:
+            status_code = 400
+        else:
+            status_code = 500
         return JSONResponse(status_code=status_code, content=result.model_dump())
     
     # 성공 시 Service에서 반환된 OrganizationFeedListResponse를 그대로 반환
@@ -292,10 +334,11 @@ async def get_organization_feeds(
 
 @router.get("/{name}/latest", response_model=OrganizationLatestFeedResponse)
 @log_event_detailed(action="LIST", category=["PUBLIC", "FEED", "BY_ORGANIZATION", "LATEST"])
+@conditional_response(_organization_feed_list_validator)
 async def get_organization_feeds_latest(
     name: str,
     query: LatestFeedQuery = Depends(),
-    feed_service: FeedService = Depends(get_feed_service)
+    feed_service: FeedService = Depends(get_feed_read_service)
 ) -> OrganizationLatestFeedResponse:
     """
     기관 페이지 최신 피드 슬라이드 조회
@@ -320,16 +363,18 @@ async def get_organization_feeds_latest(
 
 @router.get("/{name}/press", response_model=PressReleaseResponse)
 @log_event_detailed(action="LIST", category=["PUBLIC", "FEED", "BY_ORGANIZATION", "PRESS"])
+@conditional_response(_organization_feed_list_validator)
 async def get_press_releases(
     name: str,
     query: PressReleaseQuery = Depends(),
-    feed_service: FeedService = Depends(get_feed_service)
+    feed_service: FeedService = Depends(get_feed_read_service)
 ) -> PressReleaseResponse:
     """
     기관 페이지 보도자료 목록 조회
     
     각 기관의 보도자료 목록을 페이지네이션과 함께 제공
     기관 페이지 좌측 하단 보도자료 리스트에서 사용
+    - **cursor**: 더보기용 커서 (선택사항, 이전 응답의 next_cursor. 주어지면 page는 무시됨)
     """
     # Service를 통해 기관별 보도자료 데이터 조회
     result = await feed_service.get_organization_press_releases(name, query)
@@ -349,16 +394,18 @@ async def get_press_releases(
 
 @router.get("/{name}/policy-news", response_model=PolicyNewsResponse) 
 @log_event_detailed(action="LIST", category=["PUBLIC", "FEED", "BY_ORGANIZATION", "POLICY_NEWS"])
+@conditional_response(_organization_feed_list_validator)
 async def get_policy_news(
     name: str, 
     query: PolicyNewsQuery = Depends(),
-    feed_service: FeedService = Depends(get_feed_service)
+    feed_service: FeedService = Depends(get_feed_read_service)
 ) -> PolicyNewsResponse:
     """
     기관 페이지 [정책뉴스] 목록 조회
 
     각 기관의 정책뉴스 목록을 페이지네이션과 함께 제공
     기관 페이지 좌측 하단 정책뉴스 리스트에서 사용 
+    - **cursor**: 더보기용 커서 (선택사항, 이전 응답의 next_cursor. 주어지면 page는 무시됨)
     """
     # Service를 통해 기관별 정책뉴스 데이터 조회
     result = await feed_service.get_organization_policy_news(name, query)
@@ -4,6 +4,7 @@ from fastapi.responses import JSONResponse
 
 from app.F2_services.graph import GraphService
 from app.F5_core.dependencies import get_graph_service
+from app.F5_core.response_cache import cache_response, CACHE_TAG_WORDCLOUD
 from app.F6_schemas.graph import ExploreGraphResponse, ExploreQuery, ExpandQuery, WordCloudResponse, RelatedKeywordsResponse
 from app.F6_schemas.base import ErrorResponse, ErrorCode, Message
 
@@ -58,6 +59,7 @@ async def get_expanded_graph_from_node(
     return result
 
 @router.get("/wordcloud", response_model=WordCloudResponse, summary="인기 키워드/워드클라우드 데이터 조회", description="전체 또는 특정 기관의 인기 키워드 목록을 점수와 함께 반환.")
+@cache_response(CACHE_TAG_WORDCLOUD, ttl=600)
 async def get_wordcloud(
     # 쿼리 파라미터로 organization_name과 limit을 받음
     organization_name: str | None = Query(None, description="데이터를 필터링할 기관의 이름"),
@@ -6,6 +6,7 @@ import logging
 from app.F2_services.notice import NoticeService
 from app.F5_core.dependencies import get_notice_service
 from app.F5_core.logging_decorator import log_event_detailed
+from app.F5_core.response_cache import cache_response, CACHE_TAG_NOTICES
 from app.F6_schemas.base import (
     PaginationQuery, ErrorResponse, ErrorDetail, ErrorCode, Message
 )
@@ -24,6 +25,7 @@ logger = logging.getLogger(__name__)
 # 공지사항 페이지에서 전체 공지사항 목록 조회
 @router.get("", response_model=NoticeListResponse)
 @log_event_detailed(action="LIST", category=["PUBLIC", "NOTICE"])
+@cache_response(CACHE_TAG_NOTICES, ttl=300)
 async def read_notices(
     query: PaginationQuery = Depends(),
     notice_service: NoticeService = Depends(get_notice_service)
@@ -52,6 +54,7 @@ async def read_notices(
 # 중요(고정된) 게시물
 @router.get("/pinned", response_model=PinnedNoticeResponse)
 @log_event_detailed(action="LIST", category=["PUBLIC", "NOTICE", "PINNED"])
+@cache_response(CACHE_TAG_NOTICES, ttl=300)
 async def pinned_notices(
     notice_service: NoticeService = Depends(get_notice_service)
 ):
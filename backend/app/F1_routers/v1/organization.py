@@ -6,6 +6,8 @@ from fastapi.responses import JSONResponse
 from app.F2_services.organization import OrganizationService
 from app.F5_core.dependencies import get_organization_service
 from app.F5_core.logging_decorator import log_event_detailed
+from app.F5_core.conditional_request import conditional_response
+from app.F5_core.response_cache import cache_response, CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS, CACHE_TAG_WORDCLOUD
 from app.F6_schemas.organization import OrganizationListResponse, OrganizationCategoryResponse, OrganizationIconResponse, WordCloudResponse, OrganizationSummaryResponse
 from app.F6_schemas.base import ErrorResponse, ErrorCode
 
@@ -13,8 +15,24 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# 조건부 요청(ETag / Last-Modified) 검증자 계산 함수
+# 엔드포인트 인자를 그대로 받아 서비스의 버전 조회만 실행함 (응답 본문은 만들지 않음)
+async def _organization_list_validator(org_service: OrganizationService, **_):
+    return await org_service.get_organization_list_validator()
+
+async def _organization_feeds_validator(name: str, org_service: OrganizationService, **_):
+    return await org_service.get_organization_feeds_validator(name)
+
+async def _organization_icon_validator(name: str, org_service: OrganizationService, **_):
+    return await org_service.get_organization_icon_validator(name)
+
+async def _organization_wordcloud_validator(name: str, org_service: OrganizationService, **_):
+    return await org_service.get_organization_wordcloud_validator(name)
+
 @router.get("/", response_model=OrganizationListResponse)
 @log_event_detailed(action="LIST", category=["PUBLIC", "ORGANIZATION"])
+@conditional_response(_organization_list_validator)
+@cache_response(CACHE_TAG_ORGANIZATIONS, CACHE_TAG_FEEDS, ttl=300)
 async def get_organizations(org_service: OrganizationService = Depends(get_organization_service)):
     """
     메인페이지 기관 목록 조회
@@ -37,6 +55,8 @@ async def get_organizations(org_service: OrganizationService = Depends(get_organ
 
 @router.get("/{name}/summary", response_model=OrganizationSummaryResponse)
 @log_event_detailed(action="READ", category=["PUBLIC", "ORGANIZATION", "SUMMARY"])
+@conditional_response(_organization_feeds_validator)
+@cache_response(CACHE_TAG_ORGANIZATIONS, CACHE_TAG_FEEDS, ttl=300)
 async def get_organization_summary(name: str, org_service: OrganizationService = Depends(get_organization_service)):
     """
     기관 상세 페이지 헤더 요약 정보 조회
@@ -51,6 +71,8 @@ async def get_organization_summary(name: str, org_service: OrganizationService =
     
 @router.get("/{name}/categories", response_model=OrganizationCategoryResponse)
 @log_event_detailed(action="LIST", category=["PUBLIC", "ORGANIZATION", "CATEGORY"])
+@conditional_response(_organization_feeds_validator)
+@cache_response(CACHE_TAG_ORGANIZATIONS, ttl=300)
 async def get_organization_categories(name: str, org_service: OrganizationService = Depends(get_organization_service)):
     """
     기관별 카테고리 목록 조회
@@ -81,6 +103,8 @@ async def get_organization_categories(name: str, org_service: OrganizationServic
 
 @router.get("/{name}/icon", response_model=OrganizationIconResponse)
 @log_event_detailed(action="READ", category=["PUBLIC", "ORGANIZATION", "ICON"])
+@conditional_response(_organization_icon_validator)
+@cache_response(CACHE_TAG_ORGANIZATIONS, ttl=600)
 async def get_organization_icon(name: str, org_service: OrganizationService = Depends(get_organization_service)):
     """
     기관 아이콘 조회
@@ -112,6 +136,8 @@ async def get_organization_icon(name: str, org_service: OrganizationService = De
 
 @router.get("/{name}/wordcloud", response_model=WordCloudResponse)
 @log_event_detailed(action="READ", category=["PUBLIC", "ORGANIZATION", "WORDCLOUD"])
+@conditional_response(_organization_wordcloud_validator)
+@cache_response(CACHE_TAG_WORDCLOUD, CACHE_TAG_ORGANIZATIONS, ttl=600)
 async def get_organization_wordcloud(name: str, org_service: OrganizationService = Depends(get_organization_service)):
     """
     기관별 주요 키워드(워드클라우드용) 조회
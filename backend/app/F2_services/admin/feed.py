@@ -9,6 +9,7 @@ from fastapi import BackgroundTasks, UploadFile
 from pathlib import Path
 
 from app.F3_repositories.admin.feed import FeedAdminRepository
+from app.F5_core.response_cache import invalidates_cache, invalidate_cache_tags, CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS
 from app.F5_core.config import settings
 
 from app.F6_schemas.admin.feed import (
@@ -194,6 +195,7 @@ class FeedAdminService:
                     )
                 )
 
+    @invalidates_cache(CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS)
     async def update_feed(self, feed_id: int, request: FeedUpdateRequest) -> Union[FeedUpdateResponse, ErrorResponse]:
         """
         관리자: 특정 피드의 정보를 수정
@@ -295,6 +297,8 @@ class FeedAdminService:
                 file_path=db_file_path,
                 status=final_status
             )
+            # 요약/파일은 요청이 끝난 뒤(캐시 무효화 이후)에 반영되므로 여기서 한 번 더 무효화함
+            await invalidate_cache_tags(CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS)
             logger.info(f"Finished background processing for feed_id {feed_id} with status {final_status.name}")
 
     async def _get_summary_from_colab_by_file(self, file_path: Path) -> str | None:
@@ -361,6 +365,7 @@ class FeedAdminService:
             return None
 
 
+    @invalidates_cache(CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS)
     async def create_feed(
         self,
         request_data: FeedCreateRequest,
@@ -465,6 +470,7 @@ class FeedAdminService:
                     )
                 )
         
+    @invalidates_cache(CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS)
     async def delete_feed_permanently(self, feed_id: int) -> Union[FeedDeleteResponse, ErrorResponse]:
         """
         관리자: 특정 피드를 DB와 파일 시스템에서 완전히 삭제
@@ -500,6 +506,7 @@ class FeedAdminService:
                     )
                 )
         
+    @invalidates_cache(CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS)
     async def deactivate_feed(self, feed_id: int) -> Union[FeedDeactivateResponse, ErrorResponse]:
         """
         관리자: 특정 피드를 비활성화(소프트 삭제)
@@ -527,6 +534,7 @@ class FeedAdminService:
                     )
                 )
         
+    @invalidates_cache(CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS)
     async def create_manual_feeds(self, request_data_list: List[FeedCreateRequest]) -> Union[FeedManualCreateResponse, ErrorResponse]:
         """
         자동 요약 없이 수동으로 피드 생성
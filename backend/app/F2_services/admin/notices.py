@@ -12,6 +12,7 @@ import os
 
 from app.F3_repositories.admin.notices import NoticesAdminRepository
 from app.F3_repositories.admin.activity_log import UsersActivityRepository 
+from app.F5_core.response_cache import invalidates_cache, CACHE_TAG_NOTICES
 from app.F5_core.config import settings
 from app.F7_models.users import User
 from app.F6_schemas.admin.notices import (
@@ -143,6 +144,7 @@ class NoticesAdminService:
                     )
                 )
         
+    @invalidates_cache(CACHE_TAG_NOTICES)
     async def create_notice(self, current_user:User, request_data:NoticeCreateRequest) -> Union[NoticeCreateResponse, ErrorResponse]:
         try:
             # # --- 1. 계정 ADMIN 인지 체크 ---
@@ -203,6 +205,7 @@ class NoticesAdminService:
                     )
                 )
 
+    @invalidates_cache(CACHE_TAG_NOTICES)
     async def update_notice(self, current_user:User, notice_id:int, request_data:NoticeUpdateRequest) -> Union[NoticeUpdateResponse, ErrorResponse]:
         try:
             # # --- 1. 계정 ADMIN 인지 체크 ---
@@ -274,6 +277,7 @@ class NoticesAdminService:
                     )
                 )
         
+    @invalidates_cache(CACHE_TAG_NOTICES)
     async def update_notice_status(self, current_user:User, notice_id, request_data:NoticePinStateUpdateRequest) -> Union[NoticeUpdateResponse, ErrorResponse]:
         try:
             # # --- 1. 계정 ADMIN 인지 체크 ---
@@ -346,6 +350,7 @@ class NoticesAdminService:
                 )
         
 
+    @invalidates_cache(CACHE_TAG_NOTICES)
     async def delete_notice(self,current_user:User, notice_id:int) -> Union[NoticeDeleteResponse, ErrorResponse]:
         try:
             # # --- 1. 계정 ADMIN 인지 체크 ---
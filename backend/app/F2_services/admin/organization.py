@@ -2,6 +2,7 @@ import logging
 from typing import Union, List, Optional
 
 from app.F3_repositories.admin.organization import OrganizationAdminRepository
+from app.F5_core.response_cache import invalidates_cache, CACHE_TAG_ORGANIZATIONS, CACHE_TAG_FEEDS
 from app.F6_schemas.admin.organization import (
     SimpleOrganizationListResponse, 
     SimpleOrganizationItem,
@@ -93,6 +94,7 @@ class OrganizationAdminService:
             logger.error(f"Error in get_organizations_list: {e}", exc_info=True)
             return ErrorResponse(error=ErrorDetail(code=ErrorCode.INTERNAL_ERROR, message=Message.INTERNAL_ERROR))
         
+    @invalidates_cache(CACHE_TAG_ORGANIZATIONS, CACHE_TAG_FEEDS)
     async def create_organization(
         self,
         name: str,
@@ -166,6 +168,7 @@ class OrganizationAdminService:
             logger.error(f"Error in create_organization for name '{name}': {e}", exc_info=True)
             return ErrorResponse(error=ErrorDetail(code=ErrorCode.INTERNAL_ERROR, message=Message.INTERNAL_ERROR))
         
+    @invalidates_cache(CACHE_TAG_ORGANIZATIONS, CACHE_TAG_FEEDS)
     async def create_category(self, request: CategoryCreateRequest) -> Union[CategoryCreateResponse, ErrorResponse]:
         """
         관리자: 새로운 카테고리를 생성합니다.
@@ -213,6 +216,7 @@ class OrganizationAdminService:
             logger.error(f"Error in create_category for name '{request.name}': {e}", exc_info=True)
             return ErrorResponse(error=ErrorDetail(code=ErrorCode.INTERNAL_ERROR, message=Message.INTERNAL_ERROR))
         
+    @invalidates_cache(CACHE_TAG_ORGANIZATIONS, CACHE_TAG_FEEDS)
     async def update_organization(
         self,
         org_id: int,
@@ -286,6 +290,7 @@ class OrganizationAdminService:
             logger.error(f"Error in get_category_detail for cat_id {cat_id}: {e}", exc_info=True)
             return ErrorResponse(error=ErrorDetail(code=ErrorCode.INTERNAL_ERROR, message=Message.INTERNAL_ERROR))
 
+    @invalidates_cache(CACHE_TAG_ORGANIZATIONS, CACHE_TAG_FEEDS)
     async def update_category(self, cat_id: int, request: CategoryUpdateRequest) -> Union[CategoryUpdateResponse, ErrorResponse]:
         """
         관리자: 기존 카테고리의 정보를 수정
@@ -334,6 +339,7 @@ class OrganizationAdminService:
             logger.error(f"Error in get_organization_detail for org_id {org_id}: {e}", exc_info=True)
             return ErrorResponse(error=ErrorDetail(code=ErrorCode.INTERNAL_ERROR, message=Message.INTERNAL_ERROR))
         
+    @invalidates_cache(CACHE_TAG_ORGANIZATIONS, CACHE_TAG_FEEDS)
     async def delete_organization(self, org_id: int) -> Union[OrganizationDeleteResponse, ErrorResponse]:
         """
         관리자: 특정 기관을 삭제
@@ -358,6 +364,7 @@ class OrganizationAdminService:
             logger.error(f"Error in delete_organization for org_id {org_id}: {e}", exc_info=True)
             return ErrorResponse(error=ErrorDetail(code=ErrorCode.INTERNAL_ERROR, message=Message.INTERNAL_ERROR))
         
+    @invalidates_cache(CACHE_TAG_ORGANIZATIONS, CACHE_TAG_FEEDS)
     async def delete_category(self, cat_id: int) -> Union[CategoryDeleteResponse, ErrorResponse]:
         """
         관리자: 특정 카테고리를 삭제
@@ -9,6 +9,7 @@ import logging
 import os 
 
 from app.F3_repositories.admin.slider import SliderAdminRepository
+from app.F5_core.response_cache import invalidates_cache, CACHE_TAG_SLIDERS
 from app.F5_core.config import settings
 from app.F6_schemas.admin.slider import (
     SliderListResponse,
@@ -198,6 +199,7 @@ class SliderAdminService:
                 )
         
 
+    @invalidates_cache(CACHE_TAG_SLIDERS)
     async def create_slider(
         self, 
         request_data:SliderCreateRequest, 
@@ -290,6 +292,7 @@ class SliderAdminService:
                 )
 
 
+    @invalidates_cache(CACHE_TAG_SLIDERS)
     async def update_slider(
             self, 
             slider_id: int, 
@@ -420,6 +423,7 @@ class SliderAdminService:
                 )
     
 
+    @invalidates_cache(CACHE_TAG_SLIDERS)
     async def update_slider_status(self, slider_id: int, is_active: bool) -> Union[SliderStatusUpdateResponse, ErrorResponse]:
         """특정 슬라이더의 is_active 상태만 업데이트"""
         try: 
@@ -484,6 +488,7 @@ class SliderAdminService:
                 )
         
     
+    @invalidates_cache(CACHE_TAG_SLIDERS)
     async def delete_slider(self, slider_id:int) -> Union[SliderDeleteResponse, ErrorResponse]:
         """특정 슬라이더와 연관된 이미지 파일 삭제"""
         try:
@@ -2,6 +2,7 @@ import logging
 from typing import Union
 
 from app.F3_repositories.admin.static_page import StaticPageAdminRepository
+from app.F5_core.response_cache import invalidates_cache, CACHE_TAG_STATIC_PAGES
 from app.F6_schemas.admin.static_page import (
     StaticPageListResponse, 
     StaticPageListItem,
@@ -107,6 +108,7 @@ class StaticPageAdminService:
                     )
                 )
 
+    @invalidates_cache(CACHE_TAG_STATIC_PAGES)
     async def update_static_page(self, slug: str, content: str) -> Union[StaticPageUpdateResponse, ErrorResponse]:
         """
         특정 정적 페이지의 내용을 수정
@@ -1,9 +1,19 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Union, Optional
+from redis.exceptions import RedisError
+from typing import Union, Optional, List, Dict, Any, Tuple
+from datetime import datetime
+from fastapi import BackgroundTasks
+import asyncio
 import logging
 import math
 
+from app.F2_services.leaderboard import LeaderboardStore, LEADERBOARD_SIZE, compute_leaderboards, fill_leaderboards
+from app.F2_services.view_counter import ViewCountBuffer, record_feed_view
 from app.F3_repositories.feed import FeedRepository
+from app.F4_utils.pagination import encode_cursor, decode_cursor
+from app.F5_core.conditional_request import ResourceValidator
+from app.F5_core.content_version import content_version_store, bumps_content_version
+from app.F5_core.response_cache import CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS
 from app.F6_schemas.feed import (
     FeedListQuery, 
     MainFeedListResponse, 
@@ -48,8 +58,15 @@ from app.F6_schemas.base import PaginationInfo, ErrorResponse, ErrorDetail, Erro
 logger = logging.getLogger(__name__)
 
 class FeedService:
-    def __init__(self, repo: FeedRepository):
+    def __init__(
+        self,
+        repo: FeedRepository,
+        leaderboard_store: Optional[LeaderboardStore] = None,
+        view_buffer: Optional[ViewCountBuffer] = None
+    ):
         self.feed_repository = repo
+        self.leaderboard_store = leaderboard_store
+        self.view_buffer = view_buffer
 
     
     # 메인 페이지 피드 목록 조회 서비스 메서드
@@ -58,58 +75,74 @@ class FeedService:
     # 반환: 
     #   메인 페이지 피드 목록 응답 (MainFeedListResponse) 또는 에러 응답 (ErrorResponse)
     # 설명: 
-    #   Repository에서 조회한 피드 데이터를 스키마에 맞게 변환하고 페이지네이션 처리
+    #   Repository에서 해당 페이지 분량만 조회(SQL LIMIT)하고, 전체 개수는 별도 COUNT로 계산함
+    #   - page 방식: OFFSET으로 해당 페이지 조회
+    #   - cursor 방식: 키셋(published_date, id) 커서 다음부터 조회 (무한 스크롤용, 깊은 페이지도 일정한 비용)
     #   - 기관 정보를 OrganizationInfo 객체로 통합
     #   - 평균 별점이 None인 경우 0.0으로 변환
     #   - 페이지네이션 정보 계산 (total_pages, has_next, has_previous 등)
     #   - 빈 결과나 페이지 범위 초과 시 공백 리스트 반환
-    #   - 예외 발생 시 표준화된 에러 응답 반환
+    #   - 잘못된 커서는 INVALID_PARAMETER, 예외 발생 시 표준화된 에러 응답 반환
     async def get_main_feed_list(self, query: FeedListQuery) -> MainFeedListResponse:
         try:
-            # Repository에서 전체 피드 데이터 조회
-            feeds_data = await self.feed_repository.get_feeds_with_details()
-            
-            # 전체 데이터 개수 계산
-            total_count = len(feeds_data)
+            # 커서 방식이면 커서를 정렬 키로 디코딩
+            after = None
+            if query.cursor:
+                try:
+                    after = decode_cursor(query.cursor)
+                except ValueError:
+                    return ErrorResponse(
+                        error=ErrorDetail(
+                            code=ErrorCode.INVALID_PARAMETER,
+                            message=Message.INVALID_CURSOR
+                        )
+                    )
+
+            # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+            page_feeds_data = await self.feed_repository.get_feed_page(
+                limit=query.limit + 1,
+                offset=(query.page - 1) * query.limit,
+                after=after
+            )
+            has_more = len(page_feeds_data) > query.limit
+            page_feeds_data = page_feeds_data[:query.limit]
+
+            # 전체 데이터 개수는 별도 COUNT 쿼리로 계산
+            total_count = await self.feed_repository.count_active_feeds()
             
             # 전체 페이지 수 계산 (올림 처리)
             total_pages = math.ceil(total_count / query.limit) if total_count > 0 else 0
             
-            # 현재 페이지가 범위를 벗어나는 경우 공백 리스트 반환
-            if query.page > total_pages and total_count > 0:
-                feeds_list = []
-            else:
-                # 페이지별 데이터 슬라이싱 계산
-                start_index = (query.page - 1) * query.limit
-                end_index = start_index + query.limit
+            # Repository 데이터를 스키마 형태로 변환 (페이지 범위를 벗어나면 빈 리스트)
+            feeds_list = []
+            for feed_data in page_feeds_data:
+                # 기관 정보를 OrganizationInfo 객체로 변환
+                organization_info = OrganizationInfo(
+                    id=feed_data['organization_id'],
+                    name=feed_data['organization_name']
+                )
                 
-                # 해당 페이지의 데이터만 추출
-                page_feeds_data = feeds_data[start_index:end_index]
+                # 평균 별점이 None인 경우 0.0으로 변환
+                average_rating = feed_data['average_rating'] if feed_data['average_rating'] is not None else 0.0
                 
-                # Repository 데이터를 스키마 형태로 변환
-                feeds_list = []
-                for feed_data in page_feeds_data:
-                    # 기관 정보를 OrganizationInfo 객체로 변환
-                    organization_info = OrganizationInfo(
-                        id=feed_data['organization_id'],
-                        name=feed_data['organization_name']
-                    )
-                    
-                    # 평균 별점이 None인 경우 0.0으로 변환
-                    average_rating = feed_data['average_rating'] if feed_data['average_rating'] is not None else 0.0
-                    
-                    # MainFeedItem 객체 생성
-                    feed_item = MainFeedItem(
-                        id=feed_data['id'],
-                        title=feed_data['title'],
-                        organization=organization_info,
-                        summary=feed_data['summary'],
-                        published_date=feed_data['published_date'],
-                        view_count=feed_data['view_count'],
-                        average_rating=average_rating,
-                        bookmark_count=feed_data['bookmark_count']
-                    )
-                    feeds_list.append(feed_item)
+                # MainFeedItem 객체 생성
+                feed_item = MainFeedItem(
+                    id=feed_data['id'],
+                    title=feed_data['title'],
+                    organization=organization_info,
+                    summary=feed_data['summary'],
+                    published_date=feed_data['published_date'],
+                    view_count=feed_data['view_count'],
+                    average_rating=average_rating,
+                    bookmark_count=feed_data['bookmark_count']
+                )
+                feeds_list.append(feed_item)
+
+            # 다음 페이지가 있으면 마지막 항목 위치로 커서 생성
+            next_cursor = None
+            if has_more and page_feeds_data:
+                last_feed = page_feeds_data[-1]
+                next_cursor = encode_cursor(last_feed['published_date'], last_feed['id'])
             
             # 페이지네이션 정보 계산
             pagination_info = PaginationInfo(
@@ -117,14 +150,15 @@ class FeedService:
                 total_pages=total_pages,
                 total_count=total_count,
                 limit=query.limit,
-                has_next=query.page < total_pages,
-                has_previous=query.page > 1
+                has_next=has_more,
+                has_previous=after is not None or query.page > 1
             )
             
             # 응답 데이터 구성
             response_data = MainFeedListData(
                 feeds=feeds_list,
-                pagination=pagination_info
+                pagination=pagination_info,
+                next_cursor=next_cursor
             )
             
             # 최종 응답 반환
@@ -151,95 +185,99 @@ class FeedService:
     # 반환: 
     #   기관 페이지 피드 목록 응답 (OrganizationFeedListResponse) 또는 에러 응답 (ErrorResponse)
     # 설명: 
-    #   Repository에서 조회한 특정 기관의 피드 데이터를 스키마에 맞게 변환하고 페이지네이션 처리
+    #   기관 ID를 한 번만 조회(캐시)한 뒤, 해당 페이지와 전체 개수를 한 번의 쿼리로 가져옴
+    #   - 존재하지 않는 기관명이면 기관 ID 조회 단계에서 바로 에러 응답 반환 (피드를 다시 조회하지 않음)
+    #   - page 방식(OFFSET) 또는 cursor 방식(키셋) 지원
     #   - 기관 정보와 카테고리 정보를 각각 객체로 변환
     #   - 평균 별점이 None인 경우 0.0으로 변환
     #   - 페이지네이션 정보 계산 (total_pages, has_next, has_previous 등)
     #   - category_id 제공 시 필터 정보 포함
-    #   - 존재하지 않는 기관명일 경우 에러 응답 반환
     #   - 예외 발생 시 표준화된 에러 응답 반환
     async def get_organization_feed_list(self, organization_name: str, query: OrganizationFeedQuery) -> OrganizationFeedListResponse:
         try:
-            # Repository에서 기관별 피드 데이터 조회
-            feeds_data = await self.feed_repository.get_feeds_by_organization_name(
-                organization_name=organization_name,
-                category_id=query.category_id
-            )
-            
-            # 존재하지 않는 기관명인 경우 에러 응답 반환
-            if not feeds_data:
-                # 기관 자체가 존재하지 않는지 확인하기 위해 category_id 없이 재조회
-                check_data = await self.feed_repository.get_feeds_by_organization_name(
-                    organization_name=organization_name,
-                    category_id=None
+            # 기관 존재 여부 확인 및 기관 ID 조회 (캐시 사용)
+            organization_id = await self.feed_repository.resolve_organization_id(organization_name)
+            if organization_id is None:
+                return ErrorResponse(
+                    error=ErrorDetail(
+                        code=ErrorCode.NOT_FOUND,
+                        message=Message.NOT_FOUND
+                    )
                 )
-                if not check_data:
+
+            # 커서 방식이면 커서를 정렬 키로 디코딩
+            after = None
+            if query.cursor:
+                try:
+                    after = decode_cursor(query.cursor)
+                except ValueError:
                     return ErrorResponse(
                         error=ErrorDetail(
-                            code=ErrorCode.NOT_FOUND,
-                            message=Message.NOT_FOUND
+                            code=ErrorCode.INVALID_PARAMETER,
+                            message=Message.INVALID_CURSOR
                         )
                     )
-            
-            # 전체 데이터 개수 계산
-            total_count = len(feeds_data)
+
+            # 해당 페이지 + 전체 개수 조회 (다음 페이지 존재 여부를 알기 위해 한 건 더 조회)
+            page_feeds_data, total_count = await self.feed_repository.get_organization_feed_page(
+                organization_id=organization_id,
+                limit=query.limit + 1,
+                offset=(query.page - 1) * query.limit,
+                after=after,
+                category_id=query.category_id
+            )
+            has_more = len(page_feeds_data) > query.limit
+            page_feeds_data = page_feeds_data[:query.limit]
+
+            # 페이지가 비어 있으면 개수가 함께 오지 않으므로 (페이지 범위 초과 등) 따로 조회
+            if total_count is None:
+                if after is None and query.page == 1:
+                    total_count = 0
+                else:
+                    total_count = await self.feed_repository.count_organization_feeds(
+                        organization_id=organization_id,
+                        category_id=query.category_id
+                    )
             
             # 전체 페이지 수 계산 (올림 처리)
             total_pages = math.ceil(total_count / query.limit) if total_count > 0 else 0
             
-            # 현재 페이지가 범위를 벗어나는 경우 공백 리스트 반환
-            if query.page > total_pages and total_count > 0:
-                feeds_list = []
-                page_feeds_data = []
-            else:
-                # 페이지별 데이터 슬라이싱 계산
-                start_index = (query.page - 1) * query.limit
-                end_index = start_index + query.limit
+            # Repository 데이터를 스키마 형태로 변환 (페이지 범위를 벗어나면 빈 리스트)
+            feeds_list = []
+            for feed_data in page_feeds_data:
+                # 카테고리 정보를 CategoryInfo 객체로 변환
+                category_info = CategoryInfo(
+                    id=feed_data['category_id'],
+                    name=feed_data['category_name']
+                )
                 
-                # 해당 페이지의 데이터만 추출
-                page_feeds_data = feeds_data[start_index:end_index]
+                # 평균 별점이 None인 경우 0.0으로 변환
+                average_rating = feed_data['average_rating'] if feed_data['average_rating'] is not None else 0.0
                 
-                # Repository 데이터를 스키마 형태로 변환
-                feeds_list = []
-                for feed_data in page_feeds_data:
-                    # 카테고리 정보를 CategoryInfo 객체로 변환
-                    category_info = CategoryInfo(
-                        id=feed_data['category_id'],
-                        name=feed_data['category_name']
-                    )
-                    
-                    # 평균 별점이 None인 경우 0.0으로 변환
-                    average_rating = feed_data['average_rating'] if feed_data['average_rating'] is not None else 0.0
-                    
-                    # OrganizationFeedItem 객체 생성
-                    feed_item = OrganizationFeedItem(
-                        id=feed_data['id'],
-                        title=feed_data['title'],
-                        category=category_info,
-                        summary=feed_data['summary'],
-                        published_date=feed_data['published_date'],
-                        view_count=feed_data['view_count'],
-                        average_rating=average_rating,
-                        bookmark_count=feed_data['bookmark_count']
-                    )
-                    feeds_list.append(feed_item)
+                # OrganizationFeedItem 객체 생성
+                feed_item = OrganizationFeedItem(
+                    id=feed_data['id'],
+                    title=feed_data['title'],
+                    category=category_info,
+                    summary=feed_data['summary'],
+                    published_date=feed_data['published_date'],
+                    view_count=feed_data['view_count'],
+                    average_rating=average_rating,
+                    bookmark_count=feed_data['bookmark_count']
+                )
+                feeds_list.append(feed_item)
             
             # 기관 정보 생성 (빈 결과여도 항상 표시)
-            organization_info = None
-            if feeds_data:
-                # 데이터가 있는 경우 첫 번째 항목에서 기관 정보 추출
-                first_feed = feeds_data[0]
-                organization_info = OrganizationInfo(
-                    id=first_feed['organization_id'],
-                    name=first_feed['organization_name']
-                )
-            else:
-                # 빈 결과인 경우 기관명으로 기관 정보 생성 (ID는 임시로 0 설정)
-                # 실제로는 기관 정보를 별도로 조회해야 하지만, 현재는 간단히 처리
-                organization_info = OrganizationInfo(
-                    id=0,  # 임시 ID
-                    name=organization_name
-                )
+            organization_info = OrganizationInfo(
+                id=organization_id,
+                name=organization_name
+            )
+
+            # 다음 페이지가 있으면 마지막 항목 위치로 커서 생성
+            next_cursor = None
+            if has_more and page_feeds_data:
+                last_feed = page_feeds_data[-1]
+                next_cursor = encode_cursor(last_feed['published_date'], last_feed['id'])
             
             # 페이지네이션 정보 계산
             pagination_info = PaginationInfo(
@@ -247,8 +285,8 @@ class FeedService:
                 total_pages=total_pages,
                 total_count=total_count,
                 limit=query.limit,
-                has_next=query.page < total_pages,
-                has_previous=query.page > 1
+                has_next=has_more,
+                has_previous=after is not None or query.page > 1
             )
             
             # 필터 정보 생성 (category_id가 제공된 경우)
@@ -266,7 +304,8 @@ class FeedService:
                 organization=organization_info,
                 feeds=feeds_list,
                 pagination=pagination_info,
-                filter=filter_info
+                filter=filter_info,
+                next_cursor=next_cursor
             )
             
             # 최종 응답 반환
@@ -431,65 +470,20 @@ class FeedService:
     #   Top5FeedResponse - 성공 시 TOP5 피드 데이터
     #   ErrorResponse - 실패 시 에러 정보
     # 설명: 
-    #   조회수, 평균 별점, 북마크 수 기준으로 각각 상위 피드를 조회
-    #   Repository에서 None 반환 시 빈 리스트로 처리
+    #   조회수, 평균 별점, 북마크 수 기준 상위 피드를 Redis에 미리 계산된 순위(LeaderboardStore)에서 한 번에 읽음
+    #   캐시가 비어 있으면 잠금을 얻은 한 요청만 세 순위를 DB에서 계산하여 캐시를 채우고, 나머지는 채워진 결과를 기다림
     #   예외 발생 시 로깅 후 표준화된 에러 응답 반환
     async def get_top5_feeds(self, limit: int) -> Top5FeedResponse:
         try:
-            # Repository를 통해 3가지 기준별 상위 피드 데이터 조회
-            top_viewed_data = await self.feed_repository.get_top5_viewed(limit)
-            top_rated_data = await self.feed_repository.get_top5_rated(limit)
-            top_bookmarked_data = await self.feed_repository.get_top5_bookmarked(limit)
-            
-            # None인 경우 빈 리스트로 처리
-            top_viewed_data = top_viewed_data or []
-            top_rated_data = top_rated_data or []
-            top_bookmarked_data = top_bookmarked_data or []
-            
-            # 조회수 기준 피드 데이터를 스키마에 맞게 변환
-            most_viewed_items = []
-            for feed in top_viewed_data:
-                feed_item = Top5FeedItem(
-                    id=feed['id'],
-                    title=feed['title'],
-                    organization=feed['organization_name'], 
-                    average_rating=feed['average_rating'] if feed['average_rating'] is not None else 0.0,
-                    view_count=feed['view_count'],
-                    bookmark_count=feed['bookmark_count']
-                )
-                most_viewed_items.append(feed_item)
-            
-            # 평균 별점 기준 피드 데이터를 스키마에 맞게 변환
-            top_rated_items = []
-            for feed in top_rated_data:
-                feed_item = Top5FeedItem(
-                    id=feed['id'],
-                    title=feed['title'],
-                    organization=feed['organization_name'], 
-                    average_rating=feed['average_rating'],  # 별점 기준이므로 항상 값 존재
-                    view_count=feed['view_count'],
-                    bookmark_count=feed['bookmark_count']
-                )
-                top_rated_items.append(feed_item)
-            
-            # 북마크 수 기준 피드 데이터를 스키마에 맞게 변환
-            most_bookmarked_items = []
-            for feed in top_bookmarked_data:
-                feed_item = Top5FeedItem(
-                    id=feed['id'],
-                    title=feed['title'],
-                    organization=feed['organization_name'], 
-                    average_rating=feed['average_rating'] if feed['average_rating'] is not None else 0.0,
-                    view_count=feed['view_count'],
-                    bookmark_count=feed['bookmark_count']
-                )
-                most_bookmarked_items.append(feed_item)
+            leaderboards = await self._get_cached_leaderboards()
+            if leaderboards is None:
+                leaderboards = await self._fill_leaderboards()
             
-            # TOP5 피드 데이터 객체 생성
+            # TOP5 피드 데이터 객체 생성 (요청한 개수만큼 잘라서 스키마에 맞게 변환)
             top5_feed_data = Top5FeedData(
-                top_rated=top_rated_items,
-                most_viewed=most_viewed_items,
-                most_bookmarked=most_bookmarked_items
+                top_rated=self._to_top5_items(leaderboards.get('top_rated', [])[:limit]),
+                most_viewed=self._to_top5_items(leaderboards.get('most_viewed', [])[:limit]),
+                most_bookmarked=self._to_top5_items(leaderboards.get('most_bookmarked', [])[:limit])
             )
             
             # 성공 응답 반환
@@ -508,6 +502,44 @@ class FeedService:
                     message=Message.INTERNAL_ERROR
                 )
             )
+
+    async def _get_cached_leaderboards(self) -> Optional[Dict[str, Any]]:
+        """Redis에 저장된 순위 조회. 저장소가 없거나, 캐시가 비었거나, Redis 장애 시 None"""
+        if self.leaderboard_store is None:
+            return None
+        try:
+            return await self.leaderboard_store.get()
+        except RedisError as e:
+            logger.warning(f"Failed to read cached leaderboards, falling back to DB: {e}")
+            return None
+
+    async def _fill_leaderboards(self) -> Dict[str, Any]:
+        """콜드 캐시 경로: 동시에 들어온 요청 중 한 곳만 순위를 계산하여 캐시에 채움 (저장소가 없으면 직접 계산)"""
+        if self.leaderboard_store is None:
+            return await compute_leaderboards(LEADERBOARD_SIZE)
+        return await fill_leaderboards(self.leaderboard_store)
+
+    @staticmethod
+    def _next_cursor(items: List[Dict[str, Any]], has_more: bool) -> Optional[str]:
+        """다음 페이지가 있으면 마지막 항목의 정렬 키 (published_date, id)로 커서를 만듦"""
+        if not has_more or not items:
+            return None
+        return encode_cursor(items[-1]['published_date'], items[-1]['id'])
+
+    @staticmethod
+    def _to_top5_items(feeds: List[Dict[str, Any]]) -> List[Top5FeedItem]:
+        """순위 피드 dict 목록을 Top5FeedItem 목록으로 변환 (평균 별점이 None이면 0.0)"""
+        return [
+            Top5FeedItem(
+                id=feed['id'],
+                title=feed['title'],
+                organization=feed['organization_name'],
+                average_rating=feed['average_rating'] if feed['average_rating'] is not None else 0.0,
+                view_count=feed['view_count'],
+                bookmark_count=feed['bookmark_count']
+            )
+            for feed in feeds
+        ]
     
     # 기관별 보도자료 목록 조회 서비스
     # 입력: 
@@ -523,12 +555,25 @@ class FeedService:
     #   예외 발생 시 로깅 후 표준화된 에러 응답 반환
     async def get_organization_press_releases(self, organization_name: str, query: PressReleaseQuery) -> PressReleaseResponse:
         try:
+            # 커서 방식이면 커서를 정렬 키로 디코딩 (page는 하위 호환용으로 유지)
+            after = None
+            if query.cursor:
+                try:
+                    after = decode_cursor(query.cursor)
+                except ValueError:
+                    return ErrorResponse(
+                        error=ErrorDetail(
+                            code=ErrorCode.INVALID_PARAMETER,
+                            message=Message.INVALID_CURSOR
+                        )
+                    )
+
             # offset 계산 (페이지네이션용)
             offset = (query.page - 1) * query.limit
             
             # Repository를 통해 기관별 보도자료 데이터 조회
             press_data = await self.feed_repository.get_organization_press(
-                organization_name, offset, query.limit
+                organization_name, offset, query.limit, after=after
             )
             
             # Repository에서 None 반환 시 (데이터 없음) 에러 응답
@@ -575,14 +620,15 @@ class FeedService:
                 total_count=0,  # 더보기 방식이므로 의미 없음
                 limit=query.limit,
                 has_next=press_data['has_more'],  # Repository의 has_more 사용
-                has_previous=query.page > 1
+                has_previous=after is not None or query.page > 1
             )
             
-            # 보도자료 데이터 객체 생성
+            # 보도자료 데이터 객체 생성 (다음 페이지가 있으면 마지막 항목 위치로 커서 생성)
             press_release_data = PressReleaseData(
                 organization=organization_info,
                 press_releases=press_release_items,
-                pagination=pagination_info
+                pagination=pagination_info,
+                next_cursor=self._next_cursor(press_data['press_releases'], press_data['has_more'])
             )
             
             # 성공 응답 반환
@@ -606,19 +652,34 @@ class FeedService:
     # 입력: 
     #   feed_id - 조회할 피드 ID (int)
     # 반환: 
+    #   (응답, 검증자) 튜플
     #   FeedDetailResponse - 성공 시 피드 상세 데이터
     #   ErrorResponse - 실패 시 에러 정보
+    #   ResourceValidator - 조건부 요청(ETag / Last-Modified)용 검증자, 실패 시 None
     # 설명: 
     #   특정 피드의 상세 정보를 조회하여 피드 상세 페이지용 데이터로 변환
     #   PDF 통째로 전달해버림
-    #   조회 성공 시 해당 피드의 조회수를 1 증가시킴
+    #   상세 정보, 집계 통계(feed_stats), 로그인 사용자의 북마크 여부/별점을 한 번의 SQL로 조회하고,
+    #   아직 DB에 반영되지 않은 버퍼 조회수(Redis)는 같은 시간에 동시에 읽음
+    #   조회수 기록은 응답 경로에서 빼서 background_tasks로 응답 이후에 실행함
+    #   (Redis 버퍼에 기록, 같은 사용자/IP의 반복 조회는 한 번으로 셈. background_tasks가 없으면 바로 기록)
+    #   응답의 조회수는 DB 값에 버퍼 조회수를 더한 값 (이번 조회는 응답 이후 기록되므로 포함하지 않음)
+    #   검증자는 같은 상세 쿼리에서 읽은 수정 시각으로 만듦 (버전 확인용 쿼리를 따로 실행하지 않음)
     #   Repository에서 None 반환 시 적절한 에러 메시지 제공
     #   예외 발생 시 로깅 후 표준화된 에러 응답 반환
     async def get_feed_detail_for_page(
-        self, feed_id: int, user_id: Optional[int] = None
-    ) -> Union[FeedDetailResponse, ErrorResponse]:
+        self,
+        feed_id: int,
+        user_id: Optional[int] = None,
+        client_ip: Optional[str] = None,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> Tuple[Union[FeedDetailResponse, ErrorResponse], Optional[ResourceValidator]]:
         try:
-            feed_data = await self.feed_repository.get_feed_detail(feed_id)
+            # 상세/통계/사용자 상태/수정 시각(SQL 1회)과 버퍼 조회수(Redis)를 동시에 조회
+            feed_data, pending_views = await asyncio.gather(
+                self.feed_repository.get_feed_detail(feed_id, user_id or None),
+                self._get_pending_views(feed_id)
+            )
             
             if feed_data is None:
                 return ErrorResponse(
@@ -626,29 +687,19 @@ class FeedService:
                         code=ErrorCode.NOT_FOUND,
                         message=Message.NOT_FOUND
                     )
-                )
+                ), None
 
-            # 조회수 증가
-            await self.feed_repository.increment_feed_view_count(feed_id)
-            
+            # 조회수 기록은 응답 이후에 실행 (존재하는 피드만 기록)
+            await self.record_feed_view(feed_id, user_id, client_ip, background_tasks)
+            view_count = feed_data['view_count'] + pending_views
             
             # 1. pdf_url 생성
             pdf_url = f"{Settings.STATIC_FILES_URL}/feeds_pdf/{feed_data['pdf_file_path']}"
             # pdf_url = f"{feed_data['pdf_file_path']}"
 
-            # 2. 사용자별 정보 초기화
-            is_bookmarked = None
-            user_rating = None
-
-            # 3. 로그인한 사용자(user_id가 주어짐)인 경우, 추가 정보 조회
-            if user_id:
-                # 북마크 여부 확인
-                bookmark = await self.feed_repository.get_bookmark(user_id, feed_id)
-                is_bookmarked = bookmark is not None
-                
-                # 사용자가 매긴 별점 확인
-                rating = await self.feed_repository.get_user_rating_for_feed(user_id, feed_id)
-                user_rating = rating.score if rating else None
+            # 2. 사용자별 정보 (비로그인이면 None, 로그인 사용자는 상세 쿼리에서 함께 조회됨)
+            is_bookmarked = feed_data['is_bookmarked']
+            user_rating = feed_data['user_rating']
             
             organization_info = OrganizationInfo(id=feed_data['organization_id'], name=feed_data['organization_name'])
             category_info = CategoryInfo(id=feed_data['category_id'], name=feed_data['category_name'])
@@ -660,7 +711,7 @@ class FeedService:
                 category=category_info,
                 summary=feed_data['summary'],
                 average_rating=feed_data['average_rating'],
-                view_count=feed_data['view_count'] + 1, # 조회수 증가를 즉시 반영
+                view_count=view_count,
                 bookmark_count=feed_data['bookmark_count'],
                 published_date=feed_data['published_date'],
                 source_url=feed_data['source_url'],
@@ -672,7 +723,7 @@ class FeedService:
             
             feed_detail_data = FeedDetailData(feed=feed_detail)
             
-            return FeedDetailResponse(success=True, data=feed_detail_data)
+            return FeedDetailResponse(success=True, data=feed_detail_data), self._feed_detail_validator(feed_data, user_id)
             
         except Exception as e:
             logger.error(f"Error in get_feed_detail_for_page: {e}", exc_info=True)
@@ -681,9 +732,80 @@ class FeedService:
                     code=ErrorCode.INTERNAL_ERROR,
                     message=Message.INTERNAL_ERROR
                 )
-            )
+            ), None
         
 
+    async def _get_pending_views(self, feed_id: int) -> int:
+        """아직 DB에 반영되지 않은 버퍼 조회수. 버퍼가 없거나 Redis 장애 시 0 (DB 조회수만 표시)"""
+        if self.view_buffer is None:
+            return 0
+        try:
+            return await self.view_buffer.get_pending(feed_id)
+        except RedisError as e:
+            logger.warning(f"Failed to read buffered view count - feed_id: {feed_id}, error: {e}")
+            return 0
+
+    # 피드 조회 기록 서비스 메서드
+    # 입력:
+    #   feed_id - 피드 ID, user_id - 사용자 PK (비로그인 시 None), client_ip - 비로그인 사용자의 중복 조회 판단용 IP
+    #   background_tasks - 주어지면 응답을 보낸 뒤 기록 (없으면 바로 기록)
+    # 설명: 304(Not Modified)처럼 상세 본문을 다시 만들지 않는 조회도 조회수에 반영함 (실패해도 응답에는 영향 없음)
+    async def record_feed_view(
+        self,
+        feed_id: int,
+        user_id: Optional[int] = None,
+        client_ip: Optional[str] = None,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> None:
+        viewer = f"user:{user_id}" if user_id else (f"ip:{client_ip}" if client_ip else None)
+        if background_tasks is not None:
+            background_tasks.add_task(record_feed_view, feed_id, viewer, self.view_buffer)
+            return
+        try:
+            await record_feed_view(feed_id, viewer, self.view_buffer)
+        except Exception as e:
+            logger.error(f"Error recording view for feed {feed_id}: {e}", exc_info=True)
+
+    # 피드 목록 조건부 요청 검증자 조회 메서드
+    # 입력: organization_name - 기관명 (None이면 메인 페이지 전체 피드 목록 기준)
+    # 반환: ResourceValidator (ETag / Last-Modified), 조회 실패 시 None
+    # 설명:
+    #   DB를 읽지 않고 Redis의 피드/기관 콘텐츠 버전만 읽음 (관리자 변경, 별점/북마크 등록 시 올라감)
+    #   조회수 flush는 버전을 바꾸지 않으므로, 목록의 조회수만 다른 응답은 같은 내용으로 봄 (약한 ETag)
+    #   페이지마다 URL이 다르므로 같은 버전을 공유해도 됨
+    async def get_feed_list_validator(self, organization_name: Optional[str] = None) -> Optional[ResourceValidator]:
+        try:
+            parts, last_modified = await content_version_store.get(CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS)
+        except RedisError as e:
+            logger.warning(f"Error resolving feed list version for {organization_name or 'all'}: {e}")
+            return None
+        return ResourceValidator.from_parts("feeds", organization_name, *parts, last_modified=last_modified)
+
+    @staticmethod
+    def _feed_detail_validator(feed_data: Dict[str, Any], user_id: Optional[int]) -> ResourceValidator:
+        """
+        피드 상세 조건부 요청 검증자. 로그인 사용자별 북마크/별점이 응답에 포함되므로 사용자 PK도 ETag에 반영함
+        응답의 조회수에는 버퍼 조회수가 더해지지만, 조회수만 다른 응답은 같은 내용으로 봄 (약한 ETag)
+        """
+        timestamps = feed_data['version_timestamps']
+        present = [value for value in timestamps if value is not None]
+        return ResourceValidator.from_parts(
+            "feed_detail", user_id, feed_data['id'], *timestamps,
+            last_modified=max(present) if present else None
+        )
+
+    # TOP5 조건부 요청 검증자 조회 메서드
+    # 반환: ResourceValidator, Redis에 순위가 없으면 None
+    # 설명: 순위 문서의 버전(갱신 시각)이 곧 ETag이며, 순위를 다시 계산할 때만 바뀜
+    async def get_top5_validator(self) -> Optional[ResourceValidator]:
+        leaderboards = await self._get_cached_leaderboards()
+        if leaderboards is None:
+            return None
+        computed_at = datetime.fromisoformat(leaderboards['computed_at']) if leaderboards.get('computed_at') else None
+        return ResourceValidator.from_parts("top5", leaderboards.get('version'), last_modified=computed_at)
+
+    # 별점/북마크는 목록의 평점/북마크 수를 바꾸므로 성공 시 피드 콘텐츠 버전을 올림 (등록/삭제는 저장소에서 커밋된 뒤임)
+    @bumps_content_version(CACHE_TAG_FEEDS)
     async def post_feed_rating(self, feed_id: int, user_id: str, score: int)-> RatingResponse:
         try:
             # user_id를 통해 user pk 구하기
@@ -758,6 +880,7 @@ class FeedService:
                 )
             )
     
+    @bumps_content_version(CACHE_TAG_FEEDS)
     async def post_feed_bookmark(self, feed_id: int, user_id: str) -> BookmarkResponse | ErrorResponse:
         # user_id로 user_pk 조회
         user_pk = await self.feed_repository.get_user_pk_by_user_id(user_id)
@@ -817,12 +940,25 @@ class FeedService:
     # ============================
     async def get_organization_policy_news(self, organization_name: str, query: PolicyNewsQuery) -> PolicyNewsResponse:
         try: 
+            # 커서 방식이면 커서를 정렬 키로 디코딩 (page는 하위 호환용으로 유지)
+            after = None
+            if query.cursor:
+                try:
+                    after = decode_cursor(query.cursor)
+                except ValueError:
+                    return ErrorResponse(
+                        error=ErrorDetail(
+                            code=ErrorCode.INVALID_PARAMETER,
+                            message=Message.INVALID_CURSOR
+                        )
+                    )
+
             # offset 계산(페이지네이션용)
             offset = (query.page - 1) * query.limit 
 
             # Repository를 통해 기관별 정책뉴스 데이터 조회
             news_data = await self.feed_repository.get_organization_news(
-                organization_name, offset, query.limit
+                organization_name, offset, query.limit, after=after
             )
 
             # Repository에서 None 반환 시 (데이터 없음) 에러 응답
@@ -869,14 +1005,15 @@ class FeedService:
                 total_count=0,  # 더보기 방식이므로 의미 없음
                 limit=query.limit,
                 has_next=news_data['has_more'],  # Repository의 has_more 사용
-                has_previous=query.page > 1
+                has_previous=after is not None or query.page > 1
             )
 
-            # 정책뉴스 데이터 객체 생성 
+            # 정책뉴스 데이터 객체 생성 (다음 페이지가 있으면 마지막 항목 위치로 커서 생성)
             policy_news_data = PolicyNewsData(
                 organization=organization_info,
                 policy_news=policy_news_items,
-                pagination=pagination_info
+                pagination=pagination_info,
+                next_cursor=self._next_cursor(news_data['policy_news'], news_data['has_more'])
             )
 
             # 성공 응답 반환
@@ -1,8 +1,11 @@
 import logging
 import math
-from typing import Union, Dict, Any, List
+from typing import Union, Dict, Any, List, Callable, AsyncContextManager
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.F3_repositories.graph import GraphRepository
+from app.F3_repositories.keyword import KeywordRepository
 from app.F6_schemas.graph import (
     ExploreGraphResponse, 
     ExploreGraphData, 
@@ -21,9 +24,16 @@ class GraphService:
     """
     그래프 데이터베이스와 관련된 비즈니스 로직을 처리하는 서비스.
     - 리포지토리로부터 받은 데이터를 API 응답 스키마에 맞게 가공하고 변환함.
+    - MySQL 세션은 워드클라우드 조회에서만 필요하므로, 의존성으로 세션을 받지 않고
+      keyword_session_scope(읽기 세션 컨텍스트 매니저)로 그때만 엶 (Neo4j만 쓰는 탐색/확장 API는 DB 커넥션을 잡지 않음)
     """
-    def __init__(self, repo: GraphRepository):
+    def __init__(
+        self,
+        repo: GraphRepository,
+        keyword_session_scope: Callable[[], AsyncContextManager[AsyncSession]] | None = None,
+    ):
         self.repo = repo
+        self.keyword_session_scope = keyword_session_scope
 
     async def get_initial_graph_by_keyword(
         self, keyword: str
@@ -259,10 +269,17 @@ class GraphService:
     ) -> Union[WordCloudResponse, ErrorResponse]:
         """
         워드클라우드 또는 인기 키워드 목록을 위한 데이터를 조회하고 구조화함.
+        - 파이프라인이 MySQL에 미리 계산해 둔 워드클라우드를 우선 사용하고,
+          아직 적재된 데이터가 없으면 Neo4j 집계 쿼리로 대체함.
         """
         try:
-            # 1. 리포지토리를 호출하여 Neo4j로부터 원시 데이터를 가져옴
-            keywords_data = await self.repo.get_keywords_by_popularity(organization_name, limit)
+            # 1. 미리 계산된 워드클라우드 조회, 없으면 Neo4j로부터 원시 데이터를 가져옴
+            keywords_data = []
+            if self.keyword_session_scope is not None:
+                async with self.keyword_session_scope() as db:
+                    keywords_data = await KeywordRepository(db).get_popular_keywords(organization_name, limit)
+            if not keywords_data:
+                keywords_data = await self.repo.get_keywords_by_popularity(organization_name, limit)
             
             # 2. Pydantic 스키마를 사용하여 응답 데이터의 유효성을 검증하고 구조를 맞춤.
             #    데이터가 없는 경우(keywords_data가 빈 리스트인 경우)에도 
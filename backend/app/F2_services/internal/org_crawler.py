@@ -18,6 +18,7 @@ from fastapi import BackgroundTasks
 
 from app.F3_repositories.internal.org_crawler import OrgCrawlerRepository
 from app.F5_core.config import settings
+from app.F5_core.response_cache import invalidate_cache_tags, CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS
 from app.F6_schemas.base import Settings
 from app.F6_schemas.internal.org_korea_dot_kr import (
     OrgPressReleaseItem,
@@ -50,6 +51,13 @@ class OrgCrawlerDataReceiverService:
         self.PDF_STORAGE_PATH = Path(Settings.PDF_STORAGE_PATH)
         self.PDF_STORAGE_PATH.mkdir(parents=True, exist_ok=True)
 
+    async def _publish_feed_change(self):
+        """
+        크롤러가 피드를 생성/갱신한 뒤 공개 피드/기관 응답 캐시를 비우고 콘텐츠 버전(ETag)을 올림
+        (관리자 서비스의 invalidates_cache와 같은 처리. 항목마다 처리가 끝난 시점에 한 번 호출함)
+        """
+        await invalidate_cache_tags(CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS)
+
     # =========================================================
     # [보도자료] - 테스트용
     # =========================================================
@@ -197,6 +205,9 @@ class OrgCrawlerDataReceiverService:
             if final_file_path and final_file_path.exists():
                 logger.warning(f"오류 발생으로 인해 최종 파일 삭제: {final_file_path}")
                 os.remove(final_file_path)
+        finally:
+            if new_feed:
+                await self._publish_feed_change()
         # finally:
         #     # HWPX/HWP는 변환 후 임시 파일이 아니라 최종 파일이므로 여기서는 삭제하지 않음
         #     # PDF의 경우, final_file_path가 직접 다운로드된 PDF이므로 삭제하지 않음
@@ -531,6 +542,9 @@ class OrgCrawlerDataReceiverService:
             logger.error(f"'{item.title}' 처리 중 오류 발생: {e}", exc_info=True)
             if new_feed:
                 await self.crawler_repo.update_feed_status(new_feed.id, ProcessingStatusEnum.FAILED)
+        finally:
+            if new_feed:
+                await self._publish_feed_change()
 
 
     async def _extract_body_from_detail_page(self, detail_url: str) -> tuple[str | None, str | None]:
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import logging
+import secrets
+import time
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.F3_repositories.feed import FeedRepository
+from app.F5_core.redis import client_redis
+from app.F8_database.connection import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 순위별로 미리 계산해 둘 피드 수 (Top5FeedQuery.limit의 최댓값)
+LEADERBOARD_SIZE = 10
+# 순위 갱신 주기. 스케줄러가 이 주기로 refresh_leaderboards를 실행함
+LEADERBOARD_REFRESH_INTERVAL_SECONDS = 60
+# 캐시 보존 기간. 갱신이 멈추면 만료되어 DB 조회(콜드 캐시 경로)로 돌아감
+LEADERBOARD_TTL_SECONDS = 10 * 60
+
+# 순위 계산 잠금 유지 시간 (계산 도중 프로세스가 죽어도 이 시간 뒤에는 다른 워커/요청이 다시 계산함)
+LEADERBOARD_LOCK_TTL_SECONDS = 30
+# 캐시가 비어 있을 때, 다른 요청/워커가 계산 중이면 결과를 기다리는 최대 시간과 확인 간격
+LEADERBOARD_FILL_WAIT_SECONDS = 2.0
+LEADERBOARD_FILL_POLL_SECONDS = 0.05
+
+# 잠금 값이 자신의 토큰일 때만 삭제 (TTL이 지나 다른 워커가 잡은 잠금을 지우지 않도록)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# 순위 이름 -> FeedRepository 조회 메서드
+LEADERBOARD_QUERIES = {
+    "most_viewed": "get_top5_viewed",
+    "top_rated": "get_top5_rated",
+    "most_bookmarked": "get_top5_bookmarked",
+}
+
+# {"most_viewed": [피드 dict, ...], "top_rated": [...], "most_bookmarked": [...]}
+Leaderboards = Dict[str, List[Dict[str, Any]]]
+
+
+async def compute_leaderboards(limit: int = LEADERBOARD_SIZE, session_factory=AsyncSessionLocal) -> Leaderboards:
+    """
+    [비동기] 조회수/평균 별점/북마크 수 순위를 DB에서 계산함.
+    - 하나의 세션으로는 쿼리를 동시에 실행할 수 없으므로, 순위마다 별도 세션을 열어 세 쿼리를 동시에 실행함.
+    """
+    async def run(method_name: str) -> List[Dict[str, Any]]:
+        async with session_factory() as db:
+            return await getattr(FeedRepository(db), method_name)(limit) or []
+
+    results = await asyncio.gather(*(run(method_name) for method_name in LEADERBOARD_QUERIES.values()))
+    return dict(zip(LEADERBOARD_QUERIES.keys(), results))
+
+
+class LeaderboardStore:
+    """
+    메인 페이지 TOP5 순위를 Redis에 저장하고 조회하는 저장소.
+    - 키: leaderboard:top5 -> {"version", "computed_at", "most_viewed": [...], "top_rated": [...], "most_bookmarked": [...]}
+    - 세 순위를 한 JSON 문서로 한 번에 SET 하므로, 조회하는 쪽은 GET 한 번으로 항상 같은 버전의 세 순위를 읽음.
+    - leaderboard:top5:lock : 순위 계산 잠금. 스케줄러 갱신과 콜드 캐시 채우기 모두 이 잠금을 얻은 한 곳에서만 DB를 조회함.
+    """
+    key = "leaderboard:top5"
+    lock_key = "leaderboard:top5:lock"
+
+    def __init__(self, redis: Redis = client_redis, ttl_seconds: int = LEADERBOARD_TTL_SECONDS):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """저장된 순위 문서를 조회함. 없으면 None."""
+        raw = await self.redis.get(self.key)
+        return json.loads(raw) if raw else None
+
+    async def save(self, leaderboards: Leaderboards) -> str:
+        """순위를 새 버전으로 저장하고 버전 문자열을 반환함."""
+        version = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        document = {"version": version, "computed_at": datetime.now().isoformat(), **leaderboards}
+        await self.redis.set(self.key, json.dumps(document, ensure_ascii=False), ex=self.ttl_seconds)
+        return version
+
+    async def acquire_lock(self) -> Optional[str]:
+        """잠금을 얻으면 해제할 때 쓸 토큰을, 다른 곳에서 계산 중이면 None을 반환함"""
+        token = secrets.token_hex(16)
+        if await self.redis.set(self.lock_key, token, nx=True, ex=LEADERBOARD_LOCK_TTL_SECONDS):
+            return token
+        return None
+
+    async def release_lock(self, token: str) -> None:
+        """자신이 잡은 잠금(token)일 때만 해제함"""
+        await self.redis.eval(_RELEASE_LOCK_SCRIPT, 1, self.lock_key, token)
+
+
+async def refresh_leaderboards(store: Optional[LeaderboardStore] = None) -> Optional[str]:
+    """
+    [비동기] 순위를 다시 계산하여 Redis에 저장함. (스케줄러에서 주기적으로 호출)
+    모든 워커의 스케줄러가 같은 주기로 호출하므로, 잠금을 얻은 한 워커만 계산함.
+    반환: 저장된 버전 (다른 곳에서 계산 중이거나 Redis 장애 시 None)
+    """
+    store = store or LeaderboardStore()
+    try:
+        lock_token = await store.acquire_lock()
+    except RedisError as e:
+        logger.error(f"Failed to acquire leaderboard lock: {e}", exc_info=True)
+        return None
+    if lock_token is None:
+        # 다른 워커의 스케줄러(또는 콜드 캐시 요청)가 계산 중이므로 이번 주기는 건너뜀
+        return None
+
+    try:
+        leaderboards = await compute_leaderboards(LEADERBOARD_SIZE)
+        version = await store.save(leaderboards)
+    except RedisError as e:
+        logger.error(f"Failed to store leaderboards: {e}", exc_info=True)
+        return None
+    finally:
+        await _release_lock_quietly(store, lock_token)
+    logger.info(f"Refreshed leaderboards (version {version}).")
+    return version
+
+
+async def fill_leaderboards(store: LeaderboardStore) -> Dict[str, Any]:
+    """
+    [비동기] 캐시가 비어 있을 때(콜드 캐시) 순위를 채움. 동시에 들어온 요청 중 한 곳만 DB를 조회함 (single-flight).
+    - 잠금을 얻은 요청: 순위를 계산하여 저장하고 반환함
+    - 그 외: 잠시 기다렸다가 채워진 순위 문서를 반환하고, 기다려도 채워지지 않으면 직접 계산함 (저장하지 않음)
+    - Redis 장애 시: 직접 계산함
+    반환: 순위 문서 (version / computed_at은 저장된 경우에만 포함)
+    """
+    try:
+        lock_token = await store.acquire_lock()
+    except RedisError as e:
+        logger.warning(f"Leaderboard cache unavailable, computing from DB: {e}")
+        return await compute_leaderboards(LEADERBOARD_SIZE)
+
+    if lock_token is not None:
+        try:
+            leaderboards = await compute_leaderboards(LEADERBOARD_SIZE)
+            try:
+                await store.save(leaderboards)
+            except RedisError as e:
+                logger.warning(f"Failed to store leaderboards: {e}")
+            return leaderboards
+        finally:
+            await _release_lock_quietly(store, lock_token)
+
+    deadline = time.monotonic() + LEADERBOARD_FILL_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LEADERBOARD_FILL_POLL_SECONDS)
+        try:
+            document = await store.get()
+        except RedisError:
+            break
+        if document is not None:
+            return document
+    return await compute_leaderboards(LEADERBOARD_SIZE)
+
+
+async def _release_lock_quietly(store: LeaderboardStore, token: str) -> None:
+    try:
+        await store.release_lock(token)
+    except RedisError as e:
+        logger.warning(f"Failed to release leaderboard lock: {e}")
@@ -1,11 +1,16 @@
 import logging
 
-from typing import Union
+from typing import Union, Optional
 from pathlib import Path
 from datetime import date
 import random
 
 from app.F3_repositories.organization import OrganizationRepository
+from redis.exceptions import RedisError
+
+from app.F5_core.conditional_request import ResourceValidator
+from app.F5_core.content_version import content_version_store
+from app.F5_core.response_cache import CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS, CACHE_TAG_WORDCLOUD
 from app.F6_schemas.organization import (
     OrganizationListResponse, 
     OrganizationListData, 
@@ -63,6 +68,34 @@ class OrganizationService:
             
         return items
     
+    async def _build_validator(self, label: str, tags: tuple, *args) -> Optional[ResourceValidator]:
+        """태그의 콘텐츠 버전으로 ResourceValidator를 만듦. Redis 조회 실패 시 None (조건부 처리 없이 본문 응답)"""
+        try:
+            parts, last_modified = await content_version_store.get(*tags)
+        except RedisError as e:
+            logger.warning(f"Error resolving {label} version {args}: {e}")
+            return None
+        return ResourceValidator.from_parts(label, *args, *parts, last_modified=last_modified)
+
+    # 조건부 요청(ETag / Last-Modified) 검증자 조회 메서드들
+    # 입력: org_name - 기관명
+    # 반환: ResourceValidator 또는 None
+    # 설명: DB를 읽지 않고 Redis의 콘텐츠 버전만 읽음 (관리자 변경/별점/북마크/파이프라인 적재 시 올라가고, 조회수 flush로는 바뀌지 않음)
+    #   - 기관 목록(원형 그래프), 기관 요약/카테고리: 피드 + 기관 버전
+    #   - 기관 아이콘: 기관 버전
+    #   - 기관 워드클라우드: 워드클라우드 + 기관 버전
+    async def get_organization_list_validator(self) -> Optional[ResourceValidator]:
+        return await self._build_validator("organizations", (CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS))
+
+    async def get_organization_feeds_validator(self, org_name: str) -> Optional[ResourceValidator]:
+        return await self._build_validator("organization_feeds", (CACHE_TAG_FEEDS, CACHE_TAG_ORGANIZATIONS), org_name)
+
+    async def get_organization_icon_validator(self, org_name: str) -> Optional[ResourceValidator]:
+        return await self._build_validator("organization_icon", (CACHE_TAG_ORGANIZATIONS,), org_name)
+
+    async def get_organization_wordcloud_validator(self, org_name: str) -> Optional[ResourceValidator]:
+        return await self._build_validator("organization_wordcloud", (CACHE_TAG_WORDCLOUD, CACHE_TAG_ORGANIZATIONS), org_name)
+
     # 메인페이지 원형 그래프용 기관 목록과 비율 조회 메서드
     # 입력: 없음
     # 반환: 
@@ -0,0 +1,155 @@
+import logging
+import secrets
+from typing import Dict, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.F3_repositories.feed import FeedRepository
+from app.F5_core.redis import client_redis
+from app.F8_database.connection import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 같은 사용자/IP의 반복 조회를 한 번으로 세는 기간 (0이면 중복 제거 안 함)
+VIEW_DEDUPE_WINDOW_SECONDS = 10 * 60
+# 쌓인 조회수를 DB에 반영하는 주기. 스케줄러가 이 주기로 flush_view_counts를 실행함
+VIEW_FLUSH_INTERVAL_SECONDS = 30
+# flush 잠금 유지 시간 (flush 도중 프로세스가 죽어도 이 시간 뒤에는 다른 워커가 이어받음)
+VIEW_FLUSH_LOCK_TTL_SECONDS = 120
+
+# 잠금 값이 자신의 토큰일 때만 삭제 (TTL이 지나 다른 워커가 잡은 잠금을 지우지 않도록)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class ViewCountBuffer:
+    """
+    피드 조회수를 Redis에 모았다가 주기적으로 DB에 일괄 반영하는 쓰기 지연(write-behind) 버퍼.
+    - feed_views:pending (HASH)  : feed_id -> 아직 DB에 반영되지 않은 조회수
+    - feed_views:flushing (HASH) : DB에 반영 중인 조회수 (pending을 RENAME 하여 만듦)
+    - feed_views:seen:{feed_id}:{viewer} : 중복 조회 방지 표시 (VIEW_DEDUPE_WINDOW_SECONDS 후 만료)
+    조회하는 쪽은 DB 값에 pending + flushing을 더해 최신 조회수를 보여줌.
+    """
+    key_prefix = "feed_views"
+
+    def __init__(self, redis: Redis = client_redis, dedupe_window_seconds: int = VIEW_DEDUPE_WINDOW_SECONDS):
+        self.redis = redis
+        self.dedupe_window_seconds = dedupe_window_seconds
+
+    @property
+    def pending_key(self) -> str:
+        return f"{self.key_prefix}:pending"
+
+    @property
+    def flushing_key(self) -> str:
+        return f"{self.key_prefix}:flushing"
+
+    @property
+    def lock_key(self) -> str:
+        return f"{self.key_prefix}:flush_lock"
+
+    def seen_key(self, feed_id: int, viewer: str) -> str:
+        return f"{self.key_prefix}:seen:{feed_id}:{viewer}"
+
+    async def record_view(self, feed_id: int, viewer: Optional[str] = None) -> bool:
+        """
+        조회 1회를 기록함.
+        입력: viewer - 중복 제거 기준 ("user:{pk}" 또는 "ip:{주소}"). None이면 중복 제거 없이 셈
+        반환: 조회수에 반영되었으면 True, 중복 제거 기간 안의 재조회라 무시했으면 False
+        """
+        if viewer and self.dedupe_window_seconds > 0:
+            first_view = await self.redis.set(self.seen_key(feed_id, viewer), 1, nx=True, ex=self.dedupe_window_seconds)
+            if not first_view:
+                return False
+        await self.redis.hincrby(self.pending_key, str(feed_id), 1)
+        return True
+
+    async def get_pending(self, feed_id: int) -> int:
+        """아직 DB에 반영되지 않은 조회수 (pending + flushing)"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hget(self.pending_key, str(feed_id))
+            pipe.hget(self.flushing_key, str(feed_id))
+            pending, flushing = await pipe.execute()
+        return int(pending or 0) + int(flushing or 0)
+
+    async def acquire_flush_lock(self) -> Optional[str]:
+        """잠금을 얻으면 해제할 때 쓸 토큰을, 다른 워커가 잡고 있으면 None을 반환함"""
+        token = secrets.token_hex(16)
+        if await self.redis.set(self.lock_key, token, nx=True, ex=VIEW_FLUSH_LOCK_TTL_SECONDS):
+            return token
+        return None
+
+    async def release_flush_lock(self, token: str) -> None:
+        """자신이 잡은 잠금(token)일 때만 해제함"""
+        await self.redis.eval(_RELEASE_LOCK_SCRIPT, 1, self.lock_key, token)
+
+    async def take_pending(self) -> Dict[int, int]:
+        """
+        flush할 조회수를 가져옴.
+        - 이전 flush가 중간에 실패해 flushing이 남아 있으면 그것을 먼저 반환함.
+        - 아니면 pending을 flushing으로 RENAME 하여(원자적) 이후 들어오는 조회는 새 pending에 쌓이게 함.
+        """
+        if not await self.redis.exists(self.flushing_key):
+            if not await self.redis.exists(self.pending_key):
+                return {}
+            await self.redis.rename(self.pending_key, self.flushing_key)
+        raw = await self.redis.hgetall(self.flushing_key)
+        return {int(feed_id): int(count) for feed_id, count in raw.items() if int(count) > 0}
+
+    async def complete_flush(self) -> None:
+        """DB 반영이 끝난 flushing 조회수를 삭제함."""
+        await self.redis.delete(self.flushing_key)
+
+
+async def record_feed_view(
+    feed_id: int,
+    viewer: Optional[str] = None,
+    buffer: Optional[ViewCountBuffer] = None,
+    session_factory=AsyncSessionLocal
+) -> None:
+    """
+    [비동기] 피드 조회 1회를 기록함. (피드 상세 응답을 보낸 뒤 백그라운드 작업으로 실행)
+    - 버퍼가 있으면 Redis에 기록하고, DB 반영은 flush_view_counts가 일괄 처리함
+    - 버퍼가 없거나 Redis 장애 시 별도 세션으로 DB 조회수를 바로 1 증가 (요청 세션은 응답과 함께 닫히므로 쓰지 않음)
+    """
+    if buffer is not None:
+        try:
+            await buffer.record_view(feed_id, viewer)
+            return
+        except RedisError as e:
+            logger.warning(f"Failed to buffer view count, writing through to DB - feed_id: {feed_id}, error: {e}")
+
+    async with session_factory() as db:
+        await FeedRepository(db).increment_feed_view_count(feed_id)
+
+
+async def flush_view_counts(buffer: Optional[ViewCountBuffer] = None, session_factory=AsyncSessionLocal) -> int:
+    """
+    [비동기] Redis에 쌓인 조회수를 DB(feeds.view_count, feed_stats.view_count)에 일괄 반영함. (스케줄러에서 주기적으로 호출)
+    - 여러 워커가 동시에 실행해도 잠금을 얻은 한 곳에서만 반영함.
+    - DB 반영 후 flushing 삭제 전에 실패하면 다음 flush에서 같은 값이 다시 반영될 수 있음 (조회수는 근사치로 허용)
+    - 버퍼에 쌓인 뒤 영구 삭제된 피드는 건너뛰므로, 한 피드 때문에 flush가 계속 실패하지 않음
+    반환: 반영한 피드 수
+    """
+    buffer = buffer or ViewCountBuffer()
+    lock_token = await buffer.acquire_flush_lock()
+    if lock_token is None:
+        return 0
+    try:
+        deltas = await buffer.take_pending()
+        applied = 0
+        if deltas:
+            async with session_factory() as db:
+                applied = await FeedRepository(db).apply_view_count_deltas(deltas)
+        # 삭제된 피드의 조회수는 DB에 반영하지 않고 flushing과 함께 버림
+        await buffer.complete_flush()
+        if deltas:
+            logger.info(f"Flushed buffered view counts for {applied} feeds ({len(deltas) - applied} deleted feeds dropped).")
+        return applied
+    finally:
+        await buffer.release_flush_lock(lock_token)
@@ -0,0 +1,261 @@
+"""
+메인 피드 목록 페이지네이션 벤치마크.
+
+기존 방식(get_feeds_with_details로 전체 조회 후 Python 슬라이싱)과
+SQL 페이지네이션(get_feed_page: OFFSET/LIMIT, 키셋 커서) + COUNT의 지연 시간을 테이블 크기별로 비교함.
+
+기본값은 메모리 SQLite(aiosqlite)이며, 운영과 같은 MySQL에서 측정하려면 --database-url에
+비어 있는 벤치마크 전용 스키마를 지정함. (테이블을 생성하고 합성 데이터를 채움)
+테이블이 있는 스키마는 --scratch-database로 그 DB 이름을 명시했을 때만 사용함. (벤치마크 테이블을 지우고 다시 만듦)
+
+사용법 (backend 디렉토리에서 실행):
+    PYTHONPATH=. python app/F3_repositories/benchmark_feed_pagination.py --sizes 1k,10k,100k
+    PYTHONPATH=. python app/F3_repositories/benchmark_feed_pagination.py --sizes 10k \
+        --database-url mysql+aiomysql://user:pw@localhost:3306/bench [--scratch-database bench]
+"""
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert, inspect
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.F7_models  # noqa: F401 (관계 매핑을 위해 모든 모델 등록)
+from app.F3_repositories.feed import FeedRepository
+from app.F3_repositories.feed_stats import FeedStatsRepository
+from app.F4_utils.pagination import decode_cursor, encode_cursor
+from app.F7_models.bookmarks import Bookmark
+from app.F7_models.categories import Category
+from app.F7_models.feed_stats import FeedStats
+from app.F7_models.feeds import ContentTypeEnum, Feed, ProcessingStatusEnum
+from app.F7_models.organizations import Organization
+from app.F7_models.ratings import Rating
+from app.F7_models.users import User
+from app.F8_database.connection import Base
+
+logger = logging.getLogger(__name__)
+
+# 미리 정의된 규모 (피드 수 기준)
+SCALE_PRESETS = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+NUM_ORGANIZATIONS = 20
+CATEGORIES_PER_ORGANIZATION = 5
+NUM_USERS = 500
+INSERT_BATCH_SIZE = 5_000
+
+# 한 줄 결과: (시나리오 이름, 중앙값(ms))
+ScenarioResult = Tuple[str, float]
+
+_TABLES = [
+    Organization.__table__,
+    Category.__table__,
+    User.__table__,
+    Feed.__table__,
+    Rating.__table__,
+    Bookmark.__table__,
+    FeedStats.__table__,
+]
+
+
+async def _insert_batched(session: AsyncSession, table, rows: List[Dict]):
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        await session.execute(insert(table), rows[start:start + INSERT_BATCH_SIZE])
+
+
+async def populate(session: AsyncSession, num_feeds: int, seed: int = 42):
+    """합성 기관/카테고리/사용자/피드/평점/북마크 데이터를 채움."""
+    rng = random.Random(seed)
+    now = datetime(2025, 1, 1)
+
+    await _insert_batched(session, Organization.__table__, [
+        {"id": i, "name": f"기관{i}", "is_active": True, "created_at": now}
+        for i in range(1, NUM_ORGANIZATIONS + 1)
+    ])
+    categories = [
+        {"id": (org_id - 1) * CATEGORIES_PER_ORGANIZATION + c, "organization_id": org_id,
+         "name": f"카테고리{c}", "is_active": True, "created_at": now}
+        for org_id in range(1, NUM_ORGANIZATIONS + 1)
+        for c in range(1, CATEGORIES_PER_ORGANIZATION + 1)
+    ]
+    await _insert_batched(session, Category.__table__, categories)
+    await _insert_batched(session, User.__table__, [
+        {"id": i, "user_id": f"benchuser{i:05d}", "email": f"bench{i}@example.com",
+         "password_hash": "x", "nickname": f"bench{i}", "created_at": now}
+        for i in range(1, NUM_USERS + 1)
+    ])
+
+    feeds = []
+    for feed_id in range(1, num_feeds + 1):
+        category = rng.choice(categories)
+        # 약 1%는 발행일이 없는 피드 (NULL 정렬 구간 포함)
+        published = None if rng.random() < 0.01 else now - timedelta(minutes=rng.randint(0, 3 * 365 * 24 * 60))
+        feeds.append({
+            "id": feed_id,
+            "organization_id": category["organization_id"],
+            "category_id": category["id"],
+            "title": f"벤치마크 피드 {feed_id}",
+            "summary": "요약 " * 40,
+            "content_type": ContentTypeEnum.TEXT,
+            "processing_status": ProcessingStatusEnum.COMPLETED,
+            "published_date": published,
+            "is_active": rng.random() > 0.02,
+            "view_count": rng.randint(0, 5_000),
+            "created_at": now,
+        })
+    await _insert_batched(session, Feed.__table__, feeds)
+
+    def _unique_pairs(count: int) -> List[Tuple[int, int]]:
+        pairs = set()
+        while len(pairs) < count:
+            pairs.add((rng.randint(1, NUM_USERS), rng.randint(1, num_feeds)))
+        return list(pairs)
+
+    await _insert_batched(session, Rating.__table__, [
+        {"user_id": user_id, "feed_id": feed_id, "score": rng.randint(1, 5), "created_at": now}
+        for user_id, feed_id in _unique_pairs(num_feeds // 2)
+    ])
+    await _insert_batched(session, Bookmark.__table__, [
+        {"user_id": user_id, "feed_id": feed_id, "created_at": now}
+        for user_id, feed_id in _unique_pairs(num_feeds // 3)
+    ])
+    await session.commit()
+
+    # 목록 조회가 읽는 feed_stats를 원본 데이터로부터 채움
+    await FeedStatsRepository(session).reconcile_all()
+
+
+async def _median_ms(func: Callable[[], Awaitable], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+class UnsafeDatabaseError(RuntimeError):
+    """검사/벤치마크 전용으로 확인되지 않은 DB에서 테이블을 지우려 할 때 발생함."""
+
+
+async def ensure_scratch_database(conn: AsyncConnection, scratch_database: Optional[str] = None) -> None:
+    """
+    테이블을 지우고 다시 만들기 전에 대상 DB가 검사/벤치마크 전용인지 확인함.
+    - 테이블이 하나도 없는 스키마이거나, URL의 DB 이름이 scratch_database로 명시한 이름과 같을 때만 통과함
+    - 그 외(운영/개발 DB를 잘못 지정한 경우 등)에는 UnsafeDatabaseError를 발생시킴
+    """
+    existing_tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+    if not existing_tables:
+        return
+    database = conn.engine.url.database
+    if scratch_database is not None and database == scratch_database:
+        return
+    raise UnsafeDatabaseError(
+        f"Database '{database}' already has {len(existing_tables)} tables. "
+        f"Use an empty schema or pass --scratch-database {database} to allow dropping its tables."
+    )
+
+
+async def run_benchmark(
+    database_url: str,
+    num_feeds: int,
+    limit: int = 20,
+    repeat: int = 5,
+    seed: int = 42,
+    scratch_database: Optional[str] = None,
+) -> List[ScenarioResult]:
+    """테이블을 생성/적재한 뒤 시나리오별 중앙값 지연 시간을 측정함."""
+    # 메모리 SQLite는 연결마다 별도 DB가 되므로 하나의 연결을 공유함
+    engine_options = {"poolclass": StaticPool} if ":memory:" in database_url else {}
+    engine = create_async_engine(database_url, **engine_options)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    created = False
+    try:
+        async with engine.begin() as conn:
+            await ensure_scratch_database(conn, scratch_database)
+            await conn.run_sync(lambda sync_conn: Base.metadata.drop_all(sync_conn, tables=_TABLES))
+            await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=_TABLES))
+        created = True
+
+        async with session_factory() as session:
+            await populate(session, num_feeds, seed=seed)
+
+        async with session_factory() as session:
+            repo = FeedRepository(session)
+            total = await repo.count_active_feeds()
+            middle_offset = (total // 2 // limit) * limit
+
+            # 중간 지점 커서: 중간 페이지 직전 행의 정렬 키
+            anchor = await repo.get_feed_page(limit=1, offset=max(middle_offset - 1, 0))
+            middle_cursor = encode_cursor(anchor[0]["published_date"], anchor[0]["id"])
+
+            async def legacy_full_scan():
+                feeds = await repo.get_feeds_with_details()
+                return feeds[middle_offset:middle_offset + limit]
+
+            scenarios: List[Tuple[str, Callable[[], Awaitable]]] = [
+                ("legacy: full load + slice", legacy_full_scan),
+                ("sql: first page (LIMIT)", lambda: repo.get_feed_page(limit=limit + 1)),
+                ("sql: middle page (OFFSET)", lambda: repo.get_feed_page(limit=limit + 1, offset=middle_offset)),
+                ("sql: middle page (keyset)", lambda: repo.get_feed_page(limit=limit + 1, after=decode_cursor(middle_cursor))),
+                ("sql: COUNT", repo.count_active_feeds),
+            ]
+            return [(name, await _median_ms(func, repeat)) for name, func in scenarios]
+    finally:
+        if created:
+            async with engine.begin() as conn:
+                await conn.run_sync(lambda sync_conn: Base.metadata.drop_all(sync_conn, tables=_TABLES))
+        await engine.dispose()
+
+
+def _format_report(results_by_size: Dict[int, List[ScenarioResult]]) -> str:
+    sizes = sorted(results_by_size)
+    names = [name for name, _ in results_by_size[sizes[0]]]
+    lines = [
+        "=== Main feed list pagination latency (median ms) ===",
+        f"{'scenario':<32}" + "".join(f"{size:>12}" for size in sizes),
+    ]
+    for index, name in enumerate(names):
+        lines.append(f"{name:<32}" + "".join(f"{results_by_size[size][index][1]:>12.2f}" for size in sizes))
+    return "\n".join(lines)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="메인 피드 목록 페이지네이션 벤치마크")
+    parser.add_argument("--sizes", default="1k,10k", help="쉼표로 구분한 피드 수 (1k / 10k / 100k 또는 정수)")
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--scratch-database", help="테이블이 있어도 지우고 사용해도 되는 벤치마크 전용 DB 이름 (URL의 DB 이름과 같아야 함)")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+async def main() -> int:
+    args = _parse_args()
+    results_by_size = {}
+    for size in args.sizes.split(","):
+        num_feeds = SCALE_PRESETS.get(size.strip()) or int(size)
+        logger.info(f"Benchmarking with {num_feeds} feeds...")
+        try:
+            results_by_size[num_feeds] = await run_benchmark(
+                args.database_url, num_feeds, limit=args.limit, repeat=args.repeat, seed=args.seed,
+                scratch_database=args.scratch_database,
+            )
+        except UnsafeDatabaseError as e:
+            logger.error(str(e))
+            return 2
+    print(_format_report(results_by_size))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(main()))
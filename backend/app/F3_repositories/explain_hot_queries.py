@@ -0,0 +1,264 @@
+"""
+자주 호출되는 조회 쿼리의 실행 계획(EXPLAIN) 회귀 검사.
+
+FeedRepository / OrganizationRepository / UserRepository(및 feed_stats 집계)의 주요 조회 메서드를 실제로 실행하면서
+드라이버로 보내진 SELECT 문을 모은 뒤, 같은 파라미터로 EXPLAIN을 실행하여 다음을 찾음.
+- 전체 테이블 스캔 (type = ALL): 기관/카테고리처럼 행이 적은 기준 테이블과 파생 테이블(<derived..>, <union..>)은 제외
+- 파일 정렬 (Extra에 Using filesort): 계산 컬럼 정렬, 윈도 함수 등 구조상 피할 수 없는 쿼리는 사유와 함께 허용 목록에 둠
+하나라도 발견되면 종료 코드 1로 끝나므로, 인덱스나 쿼리를 바꾼 뒤 CI/로컬에서 회귀 검사로 사용할 수 있음.
+
+MySQL의 옵티마이저 판단을 검사하므로 운영과 같은 MySQL의 비어 있는 검사 전용 스키마를 지정함.
+(테이블을 생성하고 합성 데이터를 채운 뒤 ANALYZE TABLE로 통계를 갱신하며, 끝나면 삭제함)
+테이블이 있는 스키마는 --scratch-database로 그 DB 이름을 명시했을 때만 사용함. (운영/개발 DB의 테이블을 지우지 않도록)
+
+사용법 (backend 디렉토리에서 실행):
+    PYTHONPATH=. python app/F3_repositories/explain_hot_queries.py \
+        --database-url mysql+aiomysql://user:pw@localhost:3306/explain_check --feeds 20000 [--scratch-database explain_check]
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from sqlalchemy import event, insert, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.F3_repositories.benchmark_feed_pagination import (
+    NUM_ORGANIZATIONS,
+    _TABLES,
+    UnsafeDatabaseError,
+    ensure_scratch_database,
+    populate,
+)
+from app.F3_repositories.feed import FeedRepository
+from app.F3_repositories.feed_stats import FeedStatsRepository
+from app.F3_repositories.organization import OrganizationRepository
+from app.F3_repositories.users import UserRepository
+from app.F4_utils.pagination import decode_cursor, encode_cursor
+from app.F7_models.categories import Category
+from app.F7_models.word_clouds import WordCloud
+from app.F8_database.connection import Base
+
+logger = logging.getLogger(__name__)
+
+# 행 수가 작아 전체 스캔이 인덱스 탐색보다 싸거나 같은 기준 테이블
+SMALL_TABLES = frozenset({"organizations", "categories"})
+
+# 파일 정렬이 구조상 불가피하여 허용하는 쿼리 (이름 -> 사유)
+FILESORT_ALLOWED = {
+    "feed.get_top5_rated": "평균 평점(rating_sum / rating_count) 계산 컬럼으로 정렬",
+    "feed.get_latest_feeds_by_organization": "ROW_NUMBER() OVER (PARTITION BY organization_id ...) 윈도 정렬",
+    "feed.get_organization_latest_feeds_by_category": "ROW_NUMBER() OVER (PARTITION BY category_id ...) 윈도 정렬",
+    "user.get_latest_user_activities": "북마크/별점 UNION ALL 결과를 activity_at으로 정렬",
+}
+
+WORD_CLOUD_PERIOD = "2025-01"
+WORD_CLOUD_KEYWORDS_PER_ORGANIZATION = 50
+
+TABLES = [*_TABLES, WordCloud.__table__]
+
+# (쿼리 이름, 저장소 메서드를 실행하는 함수)
+HotQuery = Tuple[str, Callable[[AsyncSession], Awaitable[Any]]]
+
+
+class StatementCapture:
+    """active 동안 엔진이 실행한 SELECT 문과 드라이버 파라미터를 모음"""
+
+    def __init__(self):
+        self.active = False
+        self.statements: List[Tuple[str, Any]] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.active and statement.lstrip().upper().startswith(("SELECT", "WITH", "(SELECT")):
+            self.statements.append((statement, parameters))
+
+
+class PlanFinding:
+    def __init__(self, query_name: str, table: str, problem: str, detail: str):
+        self.query_name = query_name
+        self.table = table
+        self.problem = problem
+        self.detail = detail
+
+    def __str__(self) -> str:
+        return f"{self.query_name}: {self.problem} on {self.table} ({self.detail})"
+
+
+def check_plan(query_name: str, plan_rows: List[Dict[str, Any]], small_tables: FrozenSet[str] = SMALL_TABLES) -> List[PlanFinding]:
+    """
+    EXPLAIN 결과 행을 검사하여 전체 스캔/파일 정렬을 찾음.
+    반환: 허용 목록에 없는 문제 목록
+    """
+    findings = []
+    for row in plan_rows:
+        table = row.get("table") or ""
+        extra = row.get("Extra") or ""
+        detail = f"type={row.get('type')}, key={row.get('key')}, rows={row.get('rows')}, extra={extra}"
+        if row.get("type") == "ALL" and not table.startswith("<") and table not in small_tables:
+            findings.append(PlanFinding(query_name, table, "full table scan", detail))
+        if "Using filesort" in extra and query_name not in FILESORT_ALLOWED:
+            findings.append(PlanFinding(query_name, table, "filesort", detail))
+    return findings
+
+
+def build_hot_queries(num_feeds: int) -> List[HotQuery]:
+    """검사할 조회 메서드 목록 (합성 데이터의 ID/이름을 인자로 사용)"""
+    organization_name = "기관1"
+    user_pk = 1
+    sample_feed_ids = list(range(1, min(num_feeds, 20) + 1))
+    # 합성 데이터의 발행일은 2025-01-01 이전 3년 구간이므로 중간쯤을 키셋 커서 위치로 사용함
+    middle_cursor = decode_cursor(encode_cursor(datetime(2024, 1, 1), num_feeds // 2))
+
+    return [
+        ("feed.get_feed_page", lambda db: FeedRepository(db).get_feed_page(limit=21)),
+        ("feed.get_feed_page(keyset)", lambda db: FeedRepository(db).get_feed_page(limit=21, after=middle_cursor)),
+        ("feed.count_active_feeds", lambda db: FeedRepository(db).count_active_feeds()),
+        ("feed.get_organization_feed_page", lambda db: FeedRepository(db).get_organization_feed_page(1, limit=21)),
+        ("feed.get_organization_feed_page(category)",
+         lambda db: FeedRepository(db).get_organization_feed_page(1, limit=21, category_id=1)),
+        ("feed.count_organization_feeds", lambda db: FeedRepository(db).count_organization_feeds(1)),
+        ("feed.get_latest_feeds_by_organization", lambda db: FeedRepository(db).get_latest_feeds_by_organization(5)),
+        ("feed.get_organization_latest_feeds_by_category",
+         lambda db: FeedRepository(db).get_organization_latest_feeds_by_category(organization_name, 5)),
+        ("feed.get_top5_viewed", lambda db: FeedRepository(db).get_top5_viewed(5)),
+        ("feed.get_top5_rated", lambda db: FeedRepository(db).get_top5_rated(5)),
+        ("feed.get_top5_bookmarked", lambda db: FeedRepository(db).get_top5_bookmarked(5)),
+        ("feed.get_organization_press", lambda db: FeedRepository(db).get_organization_press(organization_name, 0, 20)),
+        ("feed.get_organization_press(keyset)",
+         lambda db: FeedRepository(db).get_organization_press(organization_name, 0, 20, after=middle_cursor)),
+        ("feed.get_organization_news", lambda db: FeedRepository(db).get_organization_news(organization_name, 0, 20)),
+        ("feed.get_feed_detail", lambda db: FeedRepository(db).get_feed_detail(1, user_pk=user_pk)),
+        ("feed_stats.aggregate_from_sources", lambda db: FeedStatsRepository(db).aggregate_from_sources(sample_feed_ids)),
+        ("feed_stats.backfill_missing", lambda db: FeedStatsRepository(db).backfill_missing()),
+        ("organization.get_organizations_with_feed_counts",
+         lambda db: OrganizationRepository(db).get_organizations_with_feed_counts()),
+        ("organization.get_categories_with_feed_counts_by_org_name",
+         lambda db: OrganizationRepository(db).get_categories_with_feed_counts_by_org_name(organization_name)),
+        ("organization.get_organization_summary_by_name",
+         lambda db: OrganizationRepository(db).get_organization_summary_by_name(organization_name)),
+        ("organization.get_top_keywords_by_org_name",
+         lambda db: OrganizationRepository(db).get_top_keywords_by_org_name(organization_name)),
+        ("user.get_total_ratings_count", lambda db: UserRepository(db).get_total_ratings_count(user_pk)),
+        ("user.get_ratings_data", lambda db: UserRepository(db).get_ratings_data(user_pk, 0, 10)),
+        ("user.get_total_bookmarks_count", lambda db: UserRepository(db).get_total_bookmarks_count(user_pk)),
+        ("user.get_bookmarks_data", lambda db: UserRepository(db).get_bookmarks_data(user_pk, 0, 10)),
+        ("user.get_latest_user_activities", lambda db: UserRepository(db).get_latest_user_activities(user_pk)),
+        ("user.get_rich_feed_details_by_ids", lambda db: UserRepository(db).get_rich_feed_details_by_ids(sample_feed_ids)),
+    ]
+
+
+async def _seed(session: AsyncSession, num_feeds: int, seed: int):
+    """합성 데이터를 채우고, 보도자료/정책뉴스 카테고리와 워드클라우드를 추가한 뒤 통계를 갱신함"""
+    await populate(session, num_feeds, seed=seed)
+    await session.execute(update(Category).where(Category.name == "카테고리1").values(name="보도자료"))
+    await session.execute(update(Category).where(Category.name == "카테고리2").values(name="정책뉴스"))
+    await session.execute(insert(WordCloud.__table__), [
+        {"organization_id": org_id, "keyword": f"키워드{k}", "score": float(k), "period": WORD_CLOUD_PERIOD}
+        for org_id in range(1, NUM_ORGANIZATIONS + 1)
+        for k in range(WORD_CLOUD_KEYWORDS_PER_ORGANIZATION)
+    ])
+    await session.commit()
+    for table in TABLES:
+        await session.execute(text(f"ANALYZE TABLE {table.name}"))
+
+
+async def _explain(session: AsyncSession, statement: str, parameters: Any) -> List[Dict[str, Any]]:
+    conn = await session.connection()
+    if isinstance(parameters, list):
+        parameters = tuple(parameters)
+    result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters) if parameters else \
+        await conn.exec_driver_sql(f"EXPLAIN {statement}")
+    return [dict(row._mapping) for row in result]
+
+
+async def run_checks(
+    database_url: str,
+    num_feeds: int,
+    seed: int,
+    scratch_database: Optional[str] = None,
+) -> Tuple[List[PlanFinding], Dict[str, int]]:
+    """
+    스키마를 만들고 데이터를 채운 뒤 각 조회 메서드의 SELECT 문에 대해 EXPLAIN을 실행함.
+    대상 스키마가 비어 있지 않으면 scratch_database로 그 DB 이름을 명시해야 함 (아니면 UnsafeDatabaseError).
+    반환: (문제 목록, 쿼리 이름별 검사한 SELECT 문 수)
+    """
+    engine = create_async_engine(database_url, poolclass=NullPool)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    capture = StatementCapture()
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+
+    findings: List[PlanFinding] = []
+    checked: Dict[str, int] = {}
+    created = False
+    try:
+        async with engine.begin() as conn:
+            await ensure_scratch_database(conn, scratch_database)
+            await conn.run_sync(lambda sync_conn: Base.metadata.drop_all(sync_conn, tables=TABLES))
+            await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=TABLES))
+        created = True
+        async with session_factory() as session:
+            await _seed(session, num_feeds, seed)
+
+        async with session_factory() as session:
+            for name, run_query in build_hot_queries(num_feeds):
+                capture.statements = []
+                capture.active = True
+                try:
+                    await run_query(session)
+                finally:
+                    capture.active = False
+                checked[name] = len(capture.statements)
+                for statement, parameters in capture.statements:
+                    findings.extend(check_plan(name, await _explain(session, statement, parameters)))
+    finally:
+        if created:
+            async with engine.begin() as conn:
+                await conn.run_sync(lambda sync_conn: Base.metadata.drop_all(sync_conn, tables=TABLES))
+        await engine.dispose()
+    return findings, checked
+
+
+def _format_report(findings: List[PlanFinding], checked: Dict[str, int]) -> str:
+    problems_by_query: Dict[str, int] = {}
+    for finding in findings:
+        problems_by_query[finding.query_name] = problems_by_query.get(finding.query_name, 0) + 1
+
+    lines = ["=== Hot query plan check ===", f"{'query':<60}{'selects':>8}{'problems':>10}"]
+    for name, count in checked.items():
+        lines.append(f"{name:<60}{count:>8}{problems_by_query.get(name, 0):>10}")
+    if findings:
+        lines.append("")
+        lines.extend(f"FAIL {finding}" for finding in findings)
+    return "\n".join(lines)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="주요 조회 쿼리 실행 계획(EXPLAIN) 회귀 검사")
+    parser.add_argument("--database-url", required=True, help="비어 있는 검사 전용 MySQL 스키마 (예: mysql+aiomysql://...)")
+    parser.add_argument("--scratch-database", help="테이블이 있어도 지우고 사용해도 되는 검사 전용 DB 이름 (URL의 DB 이름과 같아야 함)")
+    parser.add_argument("--feeds", type=int, default=20_000, help="합성 피드 수 (옵티마이저가 인덱스를 고를 만큼 충분히 크게)")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+async def main() -> int:
+    args = _parse_args()
+    if not args.database_url.startswith("mysql"):
+        logger.error("EXPLAIN checks require a MySQL database URL")
+        return 2
+    try:
+        findings, checked = await run_checks(args.database_url, args.feeds, args.seed, args.scratch_database)
+    except UnsafeDatabaseError as e:
+        logger.error(str(e))
+        return 2
+    print(_format_report(findings, checked))
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(main()))
@@ -1,8 +1,13 @@
-from sqlalchemy import select, func, and_, update
+from sqlalchemy import select, func, and_, or_, update, cast, Float, case
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Dict, Any, Optional
+from sqlalchemy.orm import aliased
+from typing import List, Dict, Any, Optional, Tuple
 import logging
+import time
+from app.F4_utils.pagination import KeysetPosition
+from app.F3_repositories.feed_stats import FeedStatsRepository
 from app.F7_models.feeds import Feed
+from app.F7_models.feed_stats import FeedStats
 from app.F7_models.ratings import Rating
 from app.F7_models.organizations import Organization
 from app.F7_models.categories import Category
@@ -11,9 +16,59 @@ from app.F7_models.users import User
 
 logger = logging.getLogger(__name__)
 
+# 기관별 피드 목록에서 항상 제외하는 카테고리 (별도 API에서 처리)
+ORGANIZATION_FEED_EXCLUDED_CATEGORIES = ['보도자료', '정책뉴스']
+
+# 조회수 일괄 반영 시 한 UPDATE 문에 담을 피드 수
+VIEW_COUNT_UPDATE_BATCH_SIZE = 500
+
+# 기관명 -> 기관 ID 캐시 (프로세스 단위)
+# 기관명은 거의 바뀌지 않으므로 짧은 TTL 동안 보관하여, 요청마다 기관 조회 쿼리를 다시 실행하지 않음
+ORGANIZATION_ID_CACHE_TTL_SECONDS = 300
+_organization_id_cache: Dict[str, Tuple[int, float]] = {}
+
+
+def _organization_feed_filters(feed, category, organization_id: int, category_id: Optional[int]) -> list:
+    """기관별 피드 목록 조건 (활성 피드, 해당 기관, 보도자료/정책뉴스 제외, 선택적 카테고리 필터)"""
+    filters = [
+        feed.is_active == True,
+        feed.organization_id == organization_id,
+        category.name.notin_(ORGANIZATION_FEED_EXCLUDED_CATEGORIES),
+    ]
+    if category_id is not None:
+        filters.append(feed.category_id == category_id)
+    return filters
+
+
+def _average_rating_column():
+    """feed_stats 기준 평균 별점 (별점이 없으면 NULL). feed_stats를 OUTER JOIN한 쿼리에서 사용"""
+    return cast(FeedStats.rating_sum, Float) / func.nullif(FeedStats.rating_count, 0)
+
+
+def _bookmark_count_column():
+    """feed_stats 기준 북마크 수 (통계 행이 없으면 0). feed_stats를 OUTER JOIN한 쿼리에서 사용"""
+    return func.coalesce(FeedStats.bookmark_count, 0)
+
+
+def _keyset_after(position: KeysetPosition):
+    """
+    (published_date DESC, id DESC) 정렬에서 주어진 위치 '다음' 행들을 고르는 조건.
+    DESC 정렬에서 published_date가 NULL인 행은 맨 뒤에 오므로, 커서가 NULL 구간에 있는지에 따라 조건을 나눔.
+    """
+    published_date, feed_id = position
+    if published_date is None:
+        return and_(Feed.published_date.is_(None), Feed.id < feed_id)
+    return or_(
+        Feed.published_date < published_date,
+        and_(Feed.published_date == published_date, Feed.id < feed_id),
+        Feed.published_date.is_(None)
+    )
+
+
 class FeedRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.stats_repository = FeedStatsRepository(db)
     
     # 피드 목록과 관련 정보 통합 조회 메서드
     # 입력: 없음
@@ -35,32 +90,20 @@ class FeedRepository:
             Feed.view_count,
             Feed.organization_id,
             Organization.name.label('organization_name'),
-            func.avg(Rating.score).label('average_rating'),
-            func.count(Bookmark.id).label('bookmark_count')
+            _average_rating_column().label('average_rating'),
+            _bookmark_count_column().label('bookmark_count')
         ).select_from(
-            # 피드 테이블을 기준으로 LEFT JOIN 수행
+            # 피드 테이블을 기준으로 JOIN 수행 (별점/북마크 수는 feed_stats에서 읽음)
             Feed.__table__.join(
                 Organization.__table__, 
                 Feed.organization_id == Organization.id
             ).outerjoin(
-                Rating.__table__, 
-                Feed.id == Rating.feed_id
-            ).outerjoin(
-            Bookmark.__table__,
-            Feed.id == Bookmark.feed_id
+                FeedStats.__table__,
+                Feed.id == FeedStats.feed_id
             )
         ).where(
             # 활성화된 피드만 조회
             Feed.is_active == True
-        ).group_by(
-            # 평균 별점 계산을 위한 그룹화
-            Feed.id,
-            Feed.title,
-            Feed.summary,
-            Feed.published_date,
-            Feed.view_count,
-            Feed.organization_id,
-            Organization.name
         ).order_by(
             # 발행일 기준 최신순 정렬
             Feed.published_date.desc()
@@ -87,6 +130,71 @@ class FeedRepository:
         
         return feeds_data
     
+    # 메인 피드 목록 페이지 조회 메서드
+    # 입력:
+    #   limit - 가져올 최대 피드 수 (int)
+    #   offset - 건너뛸 피드 수 (int, 페이지 번호 방식)
+    #   after - 키셋 커서 위치 (published_date, id). 주어지면 offset 대신 이 위치 다음부터 조회
+    # 반환:
+    #   get_feeds_with_details와 같은 형식의 Dict 리스트 (해당 페이지 분량만)
+    # 설명:
+    #   정렬(published_date DESC, id DESC)과 LIMIT을 SQL에서 처리하여 테이블 전체를 읽지 않음
+    #   평균 별점/북마크 수는 feed_stats(피드당 1행)를 OUTER JOIN하여 읽으므로 행이 곱해지지 않음
+    async def get_feed_page(
+        self,
+        limit: int,
+        offset: int = 0,
+        after: Optional[KeysetPosition] = None
+    ) -> List[Dict[str, Any]]:
+        query = select(
+            Feed.id,
+            Feed.title,
+            Feed.summary,
+            Feed.published_date,
+            Feed.view_count,
+            Feed.organization_id,
+            Organization.name.label('organization_name'),
+            _average_rating_column().label('average_rating'),
+            _bookmark_count_column().label('bookmark_count')
+        ).join(
+            Organization, Feed.organization_id == Organization.id
+        ).outerjoin(
+            FeedStats, Feed.id == FeedStats.feed_id
+        ).where(
+            Feed.is_active == True
+        )
+
+        if after is not None:
+            query = query.where(_keyset_after(after))
+        elif offset:
+            query = query.offset(offset)
+
+        query = query.order_by(Feed.published_date.desc(), Feed.id.desc()).limit(limit)
+
+        result = await self.db.execute(query)
+        return [
+            {
+                'id': row.id,
+                'title': row.title,
+                'summary': row.summary,
+                'published_date': row.published_date,
+                'view_count': row.view_count,
+                'organization_id': row.organization_id,
+                'organization_name': row.organization_name,
+                'average_rating': float(row.average_rating) if row.average_rating is not None else None,
+                'bookmark_count': row.bookmark_count or 0
+            }
+            for row in result.fetchall()
+        ]
+
+    # 활성 피드 수 조회 메서드
+    # 반환: 활성화된 피드의 전체 개수 (int)
+    async def count_active_feeds(self) -> int:
+        result = await self.db.execute(
+            select(func.count(Feed.id)).where(Feed.is_active == True)
+        )
+        return result.scalar_one()
+
     # 기관별 피드 목록과 관련 정보 통합 조회 메서드
     # 입력: 
     #   organization_name - 조회할 기관명 (str)
@@ -114,10 +222,10 @@ class FeedRepository:
             Organization.name.label('organization_name'),
             Feed.category_id,
             Category.name.label('category_name'),
-            func.avg(Rating.score).label('average_rating'),
-            func.count(Bookmark.id).label('bookmark_count')
+            _average_rating_column().label('average_rating'),
+            _bookmark_count_column().label('bookmark_count')
         ).select_from(
-            # 피드 테이블을 기준으로 JOIN 수행
+            # 피드 테이블을 기준으로 JOIN 수행 (별점/북마크 수는 feed_stats에서 읽음)
             Feed.__table__.join(
                 Organization.__table__, 
                 Feed.organization_id == Organization.id
@@ -125,11 +233,8 @@ class FeedRepository:
                 Category.__table__,
                 Feed.category_id == Category.id
             ).outerjoin(
-                Rating.__table__, 
-                Feed.id == Rating.feed_id
-            ).outerjoin(
-            Bookmark.__table__,
-            Feed.id == Bookmark.feed_id
+                FeedStats.__table__,
+                Feed.id == FeedStats.feed_id
             )
         ).where(
             # 활성화된 피드만 조회
@@ -146,18 +251,7 @@ class FeedRepository:
         if category_id is not None:
             query = query.where(Feed.category_id == category_id)
         
-        query = query.group_by(
-            # 평균 별점 계산을 위한 그룹화
-            Feed.id,
-            Feed.title,
-            Feed.summary,
-            Feed.published_date,
-            Feed.view_count,
-            Feed.organization_id,
-            Organization.name,
-            Feed.category_id,
-            Category.name
-        ).order_by(
+        query = query.order_by(
             # 발행일 기준 최신순 정렬
             Feed.published_date.desc()
         )
@@ -185,6 +279,114 @@ class FeedRepository:
         
         return feeds_data
     
+    # 기관명으로 기관 ID 조회 메서드 (캐시 사용)
+    # 입력: organization_name - 기관명 (str)
+    # 반환: 기관 ID (int), 존재하지 않는 기관이면 None
+    # 설명:
+    #   캐시에 있으면 DB를 조회하지 않음. 존재하지 않는 기관명은 캐시하지 않아 새로 등록된 기관도 바로 조회됨
+    async def resolve_organization_id(self, organization_name: str) -> Optional[int]:
+        now = time.monotonic()
+        cached = _organization_id_cache.get(organization_name)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        result = await self.db.execute(
+            select(Organization.id).where(Organization.name == organization_name)
+        )
+        organization_id = result.scalar_one_or_none()
+        if organization_id is not None:
+            _organization_id_cache[organization_name] = (organization_id, now + ORGANIZATION_ID_CACHE_TTL_SECONDS)
+        else:
+            _organization_id_cache.pop(organization_name, None)
+        return organization_id
+
+    # 기관별 피드 목록 페이지 조회 메서드
+    # 입력:
+    #   organization_id - 기관 ID (int, resolve_organization_id로 조회)
+    #   limit - 가져올 최대 피드 수 (int)
+    #   offset - 건너뛸 피드 수 (int, 페이지 번호 방식)
+    #   after - 키셋 커서 위치 (published_date, id). 주어지면 offset 대신 사용
+    #   category_id - 필터링할 카테고리 ID (int, 선택적)
+    # 반환:
+    #   (get_feeds_by_organization_name과 같은 형식의 Dict 리스트, 전체 개수)
+    #   전체 개수는 페이지 행에 함께 실려 오므로, 페이지가 비어 있으면 None (이때만 count_organization_feeds로 따로 조회)
+    # 설명:
+    #   페이지 행과 조건에 맞는 전체 개수(비상관 스칼라 서브쿼리)를 한 번의 쿼리로 가져옴
+    async def get_organization_feed_page(
+        self,
+        organization_id: int,
+        limit: int,
+        offset: int = 0,
+        after: Optional[KeysetPosition] = None,
+        category_id: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        # 전체 개수 서브쿼리는 바깥 쿼리와 상관되지 않도록 별칭 테이블로 구성
+        count_feed = aliased(Feed)
+        count_category = aliased(Category)
+        total_count = (
+            select(func.count(count_feed.id))
+            .join(count_category, count_feed.category_id == count_category.id)
+            .where(*_organization_feed_filters(count_feed, count_category, organization_id, category_id))
+            .scalar_subquery()
+        )
+
+        query = select(
+            Feed.id,
+            Feed.title,
+            Feed.summary,
+            Feed.published_date,
+            Feed.view_count,
+            Feed.organization_id,
+            Feed.category_id,
+            Category.name.label('category_name'),
+            _average_rating_column().label('average_rating'),
+            _bookmark_count_column().label('bookmark_count'),
+            total_count.label('total_count')
+        ).join(
+            Category, Feed.category_id == Category.id
+        ).outerjoin(
+            FeedStats, Feed.id == FeedStats.feed_id
+        ).where(
+            *_organization_feed_filters(Feed, Category, organization_id, category_id)
+        )
+
+        if after is not None:
+            query = query.where(_keyset_after(after))
+        elif offset:
+            query = query.offset(offset)
+
+        query = query.order_by(Feed.published_date.desc(), Feed.id.desc()).limit(limit)
+
+        result = await self.db.execute(query)
+        rows = result.fetchall()
+        feeds_data = [
+            {
+                'id': row.id,
+                'title': row.title,
+                'summary': row.summary,
+                'published_date': row.published_date,
+                'view_count': row.view_count,
+                'organization_id': row.organization_id,
+                'category_id': row.category_id,
+                'category_name': row.category_name,
+                'average_rating': float(row.average_rating) if row.average_rating is not None else None,
+                'bookmark_count': row.bookmark_count or 0
+            }
+            for row in rows
+        ]
+        return feeds_data, (rows[0].total_count if rows else None)
+
+    # 기관별 피드 수 조회 메서드
+    # 입력: organization_id - 기관 ID (int), category_id - 카테고리 ID (int, 선택적)
+    # 반환: 조건에 맞는 피드 수 (int)
+    async def count_organization_feeds(self, organization_id: int, category_id: Optional[int] = None) -> int:
+        result = await self.db.execute(
+            select(func.count(Feed.id))
+            .join(Category, Feed.category_id == Category.id)
+            .where(*_organization_feed_filters(Feed, Category, organization_id, category_id))
+        )
+        return result.scalar_one()
+
     # 기관별 최신 피드 목록 조회 메서드
     # 입력: 
     #   limit - 최대 기관 수 제한 (int)
@@ -362,33 +564,29 @@ class FeedRepository:
     # 설명: 
     #   활성화된 피드 중 조회수가 높은 순으로 정렬하여 상위 피드 조회
     #   동일 조회수일 경우 피드 ID가 큰 순으로 정렬
+    #   조회수/평균 별점/북마크 수는 feed_stats에서 읽음 (조회수 인덱스 순으로 스캔)
     #   결과가 없는 경우 None 반환
     async def get_top5_viewed(self, limit: int) -> Optional[List[Dict[str, Any]]]:
         query = select(
             Feed.id,
             Feed.title,
-            Feed.view_count,
+            FeedStats.view_count,
             Organization.name.label('organization_name'),
-            func.avg(Rating.score).label('average_rating'),
-            func.count(Bookmark.id).label('bookmark_count')
+            _average_rating_column().label('average_rating'),
+            FeedStats.bookmark_count
         ).select_from(
-            Feed.__table__.join(
+            FeedStats.__table__.join(
+                Feed.__table__,
+                FeedStats.feed_id == Feed.id
+            ).join(
                 Organization.__table__,
                 Feed.organization_id == Organization.id
-            ).outerjoin(
-                Rating.__table__,
-                Feed.id == Rating.feed_id
-            ).outerjoin(
-                Bookmark.__table__,
-                Feed.id == Bookmark.feed_id
             )
         ).where(
             Feed.is_active == True,
             Organization.is_active == True
-        ).group_by(
-            Feed.id, Feed.title, Feed.view_count, Organization.name
         ).order_by(
-            Feed.view_count.desc(),
+            FeedStats.view_count.desc(),
             Feed.id.desc()
         ).limit(limit)
         
@@ -422,35 +620,33 @@ class FeedRepository:
     #   각 Dict는 피드 기본 정보, 평균 별점, 조회수, 북마크 수를 포함
     # 설명: 
     #   활성화된 피드 중 평균 별점이 높은 순으로 정렬하여 상위 피드 조회
-    #   별점이 없는 피드는 제외하고 조회 (INNER JOIN 사용)
+    #   별점이 없는 피드는 제외하고 조회 (feed_stats.rating_count > 0)
     #   동일 평균 별점일 경우 피드 ID가 큰 순으로 정렬
+    #   조회수/평균 별점/북마크 수는 feed_stats에서 읽음
     #   결과가 없는 경우 None 반환
     async def get_top5_rated(self, limit: int) -> Optional[List[Dict[str, Any]]]:
+        average_rating = _average_rating_column()
         query = select(
             Feed.id,
             Feed.title,
-            Feed.view_count,
+            FeedStats.view_count,
             Organization.name.label('organization_name'),
-            func.avg(Rating.score).label('average_rating'),
-            func.count(Bookmark.id).label('bookmark_count')
+            average_rating.label('average_rating'),
+            FeedStats.bookmark_count
         ).select_from(
-            Feed.__table__.join(
+            FeedStats.__table__.join(
+                Feed.__table__,
+                FeedStats.feed_id == Feed.id
+            ).join(
                 Organization.__table__,
                 Feed.organization_id == Organization.id
-            ).outerjoin(
-                Rating.__table__,
-                Feed.id == Rating.feed_id
-            ).outerjoin(
-                Bookmark.__table__,
-                Feed.id == Bookmark.feed_id
             )
         ).where(
+            FeedStats.rating_count > 0,
             Feed.is_active == True,
             Organization.is_active == True
-        ).group_by(
-            Feed.id, Feed.title, Feed.view_count, Organization.name
         ).order_by(
-            func.avg(Rating.score).desc(),
+            average_rating.desc(),
             Feed.id.desc()
         ).limit(limit)
         
@@ -484,35 +680,32 @@ class FeedRepository:
     #   각 Dict는 피드 기본 정보, 평균 별점, 조회수, 북마크 수를 포함
     # 설명: 
     #   활성화된 피드 중 북마크 수가 많은 순으로 정렬하여 상위 피드 조회
-    #   북마크가 없는 피드는 제외하고 조회 (INNER JOIN 사용)
+    #   북마크가 없는 피드는 제외하고 조회 (feed_stats.bookmark_count > 0)
     #   동일 북마크 수일 경우 피드 ID가 큰 순으로 정렬
+    #   조회수/평균 별점/북마크 수는 feed_stats에서 읽음 (북마크 수 인덱스 순으로 스캔)
     #   결과가 없는 경우 None 반환
     async def get_top5_bookmarked(self, limit: int) -> Optional[List[Dict[str, Any]]]:
         query = select(
             Feed.id,
             Feed.title,
             Organization.name.label('organization_name'),
-            Feed.view_count,
-            func.avg(Rating.score).label('average_rating'),
-            func.count(Bookmark.id).label('bookmark_count')
+            FeedStats.view_count,
+            _average_rating_column().label('average_rating'),
+            FeedStats.bookmark_count
         ).select_from(
-            Feed.__table__.join(
+            FeedStats.__table__.join(
+                Feed.__table__,
+                FeedStats.feed_id == Feed.id
+            ).join(
                 Organization.__table__,
                 Feed.organization_id == Organization.id
-            ).outerjoin(
-                Rating.__table__,
-                Feed.id == Rating.feed_id
-            ).outerjoin(
-                Bookmark.__table__,
-                Feed.id == Bookmark.feed_id
             )
         ).where(
+            FeedStats.bookmark_count > 0,
             Feed.is_active == True,
             Organization.is_active == True
-        ).group_by(
-            Feed.id, Feed.title, Feed.view_count
         ).order_by(
-            func.count(Bookmark.id).desc(),
+            FeedStats.bookmark_count.desc(),
             Feed.id.desc()
         ).limit(limit)
         
@@ -553,9 +746,11 @@ class FeedRepository:
     #   limit + 1개 조회하여 다음 페이지 존재 여부 확인
     #   결과가 없는 경우 None 반환
     async def get_organization_press(
-        self, organization_name: str, offset: int, limit: int
+        self, organization_name: str, offset: int, limit: int, after: Optional[KeysetPosition] = None
     ) -> Optional[Dict[str, Any]]:
         # 메인 쿼리: 기관의 보도자료 조회 (평균 별점 포함)
+        # 정렬은 (published_date DESC, id DESC)이며, after(키셋 커서)가 주어지면 OFFSET 대신 해당 위치 다음부터 조회
+        # (category_id, is_active, published_date, id) 인덱스를 따라 읽으므로 깊은 페이지도 일정한 비용
         query = select(
             Feed.id,
             Feed.title,
@@ -566,8 +761,8 @@ class FeedRepository:
             Organization.name.label('organization_name'),
             Category.id.label('category_id'),
             Category.name.label('category_name'),
-            func.avg(Rating.score).label('average_rating'),
-            func.count(Bookmark.id).label('bookmark_count')
+            _average_rating_column().label('average_rating'),
+            _bookmark_count_column().label('bookmark_count')
         ).select_from(
             Feed.__table__.join(
                 Organization.__table__,
@@ -576,11 +771,8 @@ class FeedRepository:
                 Category.__table__,
                 Feed.category_id == Category.id
             ).outerjoin(
-                Rating.__table__,
-                Feed.id == Rating.feed_id
-            ).outerjoin(
-            Bookmark.__table__,
-            Feed.id == Bookmark.feed_id
+                FeedStats.__table__,
+                Feed.id == FeedStats.feed_id
             )
         ).where(
             # 특정 기관명으로 필터링
@@ -589,19 +781,17 @@ class FeedRepository:
             Category.name == '보도자료',
             # 활성화된 피드만 대상
             Feed.is_active == True
-        ).group_by(
-            Feed.id, 
-            Feed.title, 
-            Feed.summary, 
-            Feed.view_count, 
-            Feed.published_date,
-            Feed.organization_id, 
-            Organization.name,
-            Category.id, Category.name
-        ).order_by(
+        )
+
+        if after is not None:
+            query = query.where(_keyset_after(after))
+        elif offset:
+            query = query.offset(offset)
+
+        query = query.order_by(
             Feed.published_date.desc(),
-            Feed.created_at.desc()
-        ).offset(offset).limit(limit + 1)  # limit + 1개 조회 (다음 페이지 확인용)
+            Feed.id.desc()
+        ).limit(limit + 1)  # limit + 1개 조회 (다음 페이지 확인용)
         
         result = await self.db.execute(query)
         rows = result.fetchall()
@@ -720,32 +910,33 @@ class FeedRepository:
     #         logger.error(f"피드 상세 조회 중 오류 발생 - feed_id: {feed_id}, error: {str(e)}")
     #         return None
 
-    async def get_feed_detail(self, feed_id: int) -> Optional[Dict[str, Any]]:
+    async def get_feed_detail(self, feed_id: int, user_pk: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
         특정 피드의 상세 정보를 비동기적으로 조회합니다.
         self.db는 AsyncSession 객체여야 합니다.
+        user_pk가 주어지면 해당 사용자의 북마크 여부(is_bookmarked)와 별점(user_rating)도 같은 쿼리에서 함께 조회합니다.
+        (비로그인이면 두 값 모두 None)
+        조건부 요청(ETag / Last-Modified)용 수정 시각(version_timestamps)도 같은 행에서 함께 읽습니다.
         """
         try:
-            # 서브쿼리: 피드별 평균 별점 계산 (select 구문 사용)
-            rating_subquery = (
-                select(
-                    Rating.feed_id,
-                    func.avg(Rating.score).label('average_rating')
-                )
-                .group_by(Rating.feed_id)
-                .subquery()
-            )
-            # 서브쿼리 2: 피드별 북마크 수 계산
-            bookmark_subquery = (
-                select(
-                    Bookmark.feed_id,
-                    func.count(Bookmark.id).label('bookmark_count')
-                )
-                .group_by(Bookmark.feed_id)
-                .subquery()
-            )
-        
+            # 로그인 사용자별 상태: 상관 서브쿼리로 붙여 상세/통계/사용자 상태를 한 번의 왕복으로 읽음
+            if user_pk is not None:
+                user_columns = [
+                    select(Bookmark.id)
+                    .where(Bookmark.user_id == user_pk, Bookmark.feed_id == Feed.id)
+                    .exists()
+                    .label('is_bookmarked'),
+                    select(Rating.score)
+                    .where(Rating.user_id == user_pk, Rating.feed_id == Feed.id)
+                    .limit(1)
+                    .scalar_subquery()
+                    .label('user_rating'),
+                ]
+            else:
+                user_columns = []
+
             # 메인 쿼리: 피드 상세 정보 조회 (select 구문 사용)
+            # 평균 별점/북마크 수는 feed_stats에서 읽음 (전체 평점/북마크 테이블을 GROUP BY 하지 않음)
             query = (
                 select(
                     Feed.id,
@@ -759,13 +950,18 @@ class FeedRepository:
                     Organization.name.label('organization_name'),
                     Category.id.label('category_id'),
                     Category.name.label('category_name'),
-                    rating_subquery.c.average_rating,
-                    func.coalesce(bookmark_subquery.c.bookmark_count, 0).label('bookmark_count')
+                    _average_rating_column().label('average_rating'),
+                    _bookmark_count_column().label('bookmark_count'),
+                    Feed.created_at.label('created_at'),
+                    Feed.updated_at.label('updated_at'),
+                    FeedStats.updated_at.label('stats_updated_at'),
+                    Organization.updated_at.label('organization_updated_at'),
+                    Category.updated_at.label('category_updated_at'),
+                    *user_columns
                 )
                 .join(Organization, Feed.organization_id == Organization.id)
                 .join(Category, Feed.category_id == Category.id)
-                .outerjoin(rating_subquery, Feed.id == rating_subquery.c.feed_id)
-                .outerjoin(bookmark_subquery, Feed.id == bookmark_subquery.c.feed_id)
+                .outerjoin(FeedStats, Feed.id == FeedStats.feed_id)
                 .where(
                     and_(
                         Feed.id == feed_id,
@@ -797,7 +993,14 @@ class FeedRepository:
                 'organization_id': record.organization_id,
                 'organization_name': record.organization_name,
                 'category_id': record.category_id,
-                'category_name': record.category_name
+                'category_name': record.category_name,
+                'is_bookmarked': bool(record.is_bookmarked) if user_pk is not None else None,
+                'user_rating': record.user_rating if user_pk is not None else None,
+                # 피드 수정/비활성화, 별점/북마크 반영, 기관/카테고리 이름 변경 시 바뀌는 값들
+                'version_timestamps': (
+                    record.created_at, record.updated_at, record.stats_updated_at,
+                    record.organization_updated_at, record.category_updated_at
+                )
             }
         
         except Exception as e:
@@ -848,6 +1051,7 @@ class FeedRepository:
     async def increment_feed_view_count(self, feed_id: int) -> bool:
         """
         피드의 조회수를 1 증가시킵니다. (비동기 방식)
+        feed_stats의 조회수도 같은 트랜잭션에서 함께 증가시킵니다.
         """
         try:
             # 1. 비동기용 UPDATE 구문(Statement) 생성
@@ -867,7 +1071,8 @@ class FeedRepository:
 
             # 3. 실제로 업데이트된 행(row)의 수를 확인
             if result.rowcount > 0:
-                # 4. 성공 시 비동기로 commit
+                # 4. 성공 시 통계 테이블에도 반영한 뒤 비동기로 commit
+                await self.stats_repository.apply_delta(feed_id, view_count=1)
                 await self.db.commit()
                 logger.info(f"피드 조회수 증가 성공 - feed_id: {feed_id}")
                 return True
@@ -883,6 +1088,44 @@ class FeedRepository:
             return False
 
 
+    # 버퍼에 쌓인 조회수 일괄 반영 메서드
+    # 입력: deltas - {feed_id: 증가량} (ViewCountBuffer에서 모은 값)
+    # 반환: 반영한 피드 수 (버퍼에 쌓인 뒤 영구 삭제된 피드는 제외)
+    # 설명:
+    #   배치마다 아직 존재하는 피드 행을 잠그고(FOR UPDATE) 그 ID만
+    #   UPDATE feeds SET view_count = view_count + CASE id WHEN ... END WHERE id IN (...) 형태로 반영하고,
+    #   feed_stats 조회수도 같은 트랜잭션에서 함께 반영한 뒤 commit함
+    #   (삭제된 피드의 feed_stats를 INSERT하면 외래 키 위반으로 배치 전체가 실패하므로 제외하고 버림)
+    #   비활성 피드도 조회 시점에는 활성이었으므로 그대로 반영함
+    async def apply_view_count_deltas(self, deltas: Dict[int, int]) -> int:
+        items = list(deltas.items())
+        applied = 0
+        try:
+            for start in range(0, len(items), VIEW_COUNT_UPDATE_BATCH_SIZE):
+                batch = dict(items[start:start + VIEW_COUNT_UPDATE_BATCH_SIZE])
+                existing_ids = set((await self.db.execute(
+                    select(Feed.id).where(Feed.id.in_(batch.keys())).with_for_update()
+                )).scalars().all())
+                missing_ids = batch.keys() - existing_ids
+                if missing_ids:
+                    logger.warning(f"Dropping buffered views for deleted feeds: {sorted(missing_ids)}")
+                batch = {feed_id: delta for feed_id, delta in batch.items() if feed_id in existing_ids}
+                if not batch:
+                    continue
+                await self.db.execute(
+                    update(Feed)
+                    .where(Feed.id.in_(batch.keys()))
+                    .values(view_count=Feed.view_count + case(batch, value=Feed.id, else_=0))
+                    .execution_options(synchronize_session=False)
+                )
+                await self.stats_repository.apply_view_deltas(batch)
+                applied += len(batch)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        return applied
+
     async def is_feed_exists(self, feed_id: int) -> bool:
         result = await self.db.execute(
             select(Feed).where(Feed.id == feed_id, Feed.is_active.is_(True))
@@ -916,24 +1159,22 @@ class FeedRepository:
         )
 
         self.db.add(new_rating)
+        # 평점 등록과 통계 갱신을 한 트랜잭션으로 commit
+        await self.stats_repository.apply_delta(feed_id, rating_sum=score, rating_count=1)
         await self.db.commit()
         await self.db.refresh(new_rating)
 
     async def get_feed_rating(self, feed_id: int) -> dict:
         result = await self.db.execute(
-            select(
-                func.avg(Rating.score).label("average_rating"),
-                func.count(Rating.id).label("total_ratings")
-            ).where(Rating.feed_id == feed_id)
+            select(FeedStats.rating_sum, FeedStats.rating_count).where(FeedStats.feed_id == feed_id)
         )
         row = result.first()
-        if row is None:
+        if row is None or not row.rating_count:
             return {"average_rating": 0.0, "total_ratings": 0}
 
-        average_rating, total_ratings = row
         return {
-            "average_rating": float(average_rating or 0),
-            "total_ratings": total_ratings
+            "average_rating": row.rating_sum / row.rating_count,
+            "total_ratings": row.rating_count
         }
     
 
@@ -949,6 +1190,8 @@ class FeedRepository:
     async def create_bookmark(self, user_pk: int, feed_id: int):
         new_bookmark = Bookmark(user_id=user_pk, feed_id=feed_id)
         self.db.add(new_bookmark)
+        # 북마크 추가와 통계 갱신을 한 트랜잭션으로 commit
+        await self.stats_repository.apply_delta(feed_id, bookmark_count=1)
         await self.db.commit()
         await self.db.refresh(new_bookmark)
     
@@ -956,14 +1199,16 @@ class FeedRepository:
         bookmark = await self.db.get(Bookmark, bookmark_id)
         if bookmark:
             await self.db.delete(bookmark)
+            # 북마크 삭제와 통계 갱신을 한 트랜잭션으로 commit
+            await self.stats_repository.apply_delta(bookmark.feed_id, bookmark_count=-1)
             await self.db.commit()
 
     
     async def get_bookmark_count(self, feed_id: int) -> int:
         result = await self.db.execute(
-            select(func.count(Bookmark.id)).where(Bookmark.feed_id == feed_id)
+            select(FeedStats.bookmark_count).where(FeedStats.feed_id == feed_id)
         )
-        return result.scalar_one()
+        return result.scalar_one_or_none() or 0
     
     async def get_user_rating_for_feed(self, user_pk: int, feed_id: int) -> Optional[Rating]:
         """
@@ -992,13 +1237,14 @@ class FeedRepository:
     # [정책뉴스]
     # =====================
     async def get_organization_news( 
-        self, organization_name: str, offset: int, limit: int
+        self, organization_name: str, offset: int, limit: int, after: Optional[KeysetPosition] = None
     ) -> Optional[Dict[str, Any]]:
         """"
         메인 쿼리: 기관의 정책뉴스 조회(평균 별점 포함)
         - 특정 기관(organization_name)의 '정책뉴스' 카테고리에 속하는 Feed(정책뉴스)를 조회한다.
         - 각 피드에 대해 평균 평점(average_rating)과 북마크 수(bookmark_count)를 함께 가져온다.
         - 페이징을 위해 limit + 1를 조회해서 '다음 페이지 존재 여부(has_more)'를 판단한다.
+        - after(키셋 커서 위치)가 주어지면 OFFSET 대신 (published_date, id) 다음 행부터 조회한다. (offset은 하위 호환용)
 
         - 반환: 
             - 결과가 없으면 None 
@@ -1010,7 +1256,7 @@ class FeedRepository:
         # 1) 메인 SQL 쿼리 생성
         # ------------------------
         # select(...) 내부에는 반환하려는 컬럼(도는 집계)을 나열
-        # func.avg / func.count 같은 집계 결과는 group_by와 함께 사용
+        # 평균 평점/북마크 수는 feed_stats(피드당 1행)에서 읽으므로 group_by 없이 조회
         stmt = select( 
             Feed.id,
             Feed.title,
@@ -1021,8 +1267,8 @@ class FeedRepository:
             Organization.name.label('organization_name'),
             Category.id.label('category_id'),
             Category.name.label('category_name'),
-            func.avg(Rating.score).label('average_rating'), # 평균 평점(NULL 가능)
-            func.count(Bookmark.id).label('bookmark_count') # 북마크 수(0이상 정수)
+            _average_rating_column().label('average_rating'), # 평균 평점(NULL 가능, feed_stats 기준)
+            _bookmark_count_column().label('bookmark_count') # 북마크 수(0이상 정수, feed_stats 기준)
         ).select_from( # select_from(...): 위 select 문에서 기준이 되는 테이블을 지정
             # Feed를 기준으로 Organization, Category는 INNER JOIN(해당 조건이 있어야만 정책뉴스로 간주)
             # .__table__ 해당 테이블 가져오기
@@ -1033,13 +1279,10 @@ class FeedRepository:
                 Category.__table__,
                 Feed.category_id == Category.id
             ).
-            # Rating, Bookmark는 해당 피드에 없을 수도 있으므로 OUTER JOIN 사용
+            # 통계 행(feed_stats)은 아직 없을 수도 있으므로 OUTER JOIN 사용 (피드당 1행이라 행이 곱해지지 않음)
             outerjoin( 
-                Rating.__table__,
-                Feed.id == Rating.feed_id
-            ).outerjoin(
-            Bookmark.__table__,
-            Feed.id == Bookmark.feed_id
+                FeedStats.__table__,
+                Feed.id == FeedStats.feed_id
             )
         ).where(
             # 특정 기관명으로 필터링
@@ -1048,19 +1291,19 @@ class FeedRepository:
             Category.name == '정책뉴스',                   # 활성화된 피드만
             # 활성화된 피드만 대상
             Feed.is_active == True
-        ).group_by(
-            Feed.id, 
-            Feed.title, 
-            Feed.summary, 
-            Feed.view_count, 
-            Feed.published_date,
-            Feed.organization_id, 
-            Organization.name,
-            Category.id, Category.name
-        ).order_by(
+        )
+
+        # 키셋 커서가 있으면 seek 조건으로, 없으면 기존처럼 OFFSET으로 페이지 이동
+        # (category_id, is_active, published_date, id) 인덱스를 따라 읽으므로 깊은 페이지도 일정한 비용
+        if after is not None:
+            stmt = stmt.where(_keyset_after(after))
+        elif offset:
+            stmt = stmt.offset(offset)
+
+        stmt = stmt.order_by(
             Feed.published_date.desc(),
-            Feed.created_at.desc()
-        ).offset(offset).limit(limit + 1)  # limit + 1개 조회 (다음 페이지 확인용)
+            Feed.id.desc()  # 같은 발행일 안에서 순서를 고정하는 키 (커서에 함께 담음)
+        ).limit(limit + 1)  # limit + 1개 조회 (다음 페이지 확인용)
 
 
         # ------------------------
@@ -0,0 +1,210 @@
+from sqlalchemy import select, func
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Dict, Tuple, Sequence
+import logging
+from app.F7_models.feeds import Feed
+from app.F7_models.feed_stats import FeedStats
+from app.F7_models.ratings import Rating
+from app.F7_models.bookmarks import Bookmark
+
+logger = logging.getLogger(__name__)
+
+# 통계 컬럼 (feed_stats 테이블의 집계 값 순서)
+STATS_COLUMNS = ('rating_sum', 'rating_count', 'bookmark_count', 'view_count')
+
+# 재계산(reconcile) 시 한 번에 처리할 피드 수
+RECONCILE_BATCH_SIZE = 1000
+
+# 피드 ID -> (rating_sum, rating_count, bookmark_count, view_count)
+StatsValues = Tuple[int, int, int, int]
+
+
+def _upsert_stmt(dialect_name: str, values, build_set):
+    """
+    feed_stats INSERT ... (충돌 시 UPDATE) 구문 생성.
+    build_set(inserted)는 충돌 시 갱신할 컬럼 dict를 반환함. (inserted: 새로 넣으려던 값 참조)
+    운영은 MySQL(ON DUPLICATE KEY UPDATE), 벤치마크/로컬 검증은 SQLite(ON CONFLICT DO UPDATE)를 지원함.
+    """
+    if dialect_name == 'mysql':
+        stmt = mysql.insert(FeedStats).values(values)
+        return stmt.on_duplicate_key_update(**build_set(stmt.inserted))
+    if dialect_name == 'sqlite':
+        stmt = sqlite.insert(FeedStats).values(values)
+        return stmt.on_conflict_do_update(index_elements=[FeedStats.feed_id], set_=build_set(stmt.excluded))
+    raise ValueError(f"Unsupported database dialect for feed_stats upsert: {dialect_name}")
+
+
+class FeedStatsRepository:
+    """
+    피드별 집계 통계(feed_stats) 저장소.
+    - 별점 등록, 북마크 추가/삭제, 조회수 증가 시 호출하는 쪽의 트랜잭션 안에서 apply_delta로 함께 갱신함. (commit은 호출하는 쪽에서)
+    - reconcile은 원본 테이블(ratings, bookmarks, feeds)에서 다시 집계하여 어긋난 행만 바로잡음. (최초 백필 겸용)
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    # 피드 통계 증감 메서드
+    # 입력: feed_id - 피드 ID, 나머지 - 각 컬럼의 증감량 (음수 가능)
+    # 설명: 통계 행이 없으면 새로 만들고, 있으면 현재 값에 증감량을 더함 (commit하지 않음)
+    async def apply_delta(
+        self,
+        feed_id: int,
+        rating_sum: int = 0,
+        rating_count: int = 0,
+        bookmark_count: int = 0,
+        view_count: int = 0
+    ) -> None:
+        deltas = {
+            'rating_sum': rating_sum,
+            'rating_count': rating_count,
+            'bookmark_count': bookmark_count,
+            'view_count': view_count,
+        }
+        deltas = {column: delta for column, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        values = {'feed_id': feed_id, 'updated_at': func.current_timestamp()}
+        values.update({column: max(deltas.get(column, 0), 0) for column in STATS_COLUMNS})
+
+        def build_set(_inserted):
+            # ON DUPLICATE KEY UPDATE에는 onupdate 기본값이 적용되지 않으므로 updated_at도 직접 지정함
+            updates = {column: getattr(FeedStats, column) + delta for column, delta in deltas.items()}
+            updates['updated_at'] = func.current_timestamp()
+            return updates
+
+        await self.db.execute(_upsert_stmt(self._dialect_name(), values, build_set))
+
+    # 여러 피드의 조회수 일괄 증가 메서드
+    # 입력: deltas - {feed_id: 증가량}
+    # 설명: 한 번의 INSERT ... (충돌 시 UPDATE) 구문으로 반영함 (commit하지 않음)
+    async def apply_view_deltas(self, deltas: Dict[int, int]) -> None:
+        if not deltas:
+            return
+        rows = [
+            {'feed_id': feed_id, 'rating_sum': 0, 'rating_count': 0, 'bookmark_count': 0,
+             'view_count': delta, 'updated_at': func.current_timestamp()}
+            for feed_id, delta in deltas.items()
+        ]
+
+        def build_set(inserted):
+            return {'view_count': FeedStats.view_count + inserted.view_count, 'updated_at': func.current_timestamp()}
+
+        await self.db.execute(_upsert_stmt(self._dialect_name(), rows, build_set))
+
+    # 원본 테이블 기준 통계 집계 메서드
+    # 입력: feed_ids - 집계할 피드 ID 목록
+    # 반환: {feed_id: (rating_sum, rating_count, bookmark_count, view_count)}
+    # 설명: 별점과 북마크를 각각 따로 GROUP BY 하여 JOIN으로 행이 곱해지지 않도록 함
+    async def aggregate_from_sources(self, feed_ids: Sequence[int]) -> Dict[int, StatsValues]:
+        view_rows = await self.db.execute(
+            select(Feed.id, Feed.view_count).where(Feed.id.in_(feed_ids))
+        )
+        rating_rows = await self.db.execute(
+            select(Rating.feed_id, func.sum(Rating.score), func.count(Rating.id))
+            .where(Rating.feed_id.in_(feed_ids))
+            .group_by(Rating.feed_id)
+        )
+        bookmark_rows = await self.db.execute(
+            select(Bookmark.feed_id, func.count(Bookmark.id))
+            .where(Bookmark.feed_id.in_(feed_ids))
+            .group_by(Bookmark.feed_id)
+        )
+        ratings = {feed_id: (int(score_sum or 0), count) for feed_id, score_sum, count in rating_rows}
+        bookmarks = dict(bookmark_rows.all())
+
+        return {
+            feed_id: (*ratings.get(feed_id, (0, 0)), bookmarks.get(feed_id, 0), view_count or 0)
+            for feed_id, view_count in view_rows
+        }
+
+    # 저장된 통계 조회 메서드
+    # 입력: feed_ids - 조회할 피드 ID 목록
+    # 반환: {feed_id: (rating_sum, rating_count, bookmark_count, view_count)} (통계 행이 없는 피드는 제외)
+    async def get_stats_map(self, feed_ids: Sequence[int]) -> Dict[int, StatsValues]:
+        result = await self.db.execute(
+            select(FeedStats.feed_id, *(getattr(FeedStats, column) for column in STATS_COLUMNS))
+            .where(FeedStats.feed_id.in_(feed_ids))
+        )
+        return {row[0]: tuple(row[1:]) for row in result}
+
+    # 일부 피드의 통계 재계산 메서드
+    # 입력: feed_ids - 재계산할 피드 ID 목록
+    # 반환: 값이 달라서 바로잡은(또는 새로 만든) 통계 행 수
+    # 설명: 원본 집계와 저장된 값이 다른 피드만 덮어씀 (commit하지 않음)
+    async def reconcile_feeds(self, feed_ids: Sequence[int]) -> int:
+        if not feed_ids:
+            return 0
+        actual = await self.aggregate_from_sources(feed_ids)
+        stored = await self.get_stats_map(feed_ids)
+
+        rows = [
+            {'feed_id': feed_id, 'updated_at': func.current_timestamp(), **dict(zip(STATS_COLUMNS, values))}
+            for feed_id, values in actual.items()
+            if stored.get(feed_id) != values
+        ]
+        if not rows:
+            return 0
+
+        def build_set(inserted):
+            updates = {column: getattr(inserted, column) for column in STATS_COLUMNS}
+            updates['updated_at'] = func.current_timestamp()
+            return updates
+
+        await self.db.execute(_upsert_stmt(self._dialect_name(), rows, build_set))
+        return len(rows)
+
+    # 전체 피드 통계 재계산(백필) 메서드
+    # 입력: batch_size - 한 번에 처리할 피드 수
+    # 반환: 바로잡은 통계 행 수의 합계
+    # 설명:
+    #   피드 ID 순으로 배치마다 재계산 후 commit하여 긴 트랜잭션을 만들지 않음
+    #   최초 배포 시 feed_stats가 비어 있으면 전체 피드의 통계 행을 채우는 백필로 동작함
+    #   집계와 기록 사이에 들어온 증감은 다음 실행에서 다시 바로잡힘
+    async def reconcile_all(self, batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+        corrected = 0
+        last_feed_id = 0
+        while True:
+            result = await self.db.execute(
+                select(Feed.id).where(Feed.id > last_feed_id).order_by(Feed.id).limit(batch_size)
+            )
+            feed_ids: List[int] = list(result.scalars().all())
+            if not feed_ids:
+                break
+
+            corrected += await self.reconcile_feeds(feed_ids)
+            await self.db.commit()
+            last_feed_id = feed_ids[-1]
+
+        return corrected
+
+    # 통계 행이 없는 피드만 채우는 백필 메서드
+    # 입력: batch_size - 한 번에 처리할 피드 수
+    # 반환: 새로 만든 통계 행 수의 합계
+    # 설명:
+    #   서버 시작 시 실행하는 용도로, feed_stats에 행이 없는 피드만 골라 재계산함 (이미 채워진 행은 읽지 않음)
+    #   전체 정합성 검사는 매일 새벽의 reconcile_all이 담당함
+    async def backfill_missing(self, batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+        created = 0
+        last_feed_id = 0
+        while True:
+            result = await self.db.execute(
+                select(Feed.id)
+                .outerjoin(FeedStats, FeedStats.feed_id == Feed.id)
+                .where(FeedStats.feed_id.is_(None), Feed.id > last_feed_id)
+                .order_by(Feed.id)
+                .limit(batch_size)
+            )
+            feed_ids: List[int] = list(result.scalars().all())
+            if not feed_ids:
+                break
+
+            created += await self.reconcile_feeds(feed_ids)
+            await self.db.commit()
+            last_feed_id = feed_ids[-1]
+
+        return created
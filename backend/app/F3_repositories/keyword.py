@@ -0,0 +1,118 @@
+import logging
+from typing import List, Dict, Any, Optional
+
+from sqlalchemy import select, delete, insert, func
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.F7_models.keywords import Keyword
+from app.F7_models.word_clouds import WordCloud
+from app.F7_models.organizations import Organization
+
+logger = logging.getLogger(__name__)
+
+# 한 번의 INSERT 문에 담을 최대 행 수
+BULK_INSERT_BATCH_SIZE = 1000
+
+
+def _keyword_upsert_stmt(dialect_name: str, values: List[Dict[str, Any]]):
+    """
+    keywords INSERT ... (유니크 키 충돌 시 점수/빈도 갱신) 구문 생성.
+    운영은 MySQL(ON DUPLICATE KEY UPDATE), 벤치마크/로컬 검증은 SQLite(ON CONFLICT DO UPDATE)를 지원함.
+    """
+    def build_set(inserted):
+        # ON DUPLICATE KEY UPDATE에는 onupdate 기본값이 적용되지 않으므로 updated_at도 직접 지정함
+        return {
+            "total_score": inserted.total_score,
+            "frequency": inserted.frequency,
+            "updated_at": func.current_timestamp(),
+        }
+
+    if dialect_name == 'mysql':
+        stmt = mysql.insert(Keyword).values(values)
+        return stmt.on_duplicate_key_update(**build_set(stmt.inserted))
+    if dialect_name == 'sqlite':
+        stmt = sqlite.insert(Keyword).values(values)
+        return stmt.on_conflict_do_update(
+            index_elements=[Keyword.organization_id, Keyword.keyword_text, Keyword.period],
+            set_=build_set(stmt.excluded),
+        )
+    raise ValueError(f"Unsupported database dialect for keywords upsert: {dialect_name}")
+
+
+class KeywordRepository:
+    """
+    지식 그래프 파이프라인이 미리 계산한 키워드 인기도(Keyword)와 워드클라우드(WordCloud)를
+    MySQL에 적재하고 조회하는 리포지토리.
+    - 모든 행은 집계 기간 키(period)를 가지며, 조회는 항상 가장 최근 기간을 대상으로 함.
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    # 기관별 키워드 가중치 일괄 upsert 메서드
+    # 입력:
+    #   period - 집계 기간 키 (str)
+    #   rows - [{"organization_id": int, "keyword_text": str, "total_score": float, "frequency": int}, ...]
+    # 설명:
+    #   (organization_id, keyword_text, period) 유니크 키 기준으로 upsert 수행 (MySQL/SQLite)
+    #   같은 날 파이프라인을 다시 실행하면 해당 기간의 값이 덮어써짐
+    async def upsert_keyword_weights(self, period: str, rows: List[Dict[str, Any]]) -> None:
+        for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+            batch = [{**row, "period": period} for row in rows[start:start + BULK_INSERT_BATCH_SIZE]]
+            await self.db.execute(_keyword_upsert_stmt(self._dialect_name(), batch))
+
+    # 기간별 워드클라우드 교체 메서드
+    # 입력:
+    #   period - 집계 기간 키 (str)
+    #   rows - [{"organization_id": int | None, "keyword": str, "score": float}, ...]
+    # 설명:
+    #   워드클라우드는 순위가 매겨진 상위 N개 스냅샷이므로, 해당 기간의 기존 행을 지우고 새로 삽입함
+    #   organization_id가 None인 행은 전체 기관 대상의 전역 워드클라우드임
+    async def replace_word_cloud(self, period: str, rows: List[Dict[str, Any]]) -> None:
+        await self.db.execute(delete(WordCloud).where(WordCloud.period == period))
+        for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+            batch = [{**row, "period": period} for row in rows[start:start + BULK_INSERT_BATCH_SIZE]]
+            await self.db.execute(insert(WordCloud).values(batch))
+
+    # 오래된 기간 데이터 정리 메서드
+    # 입력:
+    #   keep_periods - 보존할 최근 기간 수 (int)
+    # 반환:
+    #   삭제 기준이 된 기간 키 (없으면 None)
+    async def delete_old_periods(self, keep_periods: int) -> Optional[str]:
+        result = await self.db.execute(
+            select(WordCloud.period).distinct().order_by(WordCloud.period.desc()).offset(keep_periods).limit(1)
+        )
+        cutoff = result.scalar_one_or_none()
+        if cutoff is None:
+            return None
+        await self.db.execute(delete(WordCloud).where(WordCloud.period <= cutoff))
+        await self.db.execute(delete(Keyword).where(Keyword.period <= cutoff))
+        return cutoff
+
+    # 인기 키워드 조회 메서드
+    # 입력:
+    #   organization_name - 기관명 (None이면 전체 기관 대상)
+    #   limit - 최대 키워드 수 (int)
+    # 반환:
+    #   [{"text": str, "value": float}, ...] (가장 최근 기간, 점수 내림차순)
+    #   미리 계산된 데이터가 없으면 빈 리스트
+    async def get_popular_keywords(self, organization_name: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        latest_period = select(func.max(WordCloud.period)).scalar_subquery()
+        query = select(
+            WordCloud.keyword.label('text'),
+            WordCloud.score.label('value')
+        ).where(WordCloud.period == latest_period)
+
+        if organization_name:
+            query = query.join(Organization, WordCloud.organization_id == Organization.id).where(
+                Organization.name == organization_name
+            )
+        else:
+            query = query.where(WordCloud.organization_id.is_(None))
+
+        result = await self.db.execute(query.order_by(WordCloud.score.desc()).limit(limit))
+        return [row._asdict() for row in result.all()]
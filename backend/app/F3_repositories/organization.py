@@ -179,6 +179,7 @@ class OrganizationRepository:
     async def get_top_keywords_by_org_name(self, org_name: str, limit: int = 14) -> List[WordCloud]:
         """
         특정 기관의 키워드를 score가 높은 순으로 상위 N개 조회
+        - 지식 그래프 파이프라인이 적재한 가장 최근 기간(period)의 워드클라우드만 대상으로 함
         
         Args:
             org_name (str): 조회할 기관의 이름
@@ -191,7 +192,10 @@ class OrganizationRepository:
             query = (
                 select(WordCloud)
                 .join(Organization, WordCloud.organization_id == Organization.id)
-                .where(Organization.name == org_name)
+                .where(
+                    Organization.name == org_name,
+                    WordCloud.period == select(func.max(WordCloud.period)).scalar_subquery()
+                )
                 .order_by(WordCloud.score.desc())
                 .limit(limit)
             )
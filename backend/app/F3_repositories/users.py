@@ -1,4 +1,4 @@
-from sqlalchemy import select, func, text
+from sqlalchemy import select, func, text, cast, Float
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, Dict, List, Any
 import logging
@@ -9,6 +9,7 @@ from app.F6_schemas.users import (
 from app.F7_models.users import User
 from app.F7_models.ratings import Rating
 from app.F7_models.feeds import Feed
+from app.F7_models.feed_stats import FeedStats
 from app.F7_models.bookmarks import Bookmark
 from app.F7_models.categories import Category
 from app.F7_models.organizations import Organization
@@ -109,12 +110,13 @@ class UserRepository:
                 Feed.view_count,                                # 피드 조회수
                 Feed.published_date,                            # 원본 콘텐츠의 발행 일시
                 Rating.score.label("user_rating"),              # 사용자가 준 별점
-                func.avg(Rating.score).over(partition_by=Feed.id).label("average_rating"),                              # 해당 피드의 평균
+                func.coalesce(cast(FeedStats.rating_sum, Float) / func.nullif(FeedStats.rating_count, 0), 0.0).label("average_rating"),  # 해당 피드의 평균 (feed_stats 기준)
                 Rating.created_at.label("rated_at"),             # 사용자가 별점 남긴 날짜
             )
             .join(Rating, Rating.feed_id == Feed.id)    
             .join(Organization, Feed.organization_id == Organization.id)
             .join(Category, Feed.category_id == Category.id)
+            .outerjoin(FeedStats, FeedStats.feed_id == Feed.id)
             .where(
                 Rating.user_id == user_pk,  # 해당 사용자의 별점만 조회
                 Feed.is_active.is_(True)    # 활성화된 피드만
@@ -258,27 +260,7 @@ class UserRepository:
         if not feed_ids:
             return {}
 
-        # 피드별 평균 별점과 북마크 수를 계산하는 서브쿼리
-        rating_sq = (
-            select(
-                Rating.feed_id,
-                func.avg(Rating.score).label("average_rating")
-            )
-            .where(Rating.feed_id.in_(feed_ids))
-            .group_by(Rating.feed_id)
-            .subquery()
-        )
-        bookmark_sq = (
-            select(
-                Bookmark.feed_id,
-                func.count(Bookmark.id).label("bookmark_count")
-            )
-            .where(Bookmark.feed_id.in_(feed_ids))
-            .group_by(Bookmark.feed_id)
-            .subquery()
-        )
-
-        # 메인 쿼리
+        # 메인 쿼리 (피드별 평균 별점과 북마크 수는 feed_stats에서 읽음)
         stmt = (
             select(
                 Feed.id,
@@ -288,15 +270,14 @@ class UserRepository:
                 Feed.view_count,
                 Organization.name.label("organization_name"),
                 Category.name.label("category_name"),
-                # 서브쿼리 결과가 없는 경우(NULL) 0으로 처리
-                func.coalesce(rating_sq.c.average_rating, 0.0).label("average_rating"),
-                func.coalesce(bookmark_sq.c.bookmark_count, 0).label("bookmark_count")
+                # 통계 행이 없거나 별점이 없는 경우(NULL) 0으로 처리
+                func.coalesce(cast(FeedStats.rating_sum, Float) / func.nullif(FeedStats.rating_count, 0), 0.0).label("average_rating"),
+                func.coalesce(FeedStats.bookmark_count, 0).label("bookmark_count")
             )
             .select_from(Feed)
             .join(Organization, Feed.organization_id == Organization.id)
             .join(Category, Feed.category_id == Category.id)
-            .outerjoin(rating_sq, Feed.id == rating_sq.c.feed_id)
-            .outerjoin(bookmark_sq, Feed.id == bookmark_sq.c.feed_id)
+            .outerjoin(FeedStats, Feed.id == FeedStats.feed_id)
             .where(Feed.id.in_(feed_ids))
         )
 
@@ -0,0 +1,33 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+# 키셋(keyset) 페이지네이션 커서 유틸
+# - 커서는 마지막으로 반환한 행의 정렬 키 (published_date, id)를 담은 불투명(opaque) 문자열임
+# - 클라이언트는 받은 next_cursor를 그대로 다음 요청에 넘기기만 하면 되고, 내부 형식에 의존하지 않음
+
+KeysetPosition = Tuple[Optional[datetime], int]
+
+
+def encode_cursor(published_date: Optional[datetime], feed_id: int) -> str:
+    """정렬 키 (published_date, id)를 URL에 안전한 커서 문자열로 인코딩함."""
+    payload = {"d": published_date.isoformat() if published_date else None, "i": feed_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> KeysetPosition:
+    """
+    커서 문자열을 정렬 키 (published_date, id)로 디코딩함.
+    형식이 잘못된 커서는 ValueError를 발생시킴.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        published_date = datetime.fromisoformat(payload["d"]) if payload["d"] else None
+        feed_id = int(payload["i"])
+    except (ValueError, KeyError, TypeError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    return published_date, feed_id
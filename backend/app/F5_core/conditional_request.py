@@ -0,0 +1,148 @@
+import hashlib
+import inspect
+import json
+import logging
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Request, Response
+
+from app.F6_schemas.base import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+# 조건부 요청 응답의 기본 Cache-Control (클라이언트가 보관하되 매번 ETag로 재검증하게 함)
+DEFAULT_CACHE_CONTROL = "no-cache"
+# 로그인 사용자별 내용이 섞인 응답용 (공유 캐시/프록시에 저장하지 않음)
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def _to_http_date(value: datetime) -> str:
+    """DB의 naive datetime(서버 로컬 시간)을 HTTP 날짜(GMT) 문자열로 변환함"""
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+class ResourceValidator:
+    """
+    응답 본문을 만들지 않고도 계산할 수 있는 조건부 요청 검증자 (ETag + Last-Modified).
+    - etag: 약한(weak) ETag. 버퍼에 쌓인 조회수처럼 자주 바뀌는 값은 제외하고 계산하므로 의미상 동등함만 보장함
+    - last_modified: 리소스의 마지막 변경 시각 (없으면 If-Modified-Since는 검사하지 않음)
+    """
+
+    def __init__(self, etag: str, last_modified: Optional[datetime] = None):
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def from_parts(cls, *parts: Any, last_modified: Optional[datetime] = None) -> "ResourceValidator":
+        """버전을 이루는 값들(수정 시각, 개수 등)의 해시로 ETag를 만듦"""
+        digest = hashlib.sha1(json.dumps(parts, default=str, ensure_ascii=False).encode("utf-8")).hexdigest()
+        return cls(f'W/"{digest[:32]}"', last_modified)
+
+    def matches(self, request: Request) -> bool:
+        """
+        요청의 조건부 헤더가 현재 버전과 일치하는지(304로 응답해도 되는지) 확인함.
+        - If-None-Match가 있으면 그것만 사용 (약한 비교, "*" 허용)
+        - 없을 때만 If-Modified-Since를 Last-Modified와 초 단위로 비교
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return self.etag.removeprefix("W/") in candidates
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return self.last_modified.astimezone(timezone.utc).replace(microsecond=0) <= since
+        return False
+
+    def describes(self, request: Request) -> bool:
+        """
+        응답 본문이 이 버전을 반영하는지 확인함.
+        응답 캐시(response_cache)에서 꺼낸 본문이 마지막 변경보다 먼저 저장된 것이면, 새 ETag를 붙였을 때
+        클라이언트가 오래된 본문을 새 버전으로 착각하므로 ETag를 붙이지 않음
+        """
+        stored_at = getattr(request.state, "response_cache_stored_at", None)
+        if stored_at is None or self.last_modified is None:
+            return True
+        return stored_at >= self.last_modified.timestamp()
+
+    def apply(self, response: Response, cache_control: str = DEFAULT_CACHE_CONTROL) -> None:
+        """응답 헤더에 ETag / Last-Modified / Cache-Control을 설정함"""
+        response.headers["ETag"] = self.etag
+        if self.last_modified is not None:
+            response.headers["Last-Modified"] = _to_http_date(self.last_modified)
+        response.headers["Cache-Control"] = cache_control
+
+    def not_modified(self, cache_control: str = DEFAULT_CACHE_CONTROL, vary: Optional[str] = None) -> Response:
+        """본문 없는 304 응답을 만듦"""
+        response = Response(status_code=304)
+        self.apply(response, cache_control)
+        if vary:
+            response.headers["Vary"] = vary
+        return response
+
+
+def conditional_response(
+    resolve_validator: Callable[..., Awaitable[Optional[ResourceValidator]]],
+    cache_control: str = DEFAULT_CACHE_CONTROL,
+):
+    """
+    GET 엔드포인트에 ETag / Last-Modified 조건부 응답을 붙이는 데코레이터
+    - resolve_validator(**엔드포인트 인자): 본문을 만들지 않고 현재 버전의 ResourceValidator를 계산함 (None이면 조건부 처리 안 함)
+    - 요청의 If-None-Match / If-Modified-Since가 현재 버전과 같으면 엔드포인트(서비스 호출)를 실행하지 않고 304를 반환함
+    - 그 외에는 엔드포인트를 실행하고, 성공 응답에 ETag / Last-Modified 헤더를 붙임
+
+    사용 예 (log_event_detailed 아래, cache_response 위에 둠):
+        @router.get("/", response_model=MainFeedListResponse)
+        @log_event_detailed(action="LIST", category=["PUBLIC", "FEED"])
+        @conditional_response(_feed_list_validator)
+        async def get_feeds(...):
+
+    Request/Response가 필요하므로 엔드포인트에 해당 인자가 없으면 시그니처에 추가하여 FastAPI가 주입하게 함.
+    버전 계산에 실패하면 조건부 처리 없이 엔드포인트를 그대로 실행함.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        accepts_request = "request" in signature.parameters
+        accepts_response = "response" in signature.parameters
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs["request"] if accepts_request else kwargs.pop("request")
+            response: Response = kwargs["response"] if accepts_response else kwargs.pop("response")
+
+            validator = None
+            try:
+                validator = await resolve_validator(**kwargs)
+            except Exception as e:
+                logger.warning(f"Failed to resolve conditional request validator for {request.url.path}: {e}")
+
+            if validator is not None and validator.matches(request):
+                return validator.not_modified(cache_control)
+
+            result = await func(*args, **kwargs)
+            # 에러 응답(존재하지 않는 기관/피드 등)에는 검증자를 붙이지 않음
+            failed = isinstance(result, (ErrorResponse, Response)) or getattr(result, "success", True) is False
+            if validator is not None and not failed and validator.describes(request):
+                validator.apply(response, cache_control)
+            return result
+
+        extra_params = []
+        if not accepts_request:
+            extra_params.append(inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request))
+        if not accepts_response:
+            extra_params.append(inspect.Parameter("response", inspect.Parameter.KEYWORD_ONLY, annotation=Response))
+        if extra_params:
+            wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), *extra_params])
+        return wrapper
+    return decorator
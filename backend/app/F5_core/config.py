@@ -21,6 +21,22 @@ class Settings(BaseSettings):
     DB_HOST: str
     DB_PORT: int
     DB_NAME: str
+    # 커넥션 풀 설정
+    # DB_POOL_MODE: "queue" (AsyncAdaptedQueuePool로 연결 재사용) 또는 "null" (NullPool, 세션마다 새 연결)
+    DB_POOL_MODE: str = "queue"
+    DB_POOL_SIZE: int = 10          # 항상 유지하는 연결 수
+    DB_MAX_OVERFLOW: int = 20       # 풀이 가득 찼을 때 추가로 열 수 있는 연결 수
+    DB_POOL_TIMEOUT: float = 30.0   # 연결을 빌리기 위해 기다리는 최대 시간(초)
+    DB_POOL_RECYCLE: int = 1800     # 이 시간(초)이 지난 연결은 재연결 (MySQL wait_timeout보다 짧게)
+    DB_POOL_PRE_PING: bool = True   # 연결을 빌려줄 때 끊긴 연결인지 확인
+    DB_ECHO: bool = False           # 모든 SQL을 로그로 출력 (디버깅용)
+    # 읽기 전용 복제본(replica) 설정 (URL이 없으면 모든 조회가 주 DB를 사용함)
+    DB_REPLICA_URL: Optional[str] = None
+    DB_READ_YOUR_WRITES_SECONDS: int = 5    # 사용자가 쓰기를 커밋한 뒤 이 시간(초) 동안은 그 사용자의 조회를 주 DB로 보냄
+    DB_REPLICA_RETRY_SECONDS: int = 30      # 복제본 연결 실패 후 다시 시도하기 전까지 주 DB만 사용하는 시간(초)
+    # 요청별 SQL 계측 설정
+    SQL_SLOW_QUERY_SECONDS: float = 0.5     # 요청의 가장 느린 문장이 이 시간(초) 이상이면 경고 로그
+    SQL_REPEATED_QUERY_THRESHOLD: int = 10  # 한 요청에서 같은 모양의 문장이 이 횟수 이상 실행되면 N+1 의심 경고
 
     # 그래프 데이터베이스 설정 (Neo4j)
     NEO4J_URI: str
@@ -43,6 +59,12 @@ class Settings(BaseSettings):
     ELASTICSEARCH_USER_DICT_PATH: Optional[str] = "/etc/elasticsearch/userdict_ko.txt"
     ELASTICSEARCH_SYNONYMS_PATH: Optional[str] = "/etc/elasticsearch/synonym-set.txt"
     ELASTICSEARCH_STOPWORDS_PATH: Optional[str] = "/etc/elasticsearch/stopwords.txt"
+    SEARCH_CACHE_TTL_SECONDS: int = 30          # 검색 결과 캐시 유지 시간(초)
+    SEARCH_ALIAS_REFRESH_SECONDS: float = 5.0   # 읽기 alias가 가리키는 인덱스 이름을 다시 조회하는 주기(초)
+
+    # 추천 엔진 설정
+    # 워커들이 공유하는 추천 모델 파일(artifact) 저장 위치
+    RECOMMENDATION_MODEL_DIR: str = "/app/ml_models/recommendation"
 
     # 크롤러 설정
     CRAWLER_API_KEY: str
@@ -0,0 +1,92 @@
+import logging
+import time
+from datetime import datetime
+from functools import wraps
+from typing import Any, Optional, Tuple
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.responses import Response
+
+from app.F5_core.redis import client_redis
+from app.F6_schemas.base import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+CONTENT_VERSION_PREFIX = "content_version"
+
+# (버전을 이루는 값 튜플, 마지막 변경 시각)
+ContentVersion = Tuple[Tuple[Any, ...], Optional[datetime]]
+
+
+class ContentVersionStore:
+    """
+    조건부 요청(ETag / Last-Modified)용 콘텐츠 버전 카운터.
+    - {prefix}:{태그} (HASH) -> version: 변경 횟수, changed_at: 마지막 변경 시각(epoch 초)
+    - 태그는 응답 캐시 태그(response_cache의 CACHE_TAG_*)와 같으며, 관리자 변경(캐시 무효화)과 별점/북마크 등록 시 올림
+    - 조회수 flush처럼 목록 응답의 의미를 바꾸지 않는 쓰기는 버전을 올리지 않음
+    버전 계산에 DB를 읽지 않으므로 응답 캐시 적중 시에도 요청당 Redis 한 번으로 끝남.
+    """
+
+    def __init__(self, redis: Redis = client_redis):
+        self.redis = redis
+
+    def key(self, tag: str) -> str:
+        return f"{CONTENT_VERSION_PREFIX}:{tag}"
+
+    async def bump(self, *tags: str) -> None:
+        now = time.time()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.hincrby(self.key(tag), "version", 1)
+                pipe.hset(self.key(tag), "changed_at", now)
+            await pipe.execute()
+
+    async def get(self, *tags: str) -> ContentVersion:
+        """
+        태그들의 (버전, 변경 시각)과 그중 가장 최근 변경 시각을 반환함.
+        키가 없으면(최초 배포, Redis 초기화) 지금을 변경 시각으로 기록하여, 이전에 발급한 ETag와 겹치지 않게 함
+        """
+        now = time.time()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.hsetnx(self.key(tag), "changed_at", now)
+                pipe.hmget(self.key(tag), "version", "changed_at")
+            results = await pipe.execute()
+
+        parts = []
+        latest = None
+        for version, changed_at in results[1::2]:
+            changed_at = float(changed_at)
+            parts.append((int(version or 0), changed_at))
+            latest = changed_at if latest is None else max(latest, changed_at)
+        # DB의 수정 시각과 같이 서버 로컬 naive datetime으로 맞춤
+        return tuple(parts), datetime.fromtimestamp(latest) if latest is not None else None
+
+
+content_version_store = ContentVersionStore()
+
+
+async def bump_content_versions(*tags: str) -> None:
+    """태그의 콘텐츠 버전을 올림. Redis 장애 시에는 경고만 남김 (조건부 요청 검증자도 Redis 없이는 계산되지 않음)"""
+    try:
+        await content_version_store.bump(*tags)
+    except RedisError as e:
+        logger.warning(f"Failed to bump content versions {list(tags)}: {e}")
+
+
+def bumps_content_version(*tags: str):
+    """
+    서비스의 쓰기 메서드에 붙여, 성공(에러 응답이 아님)했을 때 해당 태그의 콘텐츠 버전을 올리는 데코레이터
+    (응답 캐시는 무효화하지 않음. 캐시된 본문이 이전 버전이면 conditional_response가 ETag를 붙이지 않음)
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            result = await func(*args, **kwargs)
+            failed = isinstance(result, (ErrorResponse, Response)) or getattr(result, "success", True) is False
+            if not failed:
+                await bump_content_versions(*tags)
+            return result
+        return wrapper
+    return decorator
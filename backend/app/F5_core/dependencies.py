@@ -10,6 +10,8 @@ from app.F2_services.session import SessionService
 from app.F2_services.static_page import StaticPageService
 from app.F2_services.organization import OrganizationService
 from app.F2_services.feed import FeedService
+from app.F2_services.leaderboard import LeaderboardStore
+from app.F2_services.view_counter import ViewCountBuffer
 from app.F2_services.users import UserService
 from app.F2_services.notice import NoticeService
 from app.F2_services.graph import GraphService
@@ -55,7 +57,7 @@ from app.F5_core.redis import RedisCacheService, PasswordResetRedisService, Craw
 from app.F5_core.security import AuthHandler
 from app.F6_schemas.base import UserRole
 from app.F7_models.users import UserStatus, User
-from app.F8_database.session import get_db
+from app.F8_database.session import get_db, get_read_db, read_session_scope
 from app.F11_search.ES1_client import es_async
 from app.F8_database.graph_db import Neo4jDriver
 from neo4j import AsyncDriver
@@ -89,13 +91,17 @@ async def get_email_verification_services() -> EmailVerificationService:
     """이메일 인증 의존성 주입용 함수"""
     return EmailVerificationService()
 
-async def get_organization_service(db: AsyncSession = Depends(get_db)) -> OrganizationService:
-    """기관/카테고리 관련 서비스 의존성 주입용 함수"""
+async def get_organization_service(db: AsyncSession = Depends(get_read_db)) -> OrganizationService:
+    """기관/카테고리 관련 서비스 의존성 주입용 함수 (조회 전용이므로 읽기 복제본 세션 사용)"""
     return OrganizationService(OrganizationRepository(db))
 
 async def get_feed_service(db: AsyncSession = Depends(get_db)) -> FeedService:
     """피드 관련 서비스 의존성 주입용 함수"""
-    return FeedService(FeedRepository(db))
+    return FeedService(FeedRepository(db), leaderboard_store=LeaderboardStore(), view_buffer=ViewCountBuffer())
+
+async def get_feed_read_service(db: AsyncSession = Depends(get_read_db)) -> FeedService:
+    """피드 목록 조회 전용 서비스 의존성 주입용 함수 (읽기 복제본 세션 사용, 별점/북마크/조회수 기록에는 get_feed_service 사용)"""
+    return FeedService(FeedRepository(db), leaderboard_store=LeaderboardStore(), view_buffer=ViewCountBuffer())
 
 async def get_user_service(
     db: AsyncSession = Depends(get_db),
@@ -130,9 +136,14 @@ def get_graph_repository(
     """
     return GraphRepository(driver)
 
-def get_graph_service(repo: GraphRepository = Depends(get_graph_repository)) -> GraphService:
-    """그래프 DB 서비스 의존성 주입."""
-    return GraphService(repo)
+def get_graph_service(
+    repo: GraphRepository = Depends(get_graph_repository)
+) -> GraphService:
+    """
+    그래프 DB 서비스 의존성 주입. (워드클라우드는 MySQL에 미리 계산된 데이터를 우선 사용)
+    - MySQL 세션은 요청마다 열지 않고, 워드클라우드를 실제로 계산할 때(응답 캐시 미스)만 읽기 세션을 엶
+    """
+    return GraphService(repo, keyword_session_scope=read_session_scope)
 
 
 # --- 관리자 ---
@@ -191,7 +202,7 @@ async def get_admin_org_crawler_trigger_service(
 
 
 async def get_admin_dashboard_service(
-        db: AsyncSession=Depends(get_db),
+        db: AsyncSession=Depends(get_read_db),
         es: AsyncElasticsearch = Depends(get_es_client)
 ) -> DashboardAdminService:
     """관리자 대시보드 관련 의존성 주입용 함수"""
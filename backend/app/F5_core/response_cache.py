@@ -0,0 +1,247 @@
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.responses import Response
+
+from app.F5_core.content_version import bump_content_versions
+from app.F5_core.redis import client_redis
+from app.F6_schemas.base import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_PREFIX = "response_cache"
+# 캐시된 응답을 그대로 내보내는 기간
+DEFAULT_CACHE_TTL_SECONDS = 300
+# 신선 기간이 지난 뒤에도 보관하는 기간. 이 동안은 한 요청만 다시 계산하고 나머지는 이전 응답을 받음
+DEFAULT_STALE_TTL_SECONDS = 60
+# 한 키를 다시 계산하는 요청이 잡는 잠금의 최대 유지 시간
+CACHE_LOCK_TTL_SECONDS = 10
+# 캐시가 비어 있을 때, 다른 요청이 계산 중이면 결과를 기다리는 최대 시간과 확인 간격
+CACHE_FILL_WAIT_SECONDS = 2.0
+CACHE_FILL_POLL_SECONDS = 0.05
+# 태그 -> 캐시 키 집합의 보관 기간 (만료된 키가 남아 있어도 무효화 시 DEL만 헛돌 뿐임)
+TAG_SET_TTL_SECONDS = 24 * 3600
+
+# 응답 캐시 태그 (공개 엔드포인트와 관리자 서비스 무효화에서 함께 사용)
+CACHE_TAG_FEEDS = "feeds"
+CACHE_TAG_ORGANIZATIONS = "organizations"
+CACHE_TAG_SLIDERS = "sliders"
+CACHE_TAG_NOTICES = "notices"
+CACHE_TAG_STATIC_PAGES = "static_pages"
+CACHE_TAG_WORDCLOUD = "wordcloud"
+
+
+def build_cache_key(request: Request) -> str:
+    """
+    라우트 템플릿 + 정규화한 경로/쿼리 파라미터로 캐시 키를 만듦.
+    - /organizations/{name}/summary 처럼 템플릿을 쓰므로 같은 엔드포인트의 키가 한 접두사 아래 모임
+    - 쿼리 파라미터는 이름순으로 정렬하여 순서만 다른 요청이 같은 키를 쓰도록 함
+    """
+    route = request.scope.get("route")
+    template = getattr(route, "path_format", None) or request.url.path
+    params = [
+        sorted((str(name), str(value)) for name, value in request.path_params.items()),
+        sorted(request.query_params.multi_items()),
+    ]
+    digest = hashlib.sha1(json.dumps(params, ensure_ascii=False).encode("utf-8")).hexdigest()
+    return f"{RESPONSE_CACHE_PREFIX}:{template}:{digest}"
+
+
+def _is_failure(result: Any) -> bool:
+    """에러 응답이거나 success=False인 응답은 캐시하지도, 무효화 근거로 쓰지도 않음"""
+    return isinstance(result, (ErrorResponse, Response)) or getattr(result, "success", True) is False
+
+
+class ResponseCache:
+    """
+    공개 조회 API 응답을 Redis에 JSON으로 저장하는 캐시.
+    - {prefix}:{라우트 템플릿}:{파라미터 해시} -> {"body": 응답 JSON, "stored_at": 저장 시각, "fresh_until": 신선 기간 만료 시각}
+    - {prefix}:tag:{태그} (SET) -> 해당 태그가 붙은 캐시 키 목록 (관리자 변경 시 태그 단위로 삭제)
+    - 같은 키를 동시에 다시 계산하지 않도록 {키}:lock 으로 한 요청만 계산함 (single-flight)
+    """
+
+    def __init__(self, redis: Redis = client_redis):
+        self.redis = redis
+
+    def tag_key(self, tag: str) -> str:
+        return f"{RESPONSE_CACHE_PREFIX}:tag:{tag}"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self.redis.get(key)
+        return json.loads(raw) if raw else None
+
+    async def set(self, key: str, body: Any, tags: Sequence[str], ttl: int, stale_ttl: int) -> None:
+        now = time.time()
+        entry = {"body": body, "stored_at": now, "fresh_until": now + ttl}
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(key, json.dumps(entry, ensure_ascii=False), ex=ttl + stale_ttl)
+            for tag in tags:
+                pipe.sadd(self.tag_key(tag), key)
+                pipe.expire(self.tag_key(tag), TAG_SET_TTL_SECONDS)
+            await pipe.execute()
+
+    async def acquire_lock(self, key: str) -> bool:
+        return bool(await self.redis.set(f"{key}:lock", 1, nx=True, ex=CACHE_LOCK_TTL_SECONDS))
+
+    async def release_lock(self, key: str) -> None:
+        await self.redis.delete(f"{key}:lock")
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """태그가 붙은 캐시 키를 모두 삭제하고, 삭제한 키 수를 반환함."""
+        deleted = 0
+        for tag in tags:
+            keys = await self.redis.smembers(self.tag_key(tag))
+            if keys:
+                deleted += await self.redis.delete(*keys)
+            await self.redis.delete(self.tag_key(tag))
+        return deleted
+
+    @staticmethod
+    def _serve_cached(request: Request, entry: Dict[str, Any]) -> Any:
+        """캐시된 본문을 반환함. 저장 시각은 request.state에 남겨 조건부 응답(ETag)이 본문의 최신 여부를 판단하게 함"""
+        request.state.response_cache_stored_at = entry.get("stored_at")
+        return entry["body"]
+
+    async def _compute_and_store(self, key: str, call: Callable[[], Awaitable[Any]], tags, ttl, stale_ttl) -> Any:
+        """엔드포인트를 실행하고 성공 응답이면 캐시에 저장함. (호출하는 쪽이 잠금을 잡은 상태)"""
+        try:
+            result = await call()
+            if not _is_failure(result):
+                try:
+                    await self.set(key, jsonable_encoder(result), tags, ttl, stale_ttl)
+                except RedisError as e:
+                    logger.warning(f"Failed to store cached response {key}: {e}")
+            return result
+        finally:
+            try:
+                await self.release_lock(key)
+            except RedisError:
+                pass
+
+    async def serve_key(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Any]],
+        tags: Sequence[str],
+        ttl: int,
+        stale_ttl: int,
+        on_hit: Callable[[Dict[str, Any]], Any] = lambda entry: entry["body"],
+    ) -> Any:
+        """
+        지정한 키로 캐시에서 값을 꺼내거나 call을 실행함.
+        - 신선한 캐시: on_hit(저장된 항목) 반환
+        - 오래된(stale) 캐시: 잠금을 얻은 한 요청만 다시 계산하고, 나머지는 이전 값을 반환
+        - 캐시 없음: 잠금을 얻은 한 요청만 계산하고, 나머지는 잠시 기다렸다가 채워진 결과를 반환
+        - Redis 장애 시 캐시 없이 call을 실행함
+        """
+        try:
+            entry = await self.get(key)
+            if entry is not None and entry["fresh_until"] > time.time():
+                return on_hit(entry)
+            locked = await self.acquire_lock(key)
+        except RedisError as e:
+            logger.warning(f"Response cache unavailable, bypassing cache for {key}: {e}")
+            return await call()
+
+        if locked:
+            return await self._compute_and_store(key, call, tags, ttl, stale_ttl)
+        if entry is not None:
+            return on_hit(entry)
+
+        # 다른 요청이 같은 키를 계산 중이면 결과가 채워질 때까지 잠시 기다림
+        deadline = time.monotonic() + CACHE_FILL_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(CACHE_FILL_POLL_SECONDS)
+            try:
+                entry = await self.get(key)
+            except RedisError:
+                break
+            if entry is not None:
+                return on_hit(entry)
+        return await call()
+
+    async def serve(
+        self,
+        request: Request,
+        call: Callable[[], Awaitable[Any]],
+        tags: Sequence[str],
+        ttl: int,
+        stale_ttl: int,
+    ) -> Any:
+        """요청의 라우트/파라미터로 만든 키로 엔드포인트 응답을 캐시에서 꺼내거나 엔드포인트를 실행함 (serve_key 참고)"""
+        return await self.serve_key(
+            build_cache_key(request), call, tags, ttl, stale_ttl,
+            on_hit=lambda entry: self._serve_cached(request, entry),
+        )
+
+
+response_cache = ResponseCache()
+
+
+def cache_response(*tags: str, ttl: int = DEFAULT_CACHE_TTL_SECONDS, stale_ttl: int = DEFAULT_STALE_TTL_SECONDS):
+    """
+    공개 GET 엔드포인트 응답을 Redis에 캐시하는 데코레이터
+    - tags: 관리자 변경 시 함께 무효화할 태그 (예: "sliders", "notices")
+    - ttl: 신선 기간(초), stale_ttl: 신선 기간 이후 이전 응답을 대신 내보낼 수 있는 기간(초)
+
+    사용 예 (log_event_detailed 아래에 둠):
+        @router.get("", response_model=SliderListResponse)
+        @log_event_detailed(action="LIST", category=["PUBLIC", "SLIDER"])
+        @cache_response("sliders", ttl=300)
+        async def get_sliders(...):
+
+    캐시 키를 만들기 위해 Request가 필요하므로, 엔드포인트에 request 인자가 없으면 시그니처에 추가하여 FastAPI가 주입하게 함.
+    캐시 적중 시에는 저장해 둔 JSON(dict)을 반환하며, FastAPI가 response_model로 다시 직렬화함.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        accepts_request = "request" in signature.parameters
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs["request"] if accepts_request else kwargs.pop("request")
+            return await response_cache.serve(request, lambda: func(*args, **kwargs), tags, ttl, stale_ttl)
+
+        if not accepts_request:
+            request_param = inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+            wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), request_param])
+        return wrapper
+    return decorator
+
+
+async def invalidate_cache_tags(*tags: str) -> None:
+    """
+    태그가 붙은 응답 캐시를 삭제하고, 같은 태그의 콘텐츠 버전(조건부 요청 검증자)을 올림.
+    Redis 장애 시에는 경고만 남김 (캐시는 TTL로 만료됨)
+    """
+    try:
+        deleted = await response_cache.invalidate_tags(*tags)
+        logger.info(f"Invalidated {deleted} cached responses for tags {list(tags)}")
+    except RedisError as e:
+        logger.warning(f"Failed to invalidate response cache tags {list(tags)}: {e}")
+    await bump_content_versions(*tags)
+
+
+def invalidates_cache(*tags: str):
+    """
+    관리자 서비스의 변경 메서드에 붙여, 성공(에러 응답이 아님)했을 때 해당 태그의 응답 캐시를 무효화하는 데코레이터
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            result = await func(*args, **kwargs)
+            if not _is_failure(result):
+                await invalidate_cache_tags(*tags)
+            return result
+        return wrapper
+    return decorator
@@ -37,6 +37,7 @@ class MainFeedListData(BaseModel):
     """메인 페이지 피드 목록 데이터"""
     feeds: List[MainFeedItem]
     pagination: PaginationInfo
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (무한 스크롤용, 마지막 페이지면 None)")
 
 class MainFeedListResponse(BaseResponse):
     """메인 페이지 피드 목록 응답"""
@@ -46,6 +47,7 @@ class FeedListQuery(BaseModel):
     """피드 목록 쿼리 파라미터"""
     page: int = Field(default=1, ge=1, description="페이지 번호 (1부터 시작)")
     limit: int = Field(default=20, ge=1, le=100, description="페이지당 항목 수 (최대 100)")
+    cursor: Optional[str] = Field(default=None, description="키셋 커서 (주어지면 page 대신 커서 다음부터 조회)")
 
 # ============================================================================
 # 2. 기관 페이지 피드 목록 관련 스키마
@@ -73,6 +75,7 @@ class OrganizationFeedListData(BaseModel):
     feeds: List[OrganizationFeedItem]
     pagination: PaginationInfo
     filter: Optional[FeedFilter] = None
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (무한 스크롤용, 마지막 페이지면 None)")
 
 class OrganizationFeedListResponse(BaseResponse):
     """기관 페이지 피드 목록 응답"""
@@ -83,6 +86,7 @@ class OrganizationFeedQuery(BaseModel):
     page: int = Field(default=1, ge=1, description="페이지 번호 (1부터 시작)")
     limit: int = Field(default=20, ge=1, le=100, description="페이지당 항목 수 (최대 100)")
     category_id: Optional[int] = Field(default=None, description="카테고리 ID (선택사항)")
+    cursor: Optional[str] = Field(default=None, description="키셋 커서 (주어지면 page 대신 커서 다음부터 조회)")
 
 # ============================================================================
 # 3. 최신 피드 슬라이드 관련 스키마
@@ -170,6 +174,7 @@ class PressReleaseData(BaseModel):
     organization: OrganizationInfo
     press_releases: List[PressReleaseItem]
     pagination: PaginationInfo
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (더보기용, 마지막 페이지면 None)")
 
 class PressReleaseResponse(BaseResponse):
     """보도자료 응답"""
@@ -179,6 +184,7 @@ class PressReleaseQuery(BaseModel):
     """보도자료 쿼리 파라미터"""
     page: int = Field(default=1, ge=1, description="페이지 번호 (1부터 시작)")
     limit: int = Field(default=15, ge=1, le=100, description="페이지당 항목 수 (최대 100)")
+    cursor: Optional[str] = Field(default=None, description="키셋 커서 (주어지면 page 대신 커서 다음부터 조회)")
 
 # ============================================================================
 # 6. 피드 상세 관련 스키마 (PDF 버전)
@@ -282,6 +288,7 @@ class PolicyNewsData(BaseModel):
     organization: OrganizationInfo
     press_releases: List[PolicyNewsItem]
     pagination: PaginationInfo
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (더보기용, 마지막 페이지면 None)")
 
 class PolicyNewsResponse(BaseResponse):
     """보도자료 응답"""
@@ -291,3 +298,4 @@ class PolicyNewsQuery(BaseModel):
     """보도자료 쿼리 파라미터"""
     page: int = Field(default=1, ge=1, description="페이지 번호 (1부터 시작)")
     limit: int = Field(default=15, ge=1, le=100, description="페이지당 항목 수 (최대 100)")
+    cursor: Optional[str] = Field(default=None, description="키셋 커서 (주어지면 page 대신 커서 다음부터 조회)")
@@ -1,6 +1,7 @@
 from app.F7_models.bookmarks import Bookmark
 from app.F7_models.categories import Category
 from app.F7_models.feeds import Feed
+from app.F7_models.feed_stats import FeedStats
 from app.F7_models.keywords import Keyword
 from app.F7_models.notices import Notice
 from app.F7_models.organizations import Organization
@@ -23,6 +24,7 @@ __all__ = [
     "Bookmark",
     "Category",
     "Feed",
+    "FeedStats",
     "Keyword",
     "Notice",
     "Organization",
@@ -22,9 +22,9 @@ class Bookmark(Base):
     user = relationship("User", back_populates="bookmarks")  # 북마크한 사용자 정보
     feed = relationship("Feed", back_populates="bookmarks")  # 북마크된 피드 정보
 
-    # 제약조건 및 인덱스 설정
+    # 제약조건 및 인덱스 설정 (기존 DB 변경: F8_database/migrations/0002_feed_rating_bookmark_indexes.sql)
     __table_args__ = (
         UniqueConstraint('user_id', 'feed_id', name='uq_user_feed_bookmark'),  # 사용자별 피드 중복 북마크 방지
-        Index('idx_bookmark_user', 'user_id'),  # 사용자별 북마크 목록 조회를 위한 인덱스
+        Index('idx_bookmark_user_created', 'user_id', 'created_at'),  # 사용자별 북마크 목록 조회(최신순)를 위한 인덱스
         Index('idx_bookmark_feed', 'feed_id'),  # 피드별 북마크 수 집계를 위한 인덱스
     )
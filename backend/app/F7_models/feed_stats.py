@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.F8_database.connection import Base
+
+class FeedStats(Base):
+    # 새 테이블이므로 별도 마이그레이션 없이 서버 시작 시 Base.metadata.create_all로 생성되고,
+    # 기존 피드의 통계 행은 시작 시 backfill_feed_stats_task가 원본 테이블에서 채움
+    __tablename__ = 'feed_stats'
+
+    # Primary Key - 통계 대상 피드 ID (피드당 1행, 외래키)
+    feed_id = Column(Integer, ForeignKey('feeds.id', ondelete='CASCADE'), primary_key=True)
+
+    # 별점 합계 (평균 = rating_sum / rating_count)
+    rating_sum = Column(Integer, default=0, server_default='0', nullable=False)
+
+    # 별점 개수
+    rating_count = Column(Integer, default=0, server_default='0', nullable=False)
+
+    # 북마크 수
+    bookmark_count = Column(Integer, default=0, server_default='0', nullable=False)
+
+    # 조회수 (feeds.view_count와 같은 트랜잭션에서 함께 증가)
+    view_count = Column(Integer, default=0, server_default='0', nullable=False)
+
+    # 통계 최종 갱신 일시
+    updated_at = Column(DateTime, nullable=False, default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+    # 관계 설정
+    feed = relationship("Feed", back_populates="stats")  # 통계 대상 피드 정보
+
+    # 인덱스 설정
+    __table_args__ = (
+        Index('idx_feed_stats_view_count', 'view_count'),          # 조회수 상위 피드 조회를 위한 인덱스
+        Index('idx_feed_stats_bookmark_count', 'bookmark_count'),  # 북마크 상위 피드 조회를 위한 인덱스
+        Index('idx_feed_stats_updated_at', 'updated_at'),          # 조건부 요청(ETag) 버전 계산(MAX)을 위한 인덱스
+    )
@@ -67,11 +67,15 @@ class Feed(Base):
     category = relationship("Category", back_populates="feeds")  # 소속 카테고리 정보
     bookmarks = relationship("Bookmark", back_populates="feed", cascade="all, delete-orphan")  # 피드의 북마크 목록
     ratings = relationship("Rating", back_populates="feed", cascade="all, delete-orphan")  # 피드의 평점 목록
+    stats = relationship("FeedStats", back_populates="feed", uselist=False, cascade="all, delete-orphan")  # 피드의 집계 통계 (별점/북마크/조회수)
 
-    # 인덱스 설정
+    # 인덱스 설정 (기존 DB 변경: F8_database/migrations/0002_feed_rating_bookmark_indexes.sql)
     __table_args__ = (
         Index('idx_feed_organization', 'organization_id'),    # 기관별 피드 검색을 위한 인덱스
         Index('idx_feed_category', 'category_id'),           # 카테고리별 피드 검색을 위한 인덱스
         Index('idx_feed_created_at', 'created_at'),          # 등록일순 정렬을 위한 인덱스
         Index('idx_feed_published_date', 'published_date'),  # 발행일순 정렬을 위한 인덱스
+        Index('idx_feed_active_published_id', 'is_active', 'published_date', 'id'),  # 메인 피드 목록 LIMIT/키셋 페이지네이션을 위한 인덱스
+        Index('idx_feed_org_active_published_id', 'organization_id', 'is_active', 'published_date', 'id'),  # 기관별 피드 목록 페이지네이션을 위한 인덱스
+        Index('idx_feed_category_active_published_id', 'category_id', 'is_active', 'published_date', 'id'),  # 보도자료/정책뉴스 목록 키셋 페이지네이션을 위한 인덱스
     )
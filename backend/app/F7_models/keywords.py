@@ -20,6 +20,9 @@ class Keyword(Base):
     
     # 출현 횟수 (빈도)
     frequency = Column(Integer, default=1, nullable=False)
+
+    # 집계 기간 키 (지식 그래프 파이프라인 실행일, 예: '2025-10-18')
+    period = Column(String(10), nullable=False)
     
     # 최초 생성일
     created_at = Column(DateTime, nullable=False, default=func.current_timestamp())
@@ -30,8 +33,9 @@ class Keyword(Base):
     # 관계 설정
     organization = relationship("Organization", back_populates="keywords")
     
-    # 인덱스 및 제약조건
+    # 인덱스 및 제약조건 (기존 DB 변경: F8_database/migrations/0001_keyword_word_cloud_period.sql)
     __table_args__ = (
         Index('idx_keyword_org_text', 'organization_id', 'keyword_text'),
-        UniqueConstraint('organization_id', 'keyword_text', name='uq_org_keyword'),
+        Index('idx_keyword_period_org_score', 'period', 'organization_id', 'total_score'),  # 기간별/기관별 인기 키워드 조회용
+        UniqueConstraint('organization_id', 'keyword_text', 'period', name='uq_org_keyword_period'),
     )
\ No newline at end of file
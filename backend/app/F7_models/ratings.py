@@ -29,8 +29,10 @@ class Rating(Base):
     feed = relationship("Feed", back_populates="ratings")  # 평점이 매겨진 피드 정보
     rating_history = relationship("RatingHistory", back_populates="rating", cascade="all, delete-orphan")  # 평점 변경 이력
 
-    # 제약조건 및 인덱스 설정
+    # 제약조건 및 인덱스 설정 (기존 DB 변경: F8_database/migrations/0002_feed_rating_bookmark_indexes.sql)
     __table_args__ = (
         UniqueConstraint('user_id', 'feed_id', name='uq_user_feed_rating'),  # 사용자별 피드 중복 평점 방지
         Index('idx_rating_user_feed', 'user_id', 'feed_id'),  # 사용자-피드 조합 검색을 위한 복합 인덱스
+        Index('idx_rating_user_created', 'user_id', 'created_at'),  # 마이페이지 별점 목록(최신순)/추천 시드 조회를 위한 인덱스
+        Index('idx_rating_feed_score', 'feed_id', 'score'),  # 피드별 별점 합계/개수 집계(feed_stats 재계산)를 인덱스만으로 처리하기 위한 인덱스
     )
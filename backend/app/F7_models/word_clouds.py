@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, String, Float
+from sqlalchemy import Column, Integer, ForeignKey, String, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.F8_database.connection import Base
@@ -7,9 +7,19 @@ class WordCloud(Base):
     __tablename__ = 'word_clouds'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    organization_id = Column(Integer, ForeignKey('organizations.id'), nullable=False)
+    # 기관 ID (NULL이면 전체 기관을 대상으로 한 전역 워드클라우드)
+    organization_id = Column(Integer, ForeignKey('organizations.id'), nullable=True)
     
     keyword = Column(String(100), nullable=False)   # 키워드 텍스트
     score = Column(Float, nullable=False, default=0.0) # 중요도 점수
 
-    organization = relationship("Organization", back_populates="word_cloud")
\ No newline at end of file
+    # 집계 기간 키 (지식 그래프 파이프라인 실행일, 예: '2025-10-18')
+    period = Column(String(10), nullable=False)
+
+    organization = relationship("Organization", back_populates="word_cloud")
+
+    # 인덱스 설정 (기존 DB 변경: F8_database/migrations/0001_keyword_word_cloud_period.sql)
+    __table_args__ = (
+        Index('idx_word_cloud_period', 'period'),                                     # 최신 기간 조회용
+        Index('idx_word_cloud_org_period_score', 'organization_id', 'period', 'score'),  # 기관별 상위 키워드 조회용
+    )
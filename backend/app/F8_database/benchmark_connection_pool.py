@@ -0,0 +1,148 @@
+"""
+커넥션 풀 부하 벤치마크 (NullPool vs AsyncAdaptedQueuePool).
+
+/feeds/latest 가 실행하는 조회(FeedService.get_latest_feeds_for_main)를 요청마다 새 세션으로
+동시에 반복 실행하여, 풀 모드별 처리량과 지연 시간 분포를 비교함.
+(응답 캐시를 거치지 않은, 캐시 미스 시의 DB 경로를 측정함)
+
+연결 비용이 드러나야 의미가 있으므로 운영과 같은 MySQL의 비어 있는 벤치마크 전용 스키마를 지정함.
+(테이블을 생성하고 합성 데이터를 채운 뒤, 끝나면 삭제함)
+
+사용법 (backend 디렉토리에서 실행):
+    PYTHONPATH=. python app/F8_database/benchmark_connection_pool.py \
+        --database-url mysql+aiomysql://user:pw@localhost:3306/bench --concurrency 50 --requests 2000
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.F2_services.feed import FeedService
+from app.F3_repositories.benchmark_feed_pagination import _TABLES, populate
+from app.F3_repositories.feed import FeedRepository
+from app.F8_database.connection import Base, POOL_MODE_NULL, POOL_MODE_QUEUE, build_engine_options
+
+logger = logging.getLogger(__name__)
+
+# /feeds/latest 기본 요청 개수
+LATEST_FEED_LIMIT = 10
+
+
+async def _prepare_database(database_url: str, num_feeds: int, seed: int):
+    """벤치마크용 테이블을 만들고 합성 데이터를 채움."""
+    setup_engine = create_async_engine(database_url, poolclass=NullPool)
+    session_factory = sessionmaker(bind=setup_engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with setup_engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: Base.metadata.drop_all(sync_conn, tables=_TABLES))
+            await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=_TABLES))
+        async with session_factory() as session:
+            await populate(session, num_feeds, seed=seed)
+    finally:
+        await setup_engine.dispose()
+
+
+async def _drop_tables(database_url: str):
+    cleanup_engine = create_async_engine(database_url, poolclass=NullPool)
+    try:
+        async with cleanup_engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: Base.metadata.drop_all(sync_conn, tables=_TABLES))
+    finally:
+        await cleanup_engine.dispose()
+
+
+async def run_load(database_url: str, pool_mode: str, concurrency: int, total_requests: int) -> Dict[str, float]:
+    """
+    한 풀 모드로 total_requests개의 요청을 concurrency개씩 동시에 실행하고 결과를 집계함.
+    반환: 처리량(req/s), 지연 시간 p50/p95/p99/max(ms), 실패 수
+    """
+    engine = create_async_engine(database_url, **build_engine_options(pool_mode))
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    latencies: List[float] = []
+    failures = 0
+    remaining = total_requests
+
+    async def one_request():
+        # 운영의 get_db 의존성처럼 요청마다 세션을 새로 열고 닫음
+        async with session_factory() as session:
+            return await FeedService(FeedRepository(session)).get_latest_feeds_for_main(LATEST_FEED_LIMIT)
+
+    async def worker():
+        nonlocal remaining, failures
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                result = await one_request()
+                if not getattr(result, "success", False):
+                    failures += 1
+            except Exception as e:
+                failures += 1
+                logger.warning(f"Request failed ({pool_mode}): {e}")
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    try:
+        # 워밍업: 풀 모드에서 연결을 미리 채워 두어 측정 구간에 최초 연결 비용이 섞이지 않게 함
+        await asyncio.gather(*(one_request() for _ in range(min(concurrency, 10))))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await engine.dispose()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50": quantiles[49],
+        "p95": quantiles[94],
+        "p99": quantiles[98],
+        "max": max(latencies),
+        "failures": failures,
+    }
+
+
+def _format_report(results: Dict[str, Dict[str, float]], concurrency: int, total_requests: int) -> str:
+    lines = [
+        f"=== /feeds/latest DB path: {total_requests} requests, concurrency {concurrency} ===",
+        f"{'pool':<8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'failed':>8}",
+    ]
+    for mode, r in results.items():
+        lines.append(
+            f"{mode:<8}{r['throughput']:>10.1f}{r['p50']:>10.2f}{r['p95']:>10.2f}{r['p99']:>10.2f}{r['max']:>10.2f}{r['failures']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="커넥션 풀 부하 벤치마크 (NullPool vs AsyncAdaptedQueuePool)")
+    parser.add_argument("--database-url", required=True, help="비어 있는 벤치마크 전용 스키마 (예: mysql+aiomysql://...)")
+    parser.add_argument("--feeds", type=int, default=10_000, help="합성 피드 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시에 실행할 요청 수")
+    parser.add_argument("--requests", type=int, default=2_000, help="풀 모드별 전체 요청 수")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+async def main():
+    args = _parse_args()
+    await _prepare_database(args.database_url, args.feeds, args.seed)
+    try:
+        results = {}
+        for mode in (POOL_MODE_NULL, POOL_MODE_QUEUE):
+            logger.info(f"Running load with pool mode '{mode}'...")
+            results[mode] = await run_load(args.database_url, mode, args.concurrency, args.requests)
+    finally:
+        await _drop_tables(args.database_url)
+    print(_format_report(results, args.concurrency, args.requests))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
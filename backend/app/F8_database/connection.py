@@ -1,22 +1,74 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import NullPool
 from contextlib import asynccontextmanager 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Dict, Any
 
 from app.F5_core.config import settings
+from app.F8_database.pool_metrics import InstrumentedAsyncQueuePool, register_pool_metrics
+from app.F8_database.query_metrics import register_query_listeners
+
+# 지원하는 커넥션 풀 모드
+POOL_MODE_QUEUE = "queue"   # 연결을 풀에 보관하고 재사용 (기본)
+POOL_MODE_NULL = "null"     # 세션마다 새 연결을 열고 닫음 (이전 동작)
+
+
+def build_engine_options(pool_mode: str = settings.DB_POOL_MODE) -> Dict[str, Any]:
+    """
+    커넥션 풀 모드에 맞는 create_async_engine 옵션을 만듦.
+    - queue: 연결을 재사용하여 요청마다 TCP 연결/인증을 반복하지 않음 (크기/대기/재연결 주기는 설정값 사용)
+    - null: 세션마다 새 연결 (연결을 프로세스 간에 공유하면 안 되는 일회성 스크립트 등에서 사용)
+    """
+    if pool_mode == POOL_MODE_NULL:
+        return {"poolclass": NullPool}
+    if pool_mode == POOL_MODE_QUEUE:
+        return {
+            "poolclass": InstrumentedAsyncQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        }
+    raise ValueError(f"Unsupported DB_POOL_MODE: {pool_mode} (expected '{POOL_MODE_QUEUE}' or '{POOL_MODE_NULL}')")
+
+
+def create_database_engine(
+    url: str,
+    pool_mode: str = settings.DB_POOL_MODE,
+    metrics_role: str = "primary",
+    **options: Any,
+) -> AsyncEngine:
+    """설정된 풀 모드로 비동기 엔진을 만들고, 풀 메트릭(metrics_role 라벨)과 요청별 SQL 계측 이벤트를 등록함."""
+    created = create_async_engine(url, **build_engine_options(pool_mode), **options)
+    register_pool_metrics(created, metrics_role)
+    register_query_listeners(created)
+    return created
+
+
+def _connect_args(url: str) -> Dict[str, Any]:
+    """MySQL 연결에만 utf8mb4 문자셋을 지정함 (로컬 검증용 SQLite 등 다른 드라이버는 charset 인자를 받지 않음)"""
+    return {"charset": "utf8mb4"} if url.startswith("mysql") else {}
 
 
 # ============================================================
 # 비동기 SQLAlchemy 엔진 생성 (UTF-8 설정 강화)
 # ============================================================
-engine = create_async_engine(
-    settings.DATABASE_URL, 
-    echo=True, 
-    poolclass=NullPool,
-    connect_args={"charset": "utf8mb4"} 
+# SQL 로그(echo)는 동기적으로 출력되어 요청마다 비용이 들므로 DB_ECHO로 켤 때만 사용
+engine = create_database_engine(
+    settings.DATABASE_URL,
+    echo=settings.DB_ECHO,
+    connect_args=_connect_args(settings.DATABASE_URL)
     )
 
+# 읽기 전용 복제본 엔진 (DB_REPLICA_URL이 없으면 None이며, 읽기 세션도 주 DB를 사용함)
+replica_engine = create_database_engine(
+    settings.DB_REPLICA_URL,
+    metrics_role="replica",
+    echo=settings.DB_ECHO,
+    connect_args=_connect_args(settings.DB_REPLICA_URL)
+    ) if settings.DB_REPLICA_URL else None
+
 # ============================================================
 # 비동기 세션 팩토리
 # ============================================================
@@ -28,6 +80,15 @@ AsyncSessionLocal = sessionmaker(
     class_=AsyncSession,
 )
 
+# 복제본 세션 팩토리 (읽기 라우팅은 F8_database/read_replica.py의 ReadReplicaRouter가 담당)
+ReplicaSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=replica_engine,
+    class_=AsyncSession,
+) if replica_engine is not None else None
+
 # ============================================================
 # Base 클래스 정의
 # ============================================================
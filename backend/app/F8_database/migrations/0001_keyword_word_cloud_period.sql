@@ -0,0 +1,41 @@
+-- =========================================================
+-- keywords / word_clouds 집계 기간(period) 도입 (MySQL)
+-- =========================================================
+-- Base.metadata.create_all은 이미 있는 테이블을 변경하지 않으므로, 기존 DB에는 배포 전에 한 번 실행해야 함.
+-- (신규 DB는 create_all이 모델 정의대로 만들므로 실행하지 않음)
+--
+-- 변경 내용
+--   word_clouds: period 컬럼 추가, organization_id NULL 허용(전역 워드클라우드), 기간/기관별 조회 인덱스 추가
+--   keywords:    period 컬럼 추가, 유니크 키를 (organization_id, keyword_text, period)로 변경, 기간별 조회 인덱스 추가
+--
+-- 기존 행은 실행일을 기간 키로 채워, 다음 지식 그래프 파이프라인 실행 전까지 그대로 조회되게 함.
+-- 이후 파이프라인이 새 기간을 적재하고, 보존 기간이 지나면 delete_old_periods가 정리함.
+
+-- ---------------------------------------------------------
+-- word_clouds
+-- ---------------------------------------------------------
+ALTER TABLE word_clouds
+    MODIFY COLUMN organization_id INT NULL,
+    ADD COLUMN period VARCHAR(10) NOT NULL DEFAULT '';
+
+UPDATE word_clouds SET period = DATE_FORMAT(CURDATE(), '%Y-%m-%d') WHERE period = '';
+
+ALTER TABLE word_clouds
+    ALTER COLUMN period DROP DEFAULT,
+    ADD INDEX idx_word_cloud_period (period),
+    ADD INDEX idx_word_cloud_org_period_score (organization_id, period, score);
+
+-- ---------------------------------------------------------
+-- keywords
+-- ---------------------------------------------------------
+ALTER TABLE keywords
+    ADD COLUMN period VARCHAR(10) NOT NULL DEFAULT '';
+
+UPDATE keywords SET period = DATE_FORMAT(CURDATE(), '%Y-%m-%d') WHERE period = '';
+
+-- organization_id 외래키는 idx_keyword_org_text 인덱스를 사용하므로 기존 유니크 키를 먼저 지워도 됨
+ALTER TABLE keywords
+    ALTER COLUMN period DROP DEFAULT,
+    DROP INDEX uq_org_keyword,
+    ADD CONSTRAINT uq_org_keyword_period UNIQUE (organization_id, keyword_text, period),
+    ADD INDEX idx_keyword_period_org_score (period, organization_id, total_score);
@@ -0,0 +1,35 @@
+-- =========================================================
+-- 피드 목록 페이지네이션 / 별점·북마크 조회용 복합 인덱스 (MySQL)
+-- =========================================================
+-- Base.metadata.create_all은 이미 있는 테이블에 인덱스를 추가하지 않으므로, 기존 DB에는 배포 전에 한 번 실행해야 함.
+-- (신규 DB는 create_all이 모델 정의대로 만들므로 실행하지 않음. feed_stats는 새 테이블이라 create_all로 생성됨)
+-- 적용 후 app/F3_repositories/explain_hot_queries.py로 실행 계획 회귀 검사를 할 수 있음.
+--
+-- InnoDB는 ALGORITHM=INPLACE, LOCK=NONE으로 인덱스를 만드는 동안에도 읽기/쓰기를 막지 않음.
+
+-- ---------------------------------------------------------
+-- feeds: 메인/기관별/카테고리별 목록의 LIMIT·키셋 페이지네이션 (published_date DESC, id DESC)
+-- ---------------------------------------------------------
+ALTER TABLE feeds
+    ADD INDEX idx_feed_active_published_id (is_active, published_date, id),
+    ADD INDEX idx_feed_org_active_published_id (organization_id, is_active, published_date, id),
+    ADD INDEX idx_feed_category_active_published_id (category_id, is_active, published_date, id),
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+-- ---------------------------------------------------------
+-- ratings: 마이페이지 별점 목록(최신순)/추천 시드, 피드별 별점 집계(feed_stats 재계산)
+-- ---------------------------------------------------------
+ALTER TABLE ratings
+    ADD INDEX idx_rating_user_created (user_id, created_at),
+    ADD INDEX idx_rating_feed_score (feed_id, score),
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+-- ---------------------------------------------------------
+-- bookmarks: 사용자별 북마크 목록(최신순)
+-- user_id 단일 인덱스는 새 복합 인덱스가 앞부분으로 대신하므로 삭제함
+-- (user_id 외래키는 새 인덱스를 사용하므로, 같은 문에서 추가와 삭제를 함께 수행함)
+-- ---------------------------------------------------------
+ALTER TABLE bookmarks
+    ADD INDEX idx_bookmark_user_created (user_id, created_at),
+    DROP INDEX idx_bookmark_user,
+    ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,70 @@
+import time
+
+from prometheus_client import Gauge, Histogram
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 메트릭 정의
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured number of persistent connections in the database pool",
+    ["role"],
+)
+
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Database connections currently checked out of the pool",
+    ["role"],
+)
+
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Database connections opened beyond pool_size (negative while the pool is not yet full)",
+    ["role"],
+)
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent acquiring a database connection from the pool, including opening a new one",
+    ["role"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    연결을 빌리는 데 걸린 시간을 기록하는 AsyncAdaptedQueuePool.
+    - 풀이 비어 있어 기다린 시간과, 여유(overflow)가 있어 새 연결을 연 시간이 모두 포함됨
+    - 이 값이 커지면 pool_size / max_overflow가 동시 요청 수에 비해 작다는 뜻
+    """
+    # 메트릭 role 라벨 (주 DB: primary, 읽기 복제본: replica)
+    metrics_role = "primary"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT.labels(role=self.metrics_role).observe(time.perf_counter() - started)
+
+    def recreate(self):
+        # engine.dispose()가 풀을 새로 만들 때도 라벨을 유지함
+        pool = super().recreate()
+        pool.metrics_role = self.metrics_role
+        return pool
+
+
+def register_pool_metrics(engine: AsyncEngine, role: str = "primary") -> None:
+    """
+    엔진의 풀 상태를 role 라벨을 붙인 Prometheus 게이지로 노출함.
+    스크레이프 시점에 engine의 현재 풀에서 읽으므로 dispose()로 풀이 교체되어도 새 풀의 값을 보여줌.
+    NullPool처럼 연결을 보관하지 않는 풀은 노출할 값이 없으므로 건너뜀.
+    """
+    sync_engine = engine.sync_engine
+    if not isinstance(sync_engine.pool, QueuePool):
+        return
+    if isinstance(sync_engine.pool, InstrumentedAsyncQueuePool):
+        sync_engine.pool.metrics_role = role
+    POOL_SIZE.labels(role=role).set_function(lambda: sync_engine.pool.size())
+    POOL_CHECKED_OUT.labels(role=role).set_function(lambda: sync_engine.pool.checkedout())
+    POOL_OVERFLOW.labels(role=role).set_function(lambda: sync_engine.pool.overflow())
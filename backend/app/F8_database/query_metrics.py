@@ -0,0 +1,172 @@
+import logging
+import re
+import time
+from collections import Counter as ShapeCounter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.F5_core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 메트릭 정의 (endpoint는 라우트 템플릿, 예: /api/v1/feeds/{name})
+REQUEST_QUERY_COUNT = Histogram(
+    "db_queries_per_request",
+    "Number of SQL statements executed while handling a request",
+    ["endpoint"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144),
+)
+
+REQUEST_QUERY_TIME = Histogram(
+    "db_query_seconds_per_request",
+    "Total time spent executing SQL statements while handling a request",
+    ["endpoint"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+REQUEST_SLOWEST_QUERY = Histogram(
+    "db_slowest_query_seconds_per_request",
+    "Duration of the slowest SQL statement executed while handling a request",
+    ["endpoint"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+REPEATED_QUERY_REQUESTS = Counter(
+    "db_repeated_query_requests_total",
+    "Requests in which one statement shape was executed at least the repeated-query threshold (likely N+1)",
+    ["endpoint"],
+)
+
+# 로그에 남기는 SQL의 최대 길이
+STATEMENT_LOG_LIMIT = 500
+
+# 같은 모양(shape)으로 묶기 위한 정규화 패턴: 확장된 IN 목록, 문자열/숫자 리터럴
+_IN_LIST = re.compile(r"\(\s*(?:%s|\?|:\w+)(?:\s*,\s*(?:%s|\?|:\w+))*\s*\)")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """
+    파라미터 값과 IN 목록 길이만 다른 SQL을 같은 문자열로 정규화함.
+    (예: WHERE feed_id IN (%s, %s, %s) 와 WHERE feed_id IN (%s) -> WHERE feed_id IN (?))
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class RequestQueryStats:
+    """
+    한 요청(또는 track_queries 구간) 동안 실행된 SQL 통계.
+    - count / total_seconds: 실행한 문장 수와 DB 시간 합계
+    - slowest_seconds / slowest_statement: 가장 오래 걸린 문장
+    - shapes: 문장 모양별 실행 횟수 (같은 모양이 반복되면 N+1 의심)
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.shapes: ShapeCounter = ShapeCounter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        if elapsed >= self.slowest_seconds:
+            self.slowest_seconds = elapsed
+            self.slowest_statement = statement
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold: int = settings.SQL_REPEATED_QUERY_THRESHOLD) -> List[Tuple[str, int]]:
+        """threshold번 이상 실행된 문장 모양과 횟수를 많은 순으로 반환함"""
+        return [(shape, times) for shape, times in self.shapes.most_common() if times >= threshold]
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[RequestQueryStats]:
+    """
+    이 구간에서 실행되는 SQL을 집계하는 컨텍스트 매니저.
+    요청 미들웨어에서 요청마다 사용하며, 스크립트/검증 코드에서도 쿼리 수를 확인하는 데 쓸 수 있음.
+
+    사용 예:
+        with track_queries() as stats:
+            await feed_service.get_feeds_list(...)
+        assert_no_repeated_queries(stats)
+    """
+    stats = RequestQueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def assert_no_repeated_queries(stats: RequestQueryStats, threshold: int = settings.SQL_REPEATED_QUERY_THRESHOLD) -> None:
+    """같은 모양의 문장이 threshold번 이상 실행되었으면 AssertionError를 발생시킴 (N+1 회귀 검증용)"""
+    repeated = stats.repeated_shapes(threshold)
+    if repeated:
+        details = "; ".join(f"{times}x {shape[:STATEMENT_LOG_LIMIT]}" for shape, times in repeated)
+        raise AssertionError(f"Repeated SQL statements (possible N+1): {details}")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    started_stack = conn.info.get("query_started_at")
+    if stats is None or not started_stack:
+        return
+    stats.record(statement, time.perf_counter() - started_stack.pop())
+
+
+def _handle_error(exception_context):
+    # 실패한 문장의 시작 시각이 스택에 남지 않도록 정리함
+    connection = exception_context.connection
+    started_stack = connection.info.get("query_started_at") if connection is not None else None
+    if started_stack:
+        started_stack.pop()
+
+
+def register_query_listeners(engine: AsyncEngine) -> None:
+    """엔진에 SQL 실행 시간 측정 이벤트를 등록함. (track_queries 구간 밖에서는 아무것도 하지 않음)"""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def observe_request_queries(endpoint: str, stats: RequestQueryStats) -> None:
+    """
+    요청의 SQL 통계를 라우트 템플릿별 히스토그램에 기록하고,
+    느린 문장과 반복 실행된 문장(N+1 의심)은 경고 로그로 남김
+    """
+    REQUEST_QUERY_COUNT.labels(endpoint=endpoint).observe(stats.count)
+    REQUEST_QUERY_TIME.labels(endpoint=endpoint).observe(stats.total_seconds)
+    REQUEST_SLOWEST_QUERY.labels(endpoint=endpoint).observe(stats.slowest_seconds)
+
+    if stats.slowest_statement is not None and stats.slowest_seconds >= settings.SQL_SLOW_QUERY_SECONDS:
+        logger.warning(
+            f"Slow SQL in {endpoint}: {stats.slowest_seconds * 1000:.1f}ms "
+            f"{stats.slowest_statement[:STATEMENT_LOG_LIMIT]}"
+        )
+
+    repeated = stats.repeated_shapes()
+    if repeated:
+        REPEATED_QUERY_REQUESTS.labels(endpoint=endpoint).inc()
+        for shape, times in repeated:
+            logger.warning(f"Possible N+1 in {endpoint}: statement executed {times} times: {shape[:STATEMENT_LOG_LIMIT]}")
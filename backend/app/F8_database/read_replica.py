@@ -0,0 +1,146 @@
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.F5_core.config import settings
+from app.F5_core.redis import client_redis
+from app.F8_database.connection import AsyncSessionLocal, ReplicaSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 사용자별 최근 쓰기 표시 키 (TTL = read-your-writes 기간)
+RECENT_WRITE_KEY_PREFIX = "db_recent_write"
+# session.info 키: 이 세션에서 쓰기가 있었는지 / 읽기 전용 세션인지
+SESSION_HAS_WRITES = "has_writes"
+SESSION_READ_ONLY = "read_only"
+
+
+def _is_write_statement(orm_execute_state) -> bool:
+    """session.execute()로 직접 실행한 INSERT/UPDATE/DELETE(텍스트 SQL 포함)인지 확인함"""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        return True
+    sql_text = getattr(orm_execute_state.statement, "text", None)
+    if sql_text is None:
+        return False
+    words = sql_text.lstrip().split(None, 1)
+    return bool(words) and words[0].upper() not in ("SELECT", "WITH", "SHOW", "EXPLAIN", "DESCRIBE")
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement_writes(orm_execute_state):
+    if not _is_write_statement(orm_execute_state):
+        return
+    session = orm_execute_state.session
+    if session.info.get(SESSION_READ_ONLY):
+        raise InvalidRequestError("Write statement executed on a read-only (replica routed) session")
+    session.info[SESSION_HAS_WRITES] = True
+
+
+@event.listens_for(Session, "before_flush")
+def _track_flush_writes(session, flush_context, instances):
+    if not (session.new or session.dirty or session.deleted):
+        return
+    if session.info.get(SESSION_READ_ONLY):
+        raise InvalidRequestError("Flush attempted on a read-only (replica routed) session")
+    session.info[SESSION_HAS_WRITES] = True
+
+
+def session_has_writes(session: AsyncSession) -> bool:
+    """세션에서 flush 또는 DML 실행이 있었는지 반환함 (커밋 후 read-your-writes 표시 여부 판단용)"""
+    return bool(session.info.get(SESSION_HAS_WRITES))
+
+
+class ReadReplicaRouter:
+    """
+    읽기 전용 작업 단위를 복제본(replica) 엔진으로 보내는 세션 팩토리.
+    - 복제본이 설정되지 않았거나, 최근 연결에 실패했으면(retry_seconds 동안) 주 DB 세션을 반환함
+    - 사용자가 쓰기를 커밋하면 Redis에 표시를 남기고, read_your_writes_seconds 동안 그 사용자의 읽기는 주 DB로 보냄
+      (복제 지연 때문에 방금 남긴 별점/북마크가 목록에 보이지 않는 문제 방지, Redis 장애 시에도 주 DB 사용)
+    - 읽기 세션은 session.info[read_only]로 표시되어 flush/DML을 시도하면 예외가 발생함
+
+    세션 팩토리를 주입받으므로 두 개의 로컬 DB URL(또는 SQLite 파일 두 개)로 만든 sessionmaker를 넘겨 라우팅을 검증할 수 있음.
+    """
+
+    def __init__(
+        self,
+        primary_factory: sessionmaker,
+        replica_factory: Optional[sessionmaker] = None,
+        redis: Redis = client_redis,
+        read_your_writes_seconds: int = settings.DB_READ_YOUR_WRITES_SECONDS,
+        retry_seconds: int = settings.DB_REPLICA_RETRY_SECONDS,
+    ):
+        self.primary_factory = primary_factory
+        self.replica_factory = replica_factory
+        self.redis = redis
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.retry_seconds = retry_seconds
+        self._replica_unavailable_until = 0.0
+
+    def _recent_write_key(self, user_id: str) -> str:
+        return f"{RECENT_WRITE_KEY_PREFIX}:{user_id}"
+
+    # 사용자 쓰기 표시 메서드
+    # 입력: user_id - 쓰기를 커밋한 사용자 ID
+    # 설명: Redis 장애 시 경고만 남김 (이 경우 복제 지연 동안 이전 값이 보일 수 있음)
+    async def mark_user_write(self, user_id: str) -> None:
+        try:
+            await self.redis.set(self._recent_write_key(user_id), 1, ex=self.read_your_writes_seconds)
+        except RedisError as e:
+            logger.warning(f"Failed to mark recent write for user {user_id}: {e}")
+
+    async def _has_recent_write(self, user_id: Optional[str]) -> bool:
+        if user_id is None:
+            return False
+        try:
+            return bool(await self.redis.exists(self._recent_write_key(user_id)))
+        except RedisError as e:
+            # 최근 쓰기 여부를 알 수 없으면 주 DB에서 읽음
+            logger.warning(f"Failed to check recent write for user {user_id}, reading from primary: {e}")
+            return True
+
+    def _replica_available(self) -> bool:
+        return self.replica_factory is not None and time.monotonic() >= self._replica_unavailable_until
+
+    async def _open_replica_session(self) -> Optional[AsyncSession]:
+        """복제본 세션을 열고 연결을 미리 확보함. 연결에 실패하면 retry_seconds 동안 복제본을 쓰지 않고 None을 반환함"""
+        session = self.replica_factory()
+        try:
+            await session.connection()
+        except (SQLAlchemyError, OSError) as e:
+            await session.close()
+            self._replica_unavailable_until = time.monotonic() + self.retry_seconds
+            logger.warning(f"Read replica unavailable, falling back to primary for {self.retry_seconds}s: {e}")
+            return None
+        return session
+
+    # 읽기 세션 생성 메서드
+    # 입력: user_id - 요청 사용자 ID (비로그인/배치 작업은 None)
+    # 반환: 복제본 또는 주 DB의 읽기 전용 세션 (호출자가 닫아야 함)
+    async def open_read_session(self, user_id: Optional[str] = None) -> AsyncSession:
+        session = None
+        if self._replica_available() and not await self._has_recent_write(user_id):
+            session = await self._open_replica_session()
+        if session is None:
+            session = self.primary_factory()
+        session.info[SESSION_READ_ONLY] = True
+        return session
+
+    @asynccontextmanager
+    async def read_session(self, user_id: Optional[str] = None) -> AsyncGenerator[AsyncSession, None]:
+        """읽기 전용 세션 컨텍스트 매니저 (커밋하지 않고, 닫을 때 트랜잭션을 롤백함)"""
+        session = await self.open_read_session(user_id)
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+read_replica_router = ReadReplicaRouter(AsyncSessionLocal, ReplicaSessionLocal)
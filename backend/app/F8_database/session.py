@@ -1,11 +1,35 @@
+from app.F5_core.security import auth_handler
 from app.F8_database.connection import AsyncSessionLocal
+from app.F8_database.read_replica import read_replica_router, session_has_writes
 from contextlib import asynccontextmanager
+from fastapi import Request
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# read-your-writes 판단용 요청 사용자 ID 조회
+# JWT 미들웨어가 검증한 사용자(request.state.user_id)를 우선 사용하고,
+# 인증 예외 경로(/api/v1/feeds/*, /api/v1/organizations/* 등)처럼 미들웨어가 토큰을 읽지 않은 요청은
+# Authorization 헤더의 토큰 서명/만료만 검증하여 sub를 사용함 (세션 라우팅에만 쓰므로 폐기 여부는 확인하지 않음)
+def resolve_request_user_id(request: Optional[Request]) -> Optional[str]:
+    if request is None:
+        return None
+    user_id = getattr(request.state, "user_id", None)
+    if user_id is not None:
+        return user_id
+    auth_header = request.headers.get("Authorization")
+    if not auth_header:
+        return None
+    scheme, _, token = auth_header.partition(" ")
+    if scheme.lower() != "bearer" or not token.strip():
+        return None
+    payload = auth_handler.decode_access_token(token.strip())
+    return payload.get("sub") if payload else None
+
 # 데이터베이스 세션 생성(FastAPI 의존성 주입)
-async def get_db():
+# 로그인 사용자의 요청이 쓰기를 커밋하면, 잠시 동안 그 사용자의 읽기(get_read_db)를 주 DB로 보내도록 표시함
+async def get_db(request: Request = None):
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -14,10 +38,25 @@ async def get_db():
             await session.rollback()
             logger.error(f"DB 세션 오류: {e}")
             raise
+        user_id = resolve_request_user_id(request) if session_has_writes(session) else None
+        if user_id is not None:
+            await read_replica_router.mark_user_write(user_id)
 # yield session은 세션을 요청 핸들러에게 제공
 # session을 yield 하는 순간 FastAPI는 이를 의존성으로 주입
 # yield 이후의 코드는 요청 핸들러의 실행이 끝난 후 실행
 
+# 읽기 전용 데이터베이스 세션 생성(FastAPI 의존성 주입)
+# 복제본이 설정되어 있으면 복제본 세션을, 아니면(또는 장애/최근 쓰기 시) 주 DB 세션을 제공하며 커밋하지 않음
+async def get_read_db(request: Request):
+    async with read_replica_router.read_session(resolve_request_user_id(request)) as session:
+        yield session
+
+@asynccontextmanager
+async def read_session_scope():
+    """의존성 주입과 별개로 읽기 전용 세션을 생성하는 컨텍스트 매니저 (배치/ETL 추출용)"""
+    async with read_replica_router.read_session() as session:
+        yield session
+
 @asynccontextmanager
 async def get_standalone_session():
     """의존성 주입과 별개로 독립적인 DB 세션을 생성하는 컨텍스트 매니저"""
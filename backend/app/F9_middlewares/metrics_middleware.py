@@ -3,6 +3,8 @@ from starlette.responses import Response
 from fastapi import FastAPI
 import time
 
+from app.F8_database.query_metrics import observe_request_queries, track_queries
+
 
 # 메트릭 정의
 REQUEST_COUNT = Counter(
@@ -21,7 +23,9 @@ def register_metrics(app: FastAPI):
     @app.middleware("http")
     async def prometheus_middleware(request, call_next):
         start_time = time.time()
-        response = await call_next(request)
+        # 요청 처리 중 실행된 SQL 문장 수/시간을 집계함 (하위 태스크에서도 같은 통계 객체를 사용)
+        with track_queries() as query_stats:
+            response = await call_next(request)
         process_time = time.time() - start_time
 
         # 엔드포인트 이름 (예: /api/v1/users)
@@ -33,6 +37,11 @@ def register_metrics(app: FastAPI):
         REQUEST_COUNT.labels(method=method, endpoint=endpoint, http_status=status_code).inc()
         # 응답 시간 기록
         REQUEST_LATENCY.labels(endpoint=endpoint).observe(process_time)
+        # SQL 통계는 라우트 템플릿별로 기록 (라우트가 없는 404 등은 제외)
+        route = request.scope.get("route")
+        route_template = getattr(route, "path_format", None)
+        if route_template is not None:
+            observe_request_queries(route_template, query_stats)
 
         return response
 